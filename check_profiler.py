@@ -0,0 +1,270 @@
+"""Modules to profile the model checks and fixes and export the measurements."""
+import contextlib
+import cProfile
+import importlib
+import io
+import json
+import os
+import pstats
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# pylint: disable=import-error
+import result_store
+
+# modules whose maya.cmds and maya.mel calls are counted, the scene backend makes
+# every Maya call of the checks so it is imported when measuring
+INSTRUMENTED_MODULES = ("scene_backend",)
+COMMAND_MODULE_NAMES = ("cmds", "mel")
+
+# record of the check or fix that is measured right now
+_current_record: Optional["ProfileRecord"] = None
+
+
+def count_nodes(count: int) -> None:
+    """This function adds visited nodes to the check which is measured.
+
+    Args:
+        count (int): Number of nodes read or iterated.
+    """
+    if _current_record is not None:
+        _current_record.nodes_visited += count
+
+
+class _CountingModule:
+    """This class wraps maya.cmds or maya.mel and counts the commands called."""
+
+    def __init__(self, module: ModuleType, record: "ProfileRecord") -> None:
+        self._module = module
+        self._record = record
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._module, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            self._record.command_calls += 1
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+class ProfileRecord:
+    """Measurements of one check or fix execution."""
+
+    def __init__(self, name: str, kind: str, start: float) -> None:
+        self.name = name
+        self.kind = kind
+        self.start = start
+        self.wall_time = 0.0
+        self.command_calls = 0
+        self.nodes_visited = 0
+        self.result_size = 0
+        self.result_bytes = 0
+        self.python_profile = ""
+
+    def merge(self, record: "ProfileRecord") -> None:
+        """This function adds the measurements of a later execution continuing
+        this one, eg: a check stopped at its time budget.
+
+        Args:
+            record (ProfileRecord): Measurements of the later execution.
+        """
+        self.wall_time += record.wall_time
+        self.command_calls += record.command_calls
+        self.nodes_visited += record.nodes_visited
+        self.result_size = record.result_size
+        self.result_bytes = record.result_bytes
+        self.python_profile = record.python_profile or self.python_profile
+
+    def as_dict(self) -> Dict[str, Any]:
+        """This function returns the measurements as a json compatible dict."""
+        return dict(vars(self))
+
+
+class CheckProfiler:
+    """This class measures wall time, command calls, nodes visited and result size
+    of every check and fix it executes.
+    """
+
+    def __init__(
+        self,
+        store: Optional[result_store.ResultStore] = None,
+        python_profile: bool = False,
+    ) -> None:
+        """This function initializes an empty profile.
+
+        Args:
+            store (result_store.ResultStore): Store the checks record into, the
+                size of the results is measured when given.
+            python_profile (bool): Capture a cProfile of every execution as well.
+        """
+        self.store = store
+        self.python_profile = python_profile
+        self.records: List[ProfileRecord] = []
+        self.origin = time.perf_counter()
+
+    def clear(self) -> None:
+        """This function removes all the measurements."""
+        self.records = []
+        self.origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def measure(
+        self,
+        name: str,
+        kind: str,
+        result_key: Optional[str] = None,
+        resume: bool = False,
+    ) -> Iterator[ProfileRecord]:
+        """This function measures the code executed in the with block.
+
+        Args:
+            name (str): Name of the check or fix.
+            kind (str): "check" or "fix".
+            result_key (str): Result key whose size is recorded.
+            resume (bool): The block continues the last execution of the check,
+                its measurements are added to the record of that execution.
+
+        Yields:
+            The record which is filled.
+
+        """
+        # pylint: disable=global-statement
+        global _current_record
+        record = ProfileRecord(name, kind, time.perf_counter())
+        originals = []
+        for instrumented in INSTRUMENTED_MODULES:
+            module = importlib.import_module(instrumented)
+            for module_name in COMMAND_MODULE_NAMES:
+                # cmds and mel are None when the checks run without Maya
+                if getattr(module, module_name, None) is not None:
+                    original = getattr(module, module_name)
+                    originals.append((module, module_name, original))
+                    setattr(module, module_name, _CountingModule(original, record))
+        profile = cProfile.Profile() if self.python_profile else None
+        _current_record = record
+        try:
+            if profile is not None:
+                profile.enable()
+            yield record
+        finally:
+            if profile is not None:
+                profile.disable()
+                stream = io.StringIO()
+                stats = pstats.Stats(profile, stream=stream)
+                stats.sort_stats("cumulative").print_stats(20)
+                record.python_profile = stream.getvalue()
+            record.wall_time = time.perf_counter() - record.start
+            _current_record = None
+            for module, module_name, original in originals:
+                setattr(module, module_name, original)
+            if result_key is not None and self.store is not None:
+                record.result_size = self.store.count(result_key)
+                record.result_bytes = self.store.nbytes(result_key)
+            resumed = next(
+                (
+                    previous
+                    for previous in reversed(self.records)
+                    if resume and (previous.name, previous.kind) == (name, kind)
+                ),
+                None,
+            )
+            if resumed is not None:
+                resumed.merge(record)
+            else:
+                self.records.append(record)
+
+    def wrap(
+        self,
+        function: Callable[[], None],
+        name: str,
+        kind: str,
+        result_key: Optional[str] = None,
+        resumes: Optional[Callable[[], bool]] = None,
+    ) -> Callable[[], None]:
+        """This function returns the function measured on every call.
+
+        Args:
+            function (Callable): Check or fix function.
+            name (str): Name of the check or fix.
+            kind (str): "check" or "fix".
+            result_key (str): Result key whose size is recorded.
+            resumes (Callable): Returns whether the call continues the previous
+                one, both are measured as one execution.
+
+        Returns:
+            The measured function.
+
+        """
+
+        def measured() -> None:
+            resume = resumes is not None and resumes()
+            with self.measure(name, kind, result_key, resume):
+                function()
+
+        return measured
+
+    def summary(self) -> str:
+        """This function formats the measurements as a table for the information panel.
+
+        Returns:
+            Table sorted by wall time, slowest first.
+
+        """
+        lines = [
+            f"{'name':<28}{'kind':<7}{'time(s)':>10}{'cmds':>8}{'nodes':>10}"
+            f"{'results':>10}{'KB':>10}"
+        ]
+        records = sorted(self.records, key=lambda rec: rec.wall_time, reverse=True)
+        for record in records:
+            lines.append(
+                f"{record.name:<28}{record.kind:<7}{record.wall_time:>10.4f}"
+                f"{record.command_calls:>8}{record.nodes_visited:>10}"
+                f"{record.result_size:>10}{record.result_bytes / 1024:>10.1f}"
+            )
+        total = sum(record.wall_time for record in self.records)
+        lines.append(f"{'total':<35}{total:>10.4f}")
+        return "\n".join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        """This function returns the measurements as a json compatible dict."""
+        return {"records": [record.as_dict() for record in self.records]}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """This function returns the measurements in Chrome trace event format,
+        which chrome://tracing and Perfetto open.
+        """
+        events = []
+        for record in self.records:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.kind,
+                    "ph": "X",
+                    "ts": (record.start - self.origin) * 1e6,
+                    "dur": record.wall_time * 1e6,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": {
+                        "command_calls": record.command_calls,
+                        "nodes_visited": record.nodes_visited,
+                        "result_size": record.result_size,
+                        "result_bytes": record.result_bytes,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_json(self, file_path: str) -> None:
+        """This function writes the measurements to a json file."""
+        with open(file_path, "w", encoding="utf-8") as file_handle:
+            json.dump(self.to_json(), file_handle, indent=4)
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        """This function writes the measurements to a Chrome trace event file."""
+        with open(file_path, "w", encoding="utf-8") as file_handle:
+            json.dump(self.to_chrome_trace(), file_handle)
@@ -0,0 +1,463 @@
+"""Modules to register the model checks and their fixes in one place."""
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# pylint: disable=import-error
+import model_check_funcs
+
+# scope of a check
+SCENE = "scene"
+HIERARCHY = "hierarchy"
+
+# cost classes, cheap checks are scheduled first
+CHEAP = 0
+MEDIUM = 1
+HEAVY = 2
+
+# fix stages, "Fix All Issues" executes the fixes stage after stage: scene
+# cleanup, then construction history before freezing before pivots
+FIX_CLEANUP = 0
+FIX_HISTORY = 1
+FIX_FREEZE = 2
+FIX_PIVOTS = 3
+FIX_DISPLAY = 4
+
+
+class CheckSpec(NamedTuple):
+    """Declaration of a model check.
+
+    Attributes:
+        check_id (str): Unique name of the check.
+        label (str): Checkbox text in the UI.
+        result_key (str): model_check_funcs.results key the check fills.
+        check (Callable): Check function.
+        fix_label (str): Fix button text in the UI.
+        fix (Callable): Fix or highlight function of the fix button.
+        scope (str): SCENE for scene wide lookups, HIERARCHY for checks walking
+            the selected group.
+        cost (int): CHEAP, MEDIUM or HEAVY.
+        needs (Tuple[str, ...]): Snapshot data the check reads, checks with the
+            same needs are scheduled next to each other to share it.
+        auto_fix (bool): The fix is executed by "Fix All Issues", highlight
+            only fixes are not.
+        enabled (bool): The checkbox is checked when the tool opens.
+        fix_stage (int): Stage of the fix in "Fix All Issues", FIX_CLEANUP ...
+        fix_targets (str): Result key of the names the fix edits, result_key
+            when empty.
+        fix_changes (Tuple[str, ...]): Snapshot data the fix changes, checks
+            needing it are checked again after the fix.
+        version (int): Version of the check, bumped when the check changes so
+            results cached by an older version are not used.
+        headless (bool): The check reads the scene content only, checks of the
+            UI state eg: the viewport are left out of the batch tools.
+    """
+
+    check_id: str
+    label: str
+    result_key: str
+    check: Callable[[], None]
+    fix_label: str
+    fix: Callable[[], None]
+    scope: str
+    cost: int
+    needs: Tuple[str, ...] = ()
+    auto_fix: bool = True
+    enabled: bool = True
+    fix_stage: int = FIX_CLEANUP
+    fix_targets: str = ""
+    fix_changes: Tuple[str, ...] = ()
+    version: int = 1
+    headless: bool = True
+
+
+# registered checks in display order
+CHECKS: Dict[str, CheckSpec] = {}
+
+
+def register(spec: CheckSpec) -> CheckSpec:
+    """This function registers a check, adding a check to the tool only needs
+    one registration.
+
+    Args:
+        spec (CheckSpec): Declaration of the check.
+
+    Returns:
+        The registered spec.
+
+    """
+    if spec.check_id in CHECKS:
+        raise ValueError(f"Check {spec.check_id} is already registered")
+    CHECKS[spec.check_id] = spec
+    return spec
+
+
+def get_check(check_id: str) -> Optional[CheckSpec]:
+    """This function returns the declaration of a registered check."""
+    return CHECKS.get(check_id)
+
+
+def schedule(check_ids: Iterable[str]) -> List[CheckSpec]:
+    """This function orders the checks to execute, cheap checks first and checks
+    reading the same snapshot data next to each other.
+
+    Args:
+        check_ids (Iterable[str]): Enabled checks.
+
+    Returns:
+        Specs in execution order.
+
+    """
+    specs = [CHECKS[check_id] for check_id in check_ids]
+    return sorted(specs, key=lambda spec: (spec.cost, spec.needs))
+
+
+def fix_order(check_ids: Iterable[str]) -> List[CheckSpec]:
+    """This function lists the checks whose fixes "Fix All Issues" executes,
+    stage after stage, in registration order within a stage."""
+    wanted = set(check_ids)
+    specs = [
+        spec for spec in CHECKS.values() if spec.check_id in wanted and spec.auto_fix
+    ]
+    return sorted(specs, key=lambda spec: spec.fix_stage)
+
+
+def affected_checks(fixed_ids: Iterable[str]) -> List[str]:
+    """This function lists the checks to execute again after fixes, the fixed
+    checks and the checks needing snapshot data the fixes changed.
+
+    Args:
+        fixed_ids (Iterable[str]): Checks whose fix was executed.
+
+    Returns:
+        Check ids in registration order.
+
+    """
+    fixed = set(fixed_ids)
+    changed = {data for check_id in fixed for data in CHECKS[check_id].fix_changes}
+    return [
+        spec.check_id
+        for spec in CHECKS.values()
+        if spec.check_id in fixed or changed.intersection(spec.needs)
+    ]
+
+
+def checks_reading(check_ids: Iterable[str], changed: Iterable[str]) -> List[str]:
+    """This function lists the checks reading snapshot data which changed, eg:
+    after scene edits reported by live validation.
+
+    Args:
+        check_ids (Iterable[str]): Enabled checks.
+        changed (Iterable[str]): Snapshot data which changed eg: "pivots",
+            "nodes" when nodes were added to or removed from the hierarchy,
+            every hierarchy check reads them.
+
+    Returns:
+        Check ids in registration order.
+
+    """
+    wanted = set(check_ids)
+    changed = set(changed)
+    return [
+        spec.check_id
+        for spec in CHECKS.values()
+        if spec.check_id in wanted
+        and (
+            changed.intersection(spec.needs)
+            or (spec.scope == HIERARCHY and "nodes" in changed)
+        )
+    ]
+
+
+register(
+    CheckSpec(
+        "constraints",
+        "No Constraints",
+        "unwanted_constraints",
+        model_check_funcs.check_constraints,
+        "Delete All Constraints",
+        model_check_funcs.delete_constraints,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "master_group_pivot",
+        "Master group pivot is at origin",
+        "master_group_with_offset_pivot",
+        model_check_funcs.check_master_group_pivot,
+        "Reset master group pivot",
+        model_check_funcs.center_pivot_master_group,
+        HIERARCHY,
+        CHEAP,
+        ("root_pivots",),
+        fix_stage=FIX_PIVOTS,
+    )
+)
+register(
+    CheckSpec(
+        "center_pivots",
+        "Check Pivot points are centered",
+        "geometry_with_offset_pivot",
+        model_check_funcs.check_geometry_center_pivot,
+        "Center Pivots on all objects",
+        model_check_funcs.center_pivot_all_objects,
+        HIERARCHY,
+        MEDIUM,
+        ("pivots",),
+        fix_stage=FIX_PIVOTS,
+    )
+)
+register(
+    CheckSpec(
+        "construction_history",
+        "Check Construction History",
+        "construction_history_list",
+        model_check_funcs.check_construction_histories,
+        "Delete Construction History",
+        model_check_funcs.delete_construction_history,
+        HIERARCHY,
+        HEAVY,
+        ("history",),
+        fix_stage=FIX_HISTORY,
+        # deleted history nodes are listed by the scene wide checks
+        fix_changes=("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "frozen_transforms",
+        "All Transforms are frozen",
+        "freeze_tranform_list",
+        model_check_funcs.check_all_transforms_are_frozen,
+        "Freeze Transforms on all Objects",
+        model_check_funcs.freeze_transforms,
+        HIERARCHY,
+        MEDIUM,
+        ("transform_values",),
+        fix_stage=FIX_FREEZE,
+        # freezing moves the pivots to where the transform was
+        fix_changes=("pivots",),
+    )
+)
+register(
+    CheckSpec(
+        "duplicate_shape_nodes",
+        "No Duplicate Shape Nodes",
+        "unwanted_multiple_shape_nodes",
+        model_check_funcs.check_duplicate_shape_nodes,
+        "Highlight nodes with extra shape nodes",
+        model_check_funcs.highlight_shapes_with_extra_shape_nodes,
+        HIERARCHY,
+        CHEAP,
+        ("shapes",),
+        auto_fix=False,
+    )
+)
+register(
+    CheckSpec(
+        "expressions",
+        "No Expressions",
+        "unwanted_expressions",
+        model_check_funcs.check_expressions,
+        "Delete All expressions",
+        model_check_funcs.delete_expressions,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "animation_curves",
+        "No Animation",
+        "unwanted_animation_curves",
+        model_check_funcs.check_animation_curves,
+        "Delete All Animations",
+        model_check_funcs.delete_animation_curves,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "render_layers",
+        "No Render Layers",
+        "unwanted_rendersetup_layers",
+        model_check_funcs.check_render_layers,
+        "Delete Render Layers",
+        model_check_funcs.delete_render_layers,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "display_layers",
+        "No Display Layers",
+        "unwanted_display_layers",
+        model_check_funcs.check_display_layers,
+        "Delete Display Layers",
+        model_check_funcs.delete_display_layers,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+        # members of hidden layers are shown again
+        fix_changes=("visibility",),
+    )
+)
+register(
+    CheckSpec(
+        "vray_lights",
+        "No Lights",
+        "unwanted_vray_lights",
+        model_check_funcs.check_vray_lights,
+        "Delete Lights",
+        model_check_funcs.delete_vray_lights,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "cameras",
+        "No Additional Cameras",
+        "unwanted_cameras",
+        model_check_funcs.check_cameras,
+        "Delete all Additional Cameras",
+        model_check_funcs.delete_unwanted_cameras,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "unknown_nodes",
+        "No Unknown Nodes",
+        "unknown_nodes",
+        model_check_funcs.check_unknown_nodes,
+        "Delete Unknown Nodes",
+        model_check_funcs.delete_unknown_nodes,
+        SCENE,
+        CHEAP,
+        ("type_index",),
+    )
+)
+register(
+    CheckSpec(
+        "viewport_shading",
+        "Viewport Set to Shaded",
+        "viewport_shaded",
+        model_check_funcs.check_viewport_shading,
+        "Set Viewport to Shaded",
+        model_check_funcs.set_viewport_shading,
+        SCENE,
+        CHEAP,
+        headless=False,
+    )
+)
+register(
+    CheckSpec(
+        "nonmanifold_geometry",
+        "No Non-Manifold Geometry",
+        "nonmanifold_list",
+        model_check_funcs.check_nonmanifold_geometry,
+        "Highlight Manifold Geometry",
+        model_check_funcs.highlight_nonmanifold_geometry,
+        HIERARCHY,
+        HEAVY,
+        ("meshes",),
+        auto_fix=False,
+    )
+)
+register(
+    CheckSpec(
+        "n_sided_faces",
+        "No N-Sided Faces",
+        "nsided_faces",
+        model_check_funcs.check_n_sided_faces,
+        "Highlight N-Sided Faces",
+        model_check_funcs.highlight_n_sided_faces,
+        HIERARCHY,
+        HEAVY,
+        ("meshes",),
+        auto_fix=False,
+    )
+)
+register(
+    CheckSpec(
+        "uvs_in_negative_space",
+        "No UV's in Negative Areas",
+        "uvs_in_negative_space",
+        model_check_funcs.check_uvs_in_negative_space,
+        "Highlight Objects",
+        model_check_funcs.highlight_obj_uvs_in_negative_space,
+        HIERARCHY,
+        HEAVY,
+        ("uvs",),
+        auto_fix=False,
+    )
+)
+register(
+    CheckSpec(
+        "uvs_outside_unit_square",
+        "No UV's outside 0-1",
+        "uvs_outside_unit_square",
+        model_check_funcs.check_uvs_outside_unit_square,
+        "Highlight Objects",
+        model_check_funcs.highlight_obj_uvs_outside_unit_square,
+        HIERARCHY,
+        HEAVY,
+        ("uvs",),
+        auto_fix=False,
+        # UDIM assets lay their uvs out of the 0-1 square on purpose
+        enabled=False,
+    )
+)
+register(
+    CheckSpec(
+        "uv_shells_crossing_udims",
+        "No UV Shells across UDIM tiles",
+        "uv_shells_crossing_udims",
+        model_check_funcs.check_uv_shells_crossing_udims,
+        "Highlight Objects",
+        model_check_funcs.highlight_obj_uv_shells_crossing_udims,
+        HIERARCHY,
+        HEAVY,
+        ("uvs",),
+        auto_fix=False,
+    )
+)
+register(
+    CheckSpec(
+        "hidden_geometry",
+        "No Hidden Geometry",
+        "hidden_geometries",
+        model_check_funcs.check_hidden_geometry,
+        "Unhide All Objects",
+        model_check_funcs.unhide_geometries,
+        HIERARCHY,
+        MEDIUM,
+        ("visibility",),
+        fix_stage=FIX_DISPLAY,
+        fix_targets="hidden_geometry_plugs",
+    )
+)
+register(
+    CheckSpec(
+        "namespaces",
+        "No Namespaces",
+        "unwanted_namespaces",
+        model_check_funcs.check_namespaces,
+        "Delete All Namespaces",
+        model_check_funcs.remove_unwanted_namespaces,
+        SCENE,
+        CHEAP,
+        # every node listed by the scene wide checks is renamed
+        fix_changes=("type_index",),
+    )
+)
@@ -0,0 +1,141 @@
+"""Modules to resume checks stopped by their time budget.
+
+A check going through the meshes or nodes of a snapshot one by one keeps its
+progress and findings so far in a CheckScan. When the time budget of an
+execution is spent, the check records its partial findings and returns, the
+next execution of the check on the same snapshot continues from the next item.
+
+    scan = scans.resume("nsided_faces", snapshot, len(paths), time_budget)
+    for path in paths[scan.done:]:
+        ...
+        if not scan.advance():
+            break
+    scans.end("nsided_faces", scan)
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+# pylint: disable=import-error
+import scene_snapshot
+
+
+class CheckScan:
+    """This class counts the items a check went through on a snapshot and
+    keeps the findings found so far."""
+
+    def __init__(self, snapshot: scene_snapshot.SceneSnapshot, total: int) -> None:
+        """This function creates a scan which went through no item yet.
+
+        Args:
+            snapshot (scene_snapshot.SceneSnapshot): Snapshot the check reads.
+            total (int): Items the check goes through.
+        """
+        self.snapshot = snapshot
+        self.total = total
+        self.done = 0
+        # items checked before the current execution
+        self.resumed_at = 0
+        self.found: List[Any] = []
+        # perf_counter time the execution stops at, 0 for no limit
+        self.deadline = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """Every item was checked."""
+        return self.done >= self.total
+
+    @property
+    def coverage(self) -> float:
+        """Ratio of the items checked."""
+        return self.done / self.total if self.total else 1.0
+
+    def advance(self) -> bool:
+        """This function counts a checked item.
+
+        Returns:
+            False when the time budget of the execution is spent.
+
+        """
+        self.done += 1
+        return not self.deadline or time.perf_counter() < self.deadline
+
+
+class CheckScans:
+    """This class keeps the scans of the checks which did not check every item
+    yet, by result key."""
+
+    def __init__(self) -> None:
+        self._scans: Dict[str, CheckScan] = {}
+
+    def resume(
+        self,
+        key: str,
+        snapshot: scene_snapshot.SceneSnapshot,
+        total: int,
+        budget: float = 0.0,
+    ) -> CheckScan:
+        """This function returns the scan of a check, continued when the previous
+        execution of the check stopped on the same snapshot.
+
+        Args:
+            key (str): Result key of the check.
+            snapshot (scene_snapshot.SceneSnapshot): Snapshot the check reads.
+            total (int): Items the check goes through.
+            budget (float): Seconds the execution may take, 0 for no limit.
+
+        Returns:
+            Scan to go on from scan.done.
+
+        """
+        scan = self._scans.get(key)
+        if scan is None or scan.snapshot is not snapshot or scan.total != total:
+            scan = CheckScan(snapshot, total)
+            self._scans[key] = scan
+        scan.resumed_at = scan.done
+        scan.deadline = time.perf_counter() + budget if budget else 0.0
+        return scan
+
+    def end(self, key: str, scan: CheckScan, stopped: bool = False) -> None:
+        """This function forgets the scan of a check which is done.
+
+        Args:
+            key (str): Result key of the check.
+            scan (CheckScan): Scan of the execution.
+            stopped (bool): The check stopped on purpose before the last item,
+                eg: it found the findings it looks for.
+        """
+        if scan.complete or stopped:
+            self._scans.pop(key, None)
+
+    def forget(self, key: str) -> None:
+        """This function forgets the scan of a check, eg: its complete findings
+        were read from the result cache."""
+        self._scans.pop(key, None)
+
+    def resumes(self, key: str, snapshot: scene_snapshot.SceneSnapshot) -> bool:
+        """This function returns whether the next execution of a check on a
+        snapshot continues where the previous one stopped."""
+        scan = self._scans.get(key)
+        return scan is not None and scan.snapshot is snapshot
+
+    def coverage(self, key: str) -> float:
+        """This function returns the ratio of the items a check went through, 1
+        when its last execution checked every item."""
+        scan = self._scans.get(key)
+        return 1.0 if scan is None else scan.coverage
+
+    def incomplete(self) -> Dict[str, float]:
+        """This function returns the coverage of the checks to continue, by
+        result key."""
+        return {key: scan.coverage for key, scan in self._scans.items()}
+
+    def snapshot(self) -> Optional[scene_snapshot.SceneSnapshot]:
+        """This function returns the snapshot the incomplete checks go through,
+        None when every check is done."""
+        for scan in self._scans.values():
+            return scan.snapshot
+        return None
+
+    def clear(self) -> None:
+        """This function forgets every scan, the partial findings are accepted."""
+        self._scans.clear()
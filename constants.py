@@ -1,6 +1,83 @@
+import os
+
 FONT_POINT_SIZE = 10
 FONT = "Roboto"
 
 RED = "background:rgb(255,0,0)"
 GREEN = "background:rgb(0,255,0)"
 YELLOW = "background:rgb(255,255,0)"
+
+# Rows the results browser adds at a time while scrolling
+RESULTS_FETCH_BATCH = 1000
+# Targets listed for every fix by the fix preview
+FIX_PREVIEW_COUNT = 20
+
+# Folder of the results cached on disk by scene content fingerprint
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".model_check", "result_cache")
+# Largest size of the cached results, least recently used ones are evicted
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Mesh analyses remembered by geometry fingerprint across check runs
+MESH_MEMO_MAX_ENTRIES = 50000
+# Quiet time after the last scene edit before live validation checks again
+LIVE_VALIDATION_DELAY_MS = 500
+# Seconds a check going through the meshes one by one executes before Maya
+# processes its events, the check is then executed again where it stopped
+CHECK_SLICE_SECONDS = 0.1
+# Seconds a check of the UI may take before its partial findings are kept,
+# 0 for no limit
+CHECK_TIME_BUDGET_SECONDS = 30.0
+
+# Largest difference from identity translate/rotate/scale treated as frozen
+FREEZE_TOLERANCE = 1e-5
+
+# Largest distance of a pivot from its expected position treated as placed
+PIVOT_TOLERANCE = 1e-5
+
+# Faces with more sides than this are n-gons
+MAX_FACE_SIDES = 4
+# Report quads with a concave corner as well
+FLAG_CONCAVE_QUADS = False
+# Most triangles a mesh may have once triangulated, 0 for no budget
+TRIANGLE_BUDGET = 0
+
+# Largest distance of a uv beyond a tile border still treated as inside
+UV_TOLERANCE = 1e-5
+
+# Node types of the history categories, the first category a history node type
+# derives from wins, so tweak comes before the deformers it derives from
+HISTORY_CATEGORIES = {
+    "tweak": ("tweak",),
+    "deformer": ("geometryFilter",),
+    "group_parts": ("groupParts", "groupId"),
+    "modeling": ("polyBase",),
+}
+# History categories reported as construction history
+CONSTRUCTION_HISTORY_CATEGORIES = ("modeling",)
+
+# Node types looked up in the scene by the scene wide checks
+CONSTRAINT_TYPES = (
+    "parentConstraint",
+    "pointConstraint",
+    "orientConstraint",
+    "scaleConstraint",
+    "aimConstraint",
+)
+EXPRESSION_TYPES = ("expression",)
+ANIMATION_CURVE_TYPES = ("animCurveTL", "animCurveTA", "animCurveTU")
+RENDER_SETUP_LAYER_TYPES = ("renderSetupLayer",)
+DISPLAY_LAYER_TYPES = ("displayLayer",)
+VRAY_LIGHT_TYPES = (
+    "VRayLightRectShape",
+    "VRayLightDomeShape",
+    "VRayLightIESShape",
+    "VRayLightSphereShape",
+    "VRaySunTarget",
+)
+CAMERA_TYPES = ("camera",)
+UNKNOWN_TYPES = ("unknown",)
+# Plugins the checking machines do not load, the .ma pre-screen reports the
+# nodes of the types they declare as unknown nodes like Maya would
+PRESCREEN_MISSING_PLUGINS = ()
+
+DEFAULT_DISPLAY_LAYERS = ("defaultLayer",)
+DEFAULT_CAMERAS = ("frontShape", "perspShape", "sideShape", "topShape")
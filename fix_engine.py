@@ -0,0 +1,109 @@
+"""Modules to plan the fixes of many checks and apply them as one undoable edit."""
+import contextlib
+from typing import Iterable, List, NamedTuple, Optional
+
+# pylint: disable=import-error
+import check_profiler
+import check_registry
+import constants
+import model_check_funcs
+import scene_backend
+
+# name of the undo step "Fix All Issues" makes
+UNDO_CHUNK_NAME = "Fix All Issues"
+
+
+class FixOperation(NamedTuple):
+    """A fix planned by plan_fixes().
+
+    Attributes:
+        check_id (str): Registered id of the fixed check.
+        label (str): Fix button text eg: "Freeze Transforms on all Objects".
+        targets (List[str]): Nodes or plugs the fix edits.
+    """
+
+    check_id: str
+    label: str
+    targets: List[str]
+
+
+def plan_fixes(check_ids: Iterable[str]) -> List[FixOperation]:
+    """This function lists the fixes of the checks with findings in the order
+    they are applied, history before freeze before pivots.
+
+    Args:
+        check_ids (Iterable[str]): Checks to fix, checks without findings or
+            without an automatic fix are skipped.
+
+    Returns:
+        FixOperation of every fix to apply.
+
+    """
+    results = model_check_funcs.results
+    return [
+        FixOperation(
+            spec.check_id,
+            spec.fix_label,
+            results.get(spec.fix_targets or spec.result_key),
+        )
+        for spec in check_registry.fix_order(check_ids)
+        if results.count(spec.result_key)
+    ]
+
+
+def dry_run_report(
+    operations: List[FixOperation], preview: int = constants.FIX_PREVIEW_COUNT
+) -> str:
+    """This function describes the planned edits without applying them.
+
+    Args:
+        operations (List[FixOperation]): Fixes returned by plan_fixes().
+        preview (int): Targets listed for every fix, the others are counted.
+
+    Returns:
+        One numbered line per fix followed by its first targets.
+
+    """
+    if not operations:
+        return "Nothing to fix"
+    lines = []
+    for step, operation in enumerate(operations, start=1):
+        lines.append(
+            f"{step}. {operation.label} ({operation.check_id}): "
+            f"{len(operation.targets)} targets"
+        )
+        lines.extend(f"    {target}" for target in operation.targets[:preview])
+        if len(operation.targets) > preview:
+            lines.append(f"    ... {len(operation.targets) - preview} more")
+    return "\n".join(lines)
+
+
+def apply_fixes(
+    operations: List[FixOperation],
+    profiler: Optional[check_profiler.CheckProfiler] = None,
+) -> List[str]:
+    """This function applies the fixes inside one undo chunk, a single undo
+    reverts all of them.
+
+    Args:
+        operations (List[FixOperation]): Fixes returned by plan_fixes().
+        profiler (check_profiler.CheckProfiler): Measures every fix when given.
+
+    Returns:
+        Ids of the checks to execute again, see check_registry.affected_checks().
+
+    """
+    with scene_backend.get_backend().undo_chunk(UNDO_CHUNK_NAME):
+        for operation in operations:
+            measure = (
+                profiler.measure(operation.check_id, "fix")
+                if profiler is not None
+                else contextlib.nullcontext()
+            )
+            with measure:
+                check_registry.CHECKS[operation.check_id].fix()
+            # fixes rename and move nodes, the next fix reads the current paths
+            model_check_funcs.results.mark_stale()
+    return check_registry.affected_checks(
+        operation.check_id for operation in operations
+    )
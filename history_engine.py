@@ -0,0 +1,62 @@
+"""Modules to classify the construction history read in batches by the scene backend."""
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# category of history nodes whose type matches none of the categories
+OTHER = "other"
+
+
+class HistoryBatch(NamedTuple):
+    """Upstream history nodes of many shapes read in one pass.
+
+    Attributes:
+        paths (List[str]): Full dag paths of the shapes.
+        counts (np.ndarray): Number of history nodes of every shape.
+        node_names (List[str]): History nodes of all the shapes, shape after shape.
+        node_types (List[str]): Node type of every history node.
+    """
+
+    paths: List[str]
+    counts: np.ndarray
+    node_names: List[str]
+    node_types: List[str]
+
+
+def classify(
+    batch: HistoryBatch,
+    categories: Dict[str, Tuple[str, ...]],
+    inherited_types: Callable[[str], Sequence[str]],
+) -> Dict[str, np.ndarray]:
+    """This function flags the shapes having history nodes of every category.
+
+    Args:
+        batch (HistoryBatch): History read by SceneSnapshot.history().
+        categories (Dict[str, Tuple[str, ...]]): Node types of every category, the
+            first category a node type derives from wins.
+        inherited_types (Callable): Lists a node type and the types it derives from.
+
+    Returns:
+        Boolean array over the shapes for every category and OTHER.
+
+    """
+    names = list(categories) + [OTHER]
+    # every node type is resolved once, however many nodes share it
+    type_categories: Dict[str, int] = {}
+    for type_name in set(batch.node_types):
+        types = set(inherited_types(type_name))
+        type_categories[type_name] = next(
+            (
+                idx
+                for idx, category_types in enumerate(categories.values())
+                if types.intersection(category_types)
+            ),
+            len(categories),
+        )
+    node_categories = np.array(
+        [type_categories[type_name] for type_name in batch.node_types], dtype=np.int32
+    )
+    owners = np.repeat(np.arange(len(batch.paths)), batch.counts)
+    flags = np.zeros((len(batch.paths), len(names)), dtype=bool)
+    flags[owners, node_categories] = True
+    return {name: flags[:, idx] for idx, name in enumerate(names)}
@@ -0,0 +1,161 @@
+"""Modules to check the asset again while it is edited, from scene change events.
+
+After a check run the checked hierarchy is watched, every edit marks the snapshot
+data it changes, and once the scene is quiet the checks reading that data are
+executed again.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from PySide2 import QtCore  # type: ignore
+except ModuleNotFoundError:
+    from PySide6 import QtCore  # type: ignore
+
+# pylint: disable=import-error
+import constants
+import scene_backend
+import scene_snapshot
+
+# snapshot data an attribute edit changes, vector attributes also match their
+# x, y and z children eg: "translateX", backends report the children of other
+# compounds as their parent eg: "pnts" for "pntx"
+ATTRIBUTE_DATA: Dict[str, Tuple[str, ...]] = {
+    "translate": ("transform_values", "pivots", "root_pivots"),
+    "rotate": ("transform_values", "pivots", "root_pivots"),
+    "scale": ("transform_values", "pivots", "root_pivots"),
+    "rotatePivot": ("pivots", "root_pivots"),
+    "scalePivot": ("pivots", "root_pivots"),
+    "visibility": ("visibility",),
+    "lodVisibility": ("visibility",),
+    "overrideEnabled": ("visibility",),
+    "overrideVisibility": ("visibility",),
+    "drawOverride": ("visibility",),
+    # intermediate shapes are left out of the checked shapes
+    "intermediateObject": ("nodes",),
+    "pnts": ("meshes", "pivots", "root_pivots"),
+    "inMesh": ("meshes", "uvs", "pivots", "root_pivots"),
+    "outMesh": ("meshes", "uvs", "pivots", "root_pivots"),
+    "uvSet": ("uvs",),
+    "uvPt": ("uvs",),
+}
+
+
+def changed_data(event: str, in_hierarchy: bool, detail: str) -> Tuple[str, ...]:
+    """This function returns the snapshot data a scene edit changes.
+
+    Args:
+        event (str): Event reported by SceneBackend.watch_changes().
+        in_hierarchy (bool): The edited node, or its new parent, is part of the
+            checked hierarchy.
+        detail (str): Attribute name of ATTRIBUTE_CHANGED events.
+
+    Returns:
+        Snapshot data eg: ("pivots",), "nodes" when the checked nodes changed.
+
+    """
+    if event == scene_backend.ATTRIBUTE_CHANGED:
+        return ATTRIBUTE_DATA.get(detail) or ATTRIBUTE_DATA.get(detail[:-1], ())
+    if event == scene_backend.TOPOLOGY_CHANGED:
+        return ("meshes", "uvs", "pivots", "root_pivots")
+    if event == scene_backend.CONNECTION_CHANGED:
+        # history nodes and display layers are connected to the shapes
+        return ("history", "visibility", "meshes", "uvs")
+    if event == scene_backend.NODE_ADDED:
+        return ("type_index",)
+    # removed, renamed and moved nodes change the long names of the type index
+    return ("type_index", "nodes") if in_hierarchy else ("type_index",)
+
+
+class LiveValidator(QtCore.QObject):  # type: ignore
+    """This class watches the checked hierarchy and reports the snapshot data
+    edits changed, once no edit happened for a short delay.
+    """
+
+    # snapshot data changed since the last report
+    data_changed = QtCore.Signal(list)
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        delay: int = constants.LIVE_VALIDATION_DELAY_MS,
+    ) -> None:
+        """This function creates a validator which watches nothing yet.
+
+        Args:
+            parent (QtCore.QObject): Owner of the validator.
+            delay (int): Milliseconds without edit before reporting.
+        """
+        super().__init__(parent)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.report)
+        self.watched: Set[str] = set()
+        # groups of the watched hierarchy, checked again instead of the selection
+        self.root_uuids: List[str] = []
+        self.dirty: Set[str] = set()
+        self._backend: Optional[scene_backend.SceneBackend] = None
+        self._watch: Any = None
+
+    def is_watching(self) -> bool:
+        """This function returns whether a hierarchy is watched."""
+        return self._watch is not None
+
+    def watch(self, snapshot: scene_snapshot.SceneSnapshot) -> None:
+        """This function watches the nodes of a snapshot, the callbacks are only
+        registered again when the checked nodes changed.
+
+        Args:
+            snapshot (scene_snapshot.SceneSnapshot): Hierarchy of the last run.
+        """
+        uuids = set(snapshot.uuids)
+        if self.is_watching() and uuids == self.watched:
+            return
+        self.stop()
+        self._backend = snapshot.backend
+        self._watch = self._backend.watch_changes(snapshot.handles, self.on_change)
+        self.watched = uuids
+        self.root_uuids = snapshot.root_uuids()
+
+    def stop(self) -> None:
+        """This function removes the callbacks and forgets the pending edits."""
+        if self._watch is not None:
+            self._backend.unwatch_changes(self._watch)
+        self._watch = None
+        self._backend = None
+        self.watched = set()
+        self.root_uuids = []
+        self.discard()
+
+    def discard(self) -> None:
+        """This function forgets the pending edits, eg: a full run checks them."""
+        self.timer.stop()
+        self.dirty = set()
+
+    def postpone(self, changed: Iterable[str]) -> None:
+        """This function reports changed data again later, eg: while checks run.
+
+        Args:
+            changed (Iterable[str]): Snapshot data of a report.
+        """
+        self.dirty.update(changed)
+        if self.dirty:
+            self.timer.start()
+
+    def on_change(self, event: str, node_uuid: str, detail: str) -> None:
+        """This function marks the data changed by a scene edit, every edit
+        restarts the delay. Called by the backend callbacks.
+
+        Args:
+            event (str): Event eg: scene_backend.NODE_ADDED.
+            node_uuid (str): Uuid of the edited node.
+            detail (str): Attribute name or uuid of the new parent.
+        """
+        in_hierarchy = node_uuid in self.watched or detail in self.watched
+        self.postpone(changed_data(event, in_hierarchy, detail))
+
+    def report(self) -> None:
+        """This function emits the data changed since the last report."""
+        changed, self.dirty = sorted(self.dirty), set()
+        if changed:
+            self.data_changed.emit(changed)
@@ -0,0 +1,254 @@
+"""Modules to read the nodes of a Maya ascii file without Maya.
+
+The file is read line by line, only the createNode, namespace, requires and
+file statements are kept, the others eg: the setAttr of mesh points are skipped
+as they are read. Memory grows with the number of nodes, not the file size.
+Nodes of referenced files are not in the file and are not read.
+
+    reader = ma_reader.MaReader()
+    with open("asset.ma", encoding="utf-8") as ma_file:
+        reader.read(ma_file)
+    reader.type_index().nodes_of_type(["camera"])
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# pylint: disable=import-error
+import constants
+import memory_backend
+import node_type_index
+import scene_backend
+
+# statements read from the file, the others are skipped
+STATEMENTS = ("createNode", "namespace", "requires", "file")
+
+# quotes, escaped characters and statement ends, what the statement scan stops at
+_SPECIAL = re.compile(r'\\.|[";]')
+# quoted strings, unquoted words
+_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"|([^\s;]+)')
+_FIRST_WORD = re.compile(r"\s*([A-Za-z]+)")
+
+
+def _statement_end(line: str, start: int, in_string: bool) -> Tuple[int, bool]:
+    """Helper function to find the ";" ending a statement in a line.
+
+    Args:
+        line (str): Line of the file.
+        start (int): Position the statement continues at.
+        in_string (bool): The line starts inside a quoted string.
+
+    Returns:
+        Position of the ";" or -1 when the statement continues on the next line,
+        and whether the line ends inside a quoted string.
+
+    """
+    # most lines of a file are numbers, no quote to care about
+    if not in_string and '"' not in line:
+        return line.find(";", start), False
+    for match in _SPECIAL.finditer(line, start):
+        char = match.group()
+        if char == '"':
+            in_string = not in_string
+        elif char == ";" and not in_string:
+            return match.start(), False
+    return -1, in_string
+
+
+def iter_statements(
+    lines: Iterable[str], keep: Sequence[str] = STATEMENTS
+) -> Iterator[List[str]]:
+    """This function splits MEL lines into statements and yields the kept ones.
+
+    Args:
+        lines (Iterable[str]): Lines of the file, eg: the open file.
+        keep (Sequence[str]): Commands of the statements to yield, the others
+            are skipped without being stored.
+
+    Yields:
+        Words of every kept statement, quoted strings without their quotes
+        eg: ['createNode', 'transform', '-n', 'grp'].
+
+    """
+    kept: Optional[List[str]] = None
+    skipping = False
+    in_string = False
+    for line in lines:
+        start = 0
+        while start < len(line):
+            if kept is None and not skipping:
+                rest = line[start:].lstrip()
+                if not rest or rest.startswith("//"):
+                    break
+                match = _FIRST_WORD.match(line, start)
+                if match is not None and match.group(1) in keep:
+                    kept = []
+                else:
+                    skipping = True
+            end, in_string = _statement_end(line, start, in_string)
+            if kept is not None:
+                kept.append(line[start:] if end < 0 else line[start:end])
+            if end < 0:
+                break
+            if kept is not None:
+                yield [
+                    bare or quoted for quoted, bare in _TOKEN.findall(" ".join(kept))
+                ]
+            kept = None
+            skipping = False
+            start = end + 1
+
+
+def _flags(
+    words: Sequence[str], value_flags: Sequence[str]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Helper function to split the words of a statement into flags and arguments.
+
+    Args:
+        words (Sequence[str]): Words after the command.
+        value_flags (Sequence[str]): Flags followed by a value eg: "-n".
+
+    Returns:
+        Values by flag, flags without value get an empty list, and the arguments.
+
+    """
+    flags: Dict[str, List[str]] = {}
+    arguments: List[str] = []
+    words = list(words)
+    while words:
+        word = words.pop(0)
+        if not word.startswith("-") or len(word) < 2 or word[1].isdigit():
+            arguments.append(word)
+            continue
+        values = flags.setdefault(word, [])
+        if word in value_flags and words:
+            values.append(words.pop(0))
+    return flags, arguments
+
+
+class MaReader:
+    """This class collects the nodes, namespaces and plugins of ascii files."""
+
+    def __init__(
+        self, missing_plugins: Sequence[str] = constants.PRESCREEN_MISSING_PLUGINS
+    ) -> None:
+        """This function creates a reader which read nothing yet.
+
+        Args:
+            missing_plugins (Sequence[str]): Plugins which are not loaded, their
+                node types are read as unknown nodes.
+        """
+        self.missing_plugins = set(missing_plugins)
+        # flat list of long names and types like cmds.ls(long=True, showType=True)
+        self.names_and_types: List[str] = []
+        # top level namespaces in the order they are created
+        self.namespaces: List[str] = list(memory_backend.DEFAULT_NAMESPACES)
+        # required plugins and the node types they declare
+        self.plugins: List[str] = []
+        self.plugin_types: Dict[str, str] = {}
+        # long names of the dag nodes by short name, to find the parents
+        self._dag_paths: Dict[str, List[str]] = {}
+
+    def read(self, lines: Iterable[str]) -> None:
+        """This function reads the statements of a file.
+
+        Args:
+            lines (Iterable[str]): Lines of the file, eg: the open file.
+        """
+        readers = {
+            "createNode": self._create_node,
+            "namespace": self._namespace,
+            "requires": self._requires,
+            "file": self._file,
+        }
+        for words in iter_statements(lines, tuple(readers)):
+            readers[words[0]](words[1:])
+
+    def _add_namespace(self, name: str) -> None:
+        """Helper function to record the top level namespace of a name."""
+        namespace = name.lstrip(":").split(":", 1)[0]
+        if namespace and namespace not in self.namespaces:
+            self.namespaces.append(namespace)
+
+    def _parent_path(self, parent: str) -> str:
+        """Helper function to return the long name of a parent written as its
+        short, partial or long name."""
+        if parent.startswith("|"):
+            return parent
+        matches = [
+            path
+            for path in self._dag_paths.get(parent.rsplit("|", 1)[-1], [])
+            if path.endswith("|" + parent)
+        ]
+        # parents from referenced files are not read, they are at world level
+        return matches[-1] if matches else "|" + parent
+
+    def _create_node(self, words: List[str]) -> None:
+        """Helper function to read createNode type -n name -p parent."""
+        flags, arguments = _flags(words, ("-n", "-name", "-p", "-parent"))
+        if not arguments:
+            return
+        node_type = arguments[0]
+        name = (flags.get("-n") or flags.get("-name") or [f"{node_type}1"])[0]
+        parent = (flags.get("-p") or flags.get("-parent") or [None])[0]
+        dag = parent is not None or "dagNode" in memory_backend.inherited_types(
+            node_type
+        )
+        if self.plugin_types.get(node_type) in self.missing_plugins:
+            # nodes of plugins which are not loaded are opened as unknown
+            node_type = "unknownDag" if dag else "unknown"
+        if ":" in name:
+            self._add_namespace(name)
+        if dag:
+            path = (self._parent_path(parent) if parent else "") + "|" + name
+            self._dag_paths.setdefault(name, []).append(path)
+        else:
+            path = name
+        self.names_and_types.extend((path, node_type))
+
+    def _namespace(self, words: List[str]) -> None:
+        """Helper function to read namespace -add name, with -p for nested ones."""
+        flags, _ = _flags(words, ("-add", "-p", "-parent", "-set", "-rm"))
+        parent = (flags.get("-p") or flags.get("-parent") or [""])[0]
+        for name in flags.get("-add", []):
+            self._add_namespace(f"{parent}:{name}" if parent.strip(":") else name)
+
+    def _requires(self, words: List[str]) -> None:
+        """Helper function to read requires -nodeType type plugin version."""
+        flags, arguments = _flags(words, ("-nodeType", "-nt", "-dataType", "-dt"))
+        if not arguments or arguments[0] == "maya":
+            return
+        plugin = arguments[0]
+        if plugin not in self.plugins:
+            self.plugins.append(plugin)
+        for node_type in flags.get("-nodeType", []) + flags.get("-nt", []):
+            self.plugin_types[node_type] = plugin
+
+    def _file(self, words: List[str]) -> None:
+        """Helper function to read the namespace of file -r -ns name path."""
+        flags, _ = _flags(words, ("-ns", "-namespace", "-rfn", "-typ", "-op", "-rdi"))
+        for name in flags.get("-ns", []) + flags.get("-namespace", []):
+            self._add_namespace(name)
+
+    def backend(self) -> memory_backend.MemoryBackend:
+        """This function returns a memory backend holding the namespaces read,
+        the node types resolve through its type tree."""
+        scene = memory_backend.MemoryScene(default_nodes=False)
+        scene.namespaces = list(self.namespaces)
+        return memory_backend.MemoryBackend(scene)
+
+    def type_index(
+        self, backend: Optional[scene_backend.SceneBackend] = None
+    ) -> node_type_index.NodeTypeIndex:
+        """This function returns the type index of the nodes read.
+
+        Args:
+            backend (scene_backend.SceneBackend): Backend resolving the type
+                tree, see backend().
+
+        Returns:
+            NodeTypeIndex like read from the scene opened in Maya.
+
+        """
+        return node_type_index.NodeTypeIndex(
+            self.names_and_types, backend or self.backend()
+        )
@@ -1,4 +1,6 @@
 """Modules to create UI"""
+import functools
+from typing import Dict, Iterable, List, Optional
 
 # pylint: disable=import-error
 import maya.OpenMayaUI as omui  # type: ignore
@@ -11,10 +13,18 @@ except ModuleNotFoundError:
     from shiboken6 import wrapInstance  # type: ignore
 
 # pylint: disable=import-error
+import check_profiler
+import check_registry
 import constants
+import fix_engine
+import live_validation
 import model_check_funcs
 import model_check_thread
 import model_check_widgets
+import result_cache
+import results_browser
+import scene_backend
+import scene_snapshot
 import utilities
 
 ptr = omui.MQtUtil.mainWindow()
@@ -41,12 +51,45 @@ class UiCheckWidget(QtWidgets.QWidget):  # type: ignore
         self.check_asset_pushbutton.setFont(
             QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
         )
+        self.cancel_check_pushbutton = QtWidgets.QPushButton("Cancel")
+        self.cancel_check_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.cancel_check_pushbutton.setEnabled(False)
+        # checks stopping at their time budget keep partial results, which are
+        # continued or accepted as a sampled result
+        self.time_budget_spinbox = QtWidgets.QDoubleSpinBox()
+        self.time_budget_spinbox.setRange(0.0, 3600.0)
+        self.time_budget_spinbox.setValue(constants.CHECK_TIME_BUDGET_SECONDS)
+        self.time_budget_spinbox.setSuffix(" s")
+        self.time_budget_spinbox.setSpecialValueText("No time budget")
+        self.time_budget_spinbox.setToolTip("Time a check may take, 0 for no limit")
+        self.time_budget_spinbox.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.continue_checks_pushbutton = QtWidgets.QPushButton("Continue Checks")
+        self.continue_checks_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.continue_checks_pushbutton.setEnabled(False)
+        self.accept_partial_pushbutton = QtWidgets.QPushButton("Accept Partial")
+        self.accept_partial_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.accept_partial_pushbutton.setEnabled(False)
+        # checks scheduled on the thread which have not reported yet
+        self.pending_checks = {}
 
         self.checks_scrollarea = QtWidgets.QScrollArea()
         self.checks_scrollarea.setWidgetResizable(True)
         self.model_checks = model_check_widgets.ModelCheckWidgets()
         self.checks_scrollarea.setWidget(self.model_checks)
 
+        # findings of the clicked check, rows are filled while scrolling
+        self.results_browser = results_browser.ResultsBrowser(
+            model_check_funcs.results,
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
+        )
         self.information_plaintextedit = QtWidgets.QPlainTextEdit()
         self.information_plaintextedit.setReadOnly(True)
         self.information_plaintextedit.setFont(
@@ -56,10 +99,45 @@ class UiCheckWidget(QtWidgets.QWidget):  # type: ignore
         self.information_clear_pushbutton.setFont(
             QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
         )
+
+        # profiling of the checks and fixes
+        self.profiler = check_profiler.CheckProfiler(model_check_funcs.results)
+        self.show_profile_pushbutton = QtWidgets.QPushButton("Show Profile")
+        self.show_profile_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.export_profile_pushbutton = QtWidgets.QPushButton("Export Profile")
+        self.export_profile_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        self.python_profile_checkbox = QtWidgets.QCheckBox("cProfile")
+        self.python_profile_checkbox.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        # findings of unchanged scene content are read back from disk
+        self.result_cache = result_cache.ResultCache(model_check_funcs.results)
+        self.cache_results_checkbox = QtWidgets.QCheckBox("Cache results")
+        self.cache_results_checkbox.setChecked(True)
+        self.cache_results_checkbox.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
+        # edits of the checked hierarchy execute the checks they affect again
+        self.live_validator = live_validation.LiveValidator(self)
+        self.live_validation_checkbox = QtWidgets.QCheckBox("Live validation")
+        self.live_validation_checkbox.setToolTip(
+            "Watch the checked hierarchy after the next check run"
+        )
+        self.live_validation_checkbox.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
         self.fix_issues_pushbutton = QtWidgets.QPushButton("Fix All Issues")
         self.fix_issues_pushbutton.setFont(
             QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
         )
+        self.preview_fixes_pushbutton = QtWidgets.QPushButton("Preview Fixes")
+        self.preview_fixes_pushbutton.setFont(
+            QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE)
+        )
 
         # Splitting Scrollarea and Information Box
         self.splitter = QtWidgets.QSplitter()
@@ -68,8 +146,31 @@ class UiCheckWidget(QtWidgets.QWidget):  # type: ignore
 
         self.information_frame = QtWidgets.QFrame(self.splitter)
         self.information_verticallayout = QtWidgets.QVBoxLayout(self.information_frame)
-        self.information_verticallayout.addWidget(self.information_plaintextedit)
-        self.information_verticallayout.addWidget(self.information_clear_pushbutton)
+        self.information_splitter = QtWidgets.QSplitter()
+        self.information_splitter.setOrientation(QtCore.Qt.Vertical)
+        self.information_splitter.addWidget(self.results_browser)
+        self.information_splitter.addWidget(self.information_plaintextedit)
+        self.information_verticallayout.addWidget(self.information_splitter)
+        self.information_buttons_horizontallayout = QtWidgets.QHBoxLayout()
+        self.information_buttons_horizontallayout.addWidget(
+            self.information_clear_pushbutton
+        )
+        self.information_buttons_horizontallayout.addWidget(
+            self.show_profile_pushbutton
+        )
+        self.information_buttons_horizontallayout.addWidget(
+            self.export_profile_pushbutton
+        )
+        self.information_buttons_horizontallayout.addWidget(
+            self.python_profile_checkbox
+        )
+        self.information_buttons_horizontallayout.addWidget(self.cache_results_checkbox)
+        self.information_buttons_horizontallayout.addWidget(
+            self.live_validation_checkbox
+        )
+        self.information_verticallayout.addLayout(
+            self.information_buttons_horizontallayout
+        )
         self.information_verticallayout.setContentsMargins(1, 1, 1, 1)
 
         self.checks_info_horizontallayout = QtWidgets.QHBoxLayout()
@@ -79,378 +180,350 @@ class UiCheckWidget(QtWidgets.QWidget):  # type: ignore
         self.vlayout = QtWidgets.QVBoxLayout()
         self.vlayout.addWidget(self.check_asset_pushbutton)
         self.vlayout.addLayout(self.checks_info_horizontallayout)
-        self.vlayout.addWidget(self.fix_issues_pushbutton)
-        self.vlayout.addWidget(self.check_asset_progress_bar)
+        self.fix_horizontallayout = QtWidgets.QHBoxLayout()
+        self.fix_horizontallayout.addWidget(self.preview_fixes_pushbutton)
+        self.fix_horizontallayout.addWidget(self.fix_issues_pushbutton)
+        self.vlayout.addLayout(self.fix_horizontallayout)
+        self.progress_horizontallayout = QtWidgets.QHBoxLayout()
+        self.progress_horizontallayout.addWidget(self.check_asset_progress_bar)
+        self.progress_horizontallayout.addWidget(self.time_budget_spinbox)
+        self.progress_horizontallayout.addWidget(self.continue_checks_pushbutton)
+        self.progress_horizontallayout.addWidget(self.accept_partial_pushbutton)
+        self.progress_horizontallayout.addWidget(self.cancel_check_pushbutton)
+        self.vlayout.addLayout(self.progress_horizontallayout)
         self.setLayout(self.vlayout)
 
         self.setGeometry(200, 100, 1500, 800)
         self.setWindowTitle("Check Asset v1.2.1")
 
         self.check_asset_pushbutton.clicked.connect(self.check_asset)
-        self.check_asset_pushbutton.clicked.connect(self.start_thread)
+        self.cancel_check_pushbutton.clicked.connect(self.thread.cancel)
+        self.continue_checks_pushbutton.clicked.connect(self.continue_checks)
+        self.accept_partial_pushbutton.clicked.connect(self.accept_partial_results)
         self.fix_issues_pushbutton.clicked.connect(self.fix_issues)
-        self.fix_issues_pushbutton.clicked.connect(self.start_thread)
+        self.preview_fixes_pushbutton.clicked.connect(self.preview_fixes)
         self.thread.progress_signal.connect(self.update_progress_bar)
+        self.thread.status_signal.connect(self.update_progress_status)
+        self.thread.check_finished_signal.connect(self.update_check_status)
+        self.thread.run_finished_signal.connect(self.finish_check_asset)
         self.information_clear_pushbutton.clicked.connect(
             self.information_plaintextedit.clear
         )
+        self.show_profile_pushbutton.clicked.connect(self.show_profile)
+        self.live_validation_checkbox.toggled.connect(self.toggle_live_validation)
+        self.live_validator.data_changed.connect(self.run_live_checks)
+        self.export_profile_pushbutton.clicked.connect(self.export_profile)
+        self.display_check_results()
+        self.fix_individual_issues()
 
     def check_asset(self) -> None:
         """This function checks the asset in the scene by executing -
-        clearing plainedit command, empty dictionary, indiviual checks
-        widgets list, checks function reference list, checks dictionary
-        names list, All the lists are then looped to check if the option
-        is checked or unchecked and accordingly execute the checks
-        functions. Executes color buttons signals to display
-        information's. Lastly executes individual fix functionality.
+        clearing plainedit command, empty dictionary, reading the scene
+        snapshot, and scheduling the registered checks whose checkbox is
+        checked on the thread, cheap checks first. The thread executes
+        them and reports every finished check to update_check_status.
         """
-        self.information_plaintextedit.clear()
-        model_check_funcs.model_check_dict = {}
-        model_checks_set = [
-            self.model_checks.constraint_check_widgets_set,
-            self.model_checks.master_group_pivot_origin_widgets_set,
-            self.model_checks.center_pivot_points_widgets_set,
-            self.model_checks.construction_history_widgets_set,
-            self.model_checks.frozen_transforms_widgets_set,
-            self.model_checks.no_duplicate_shape_nodes_widgets_set,
-            self.model_checks.no_expressions_widgets_set,
-            self.model_checks.no_animation_widgets_set,
-            self.model_checks.no_render_layers_widgets_set,
-            self.model_checks.no_display_layers_widgets_set,
-            self.model_checks.no_lights_widgets_set,
-            self.model_checks.no_additional_cameras_widgets_set,
-            self.model_checks.no_unknown_nodes_widgets_set,
-            self.model_checks.viewport_shaded_widgets_set,
-            self.model_checks.no_non_manifold_geometry_widgets_set,
-            self.model_checks.no_n_sided_faces_widgets_set,
-            self.model_checks.no_hidden_geometry_widgets_set,
-            self.model_checks.no_uv_in_negative_area_widgets_set,
-            self.model_checks.no_namespaces_widgets_set,
-        ]
-        # Not executing the function, passing function references
-        functions = [
-            model_check_funcs.check_constraints,
-            model_check_funcs.check_master_group_pivot,
-            model_check_funcs.check_geometry_center_pivot,
-            model_check_funcs.check_construction_histories,
-            model_check_funcs.check_all_transforms_are_frozen,
-            model_check_funcs.check_duplicate_shape_nodes,
-            model_check_funcs.check_expressions,
-            model_check_funcs.check_animation_curves,
-            model_check_funcs.check_render_layers,
-            model_check_funcs.check_display_layers,
-            model_check_funcs.check_vray_lights,
-            model_check_funcs.check_cameras,
-            model_check_funcs.check_unknown_nodes,
-            model_check_funcs.check_viewport_shading,
-            model_check_funcs.check_nonmanifold_geometry,
-            model_check_funcs.check_n_sided_faces,
-            model_check_funcs.check_hidden_geometry,
-            model_check_funcs.check_uvs_in_negative_space,
-            model_check_funcs.check_namespaces,
-        ]
-        statuses = [
-            "unwanted_constraints",
-            "master_group_with_offset_pivot",
-            "geometry_with_offset_pivot",
-            "construction_history_list",
-            "freeze_tranform_list",
-            "unwanted_multiple_shape_nodes",
-            "unwanted_expressions",
-            "unwanted_animation_curves",
-            "unwanted_rendersetup_layers",
-            "unwanted_display_layers",
-            "unwanted_vray_lights",
-            "unwanted_cameras",
-            "unknown_nodes",
-            "viewport_shaded",
-            "nonmanifold_list",
-            "nsided_faces",
-            "hidden_geometries",
-            "uvs_in_negative_space",
-            "unwanted_namespaces",
-        ]
-        for model_check, model_funcs, status in zip(
-            model_checks_set, functions, statuses
-        ):
-            if model_check.checkbox.isChecked():
-                model_funcs()
-                if model_check_funcs.model_check_dict.get(status):
-                    model_check.buttons[-1].setStyleSheet(constants.RED)
-                else:
-                    model_check.buttons[-1].setStyleSheet(constants.GREEN)
-            else:
-                model_check.buttons[-1].setStyleSheet("")
-        self.display_check_results()
-        self.fix_individual_issues()
+        if self.thread.isRunning():
+            return
+        self.profiler.clear()
+        self._start_check_run()
+
+    def _start_check_run(
+        self,
+        check_ids: Optional[Iterable[str]] = None,
+        root_uuids: Optional[List[str]] = None,
+        snapshot: Optional[scene_snapshot.SceneSnapshot] = None,
+    ) -> None:
+        """Helper function to schedule the enabled checks on the thread.
 
-    def display_check_results(self) -> None:
-        """This function helps to display the dictionary results that are
-        saved by all the functions during executions.Results are displayed
-        in PlainTextEdit by clicking color buttons.
+        Args:
+            check_ids (Iterable[str]): Checks to execute again, the results of
+                the other checks are kept. Every check when None.
+            root_uuids (List[str]): Groups to check, the selection when None.
+            snapshot (scene_snapshot.SceneSnapshot): Snapshot to check again
+                instead of reading the scene, eg: to continue incomplete checks.
         """
-        self.model_checks.constraint_check_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_constraints"]
+        self.information_plaintextedit.clear()
+        self.profiler.python_profile = self.python_profile_checkbox.isChecked()
+        enabled_checks = self.model_checks.enabled_checks()
+        if check_ids is None:
+            model_check_funcs.results.clear()
+            model_check_funcs.scans.clear()
+            self.results_browser.show_result(None)
+            # the run reads every pending edit
+            self.live_validator.discard()
+        else:
+            wanted = set(check_ids)
+            enabled_checks = [
+                check_id for check_id in enabled_checks if check_id in wanted
+            ]
+        # read the selected hierarchy once, every check of this run shares it
+        if snapshot is None:
+            with self.profiler.measure("scene_snapshot", "read"):
+                snapshot = scene_snapshot.SceneSnapshot.from_selection(
+                    root_uuids=root_uuids
                 )
+        model_check_funcs.current_snapshot = snapshot
+        # the checks return to Maya often, the thread executes them again
+        model_check_funcs.time_budget = constants.CHECK_SLICE_SECONDS
+        self.thread.time_budget = self.time_budget_spinbox.value()
+        hierarchy_nodes = len(model_check_funcs.current_snapshot)
+        jobs = []
+        self.pending_checks = {}
+        self.result_cache.hits = []
+        self.result_cache.misses = []
+        use_cache = self.cache_results_checkbox.isChecked()
+        for check_id in enabled_checks:
+            self.model_checks.show_status(check_id, None)
+        for spec in check_registry.schedule(enabled_checks):
+            nodes = hierarchy_nodes if spec.scope == check_registry.HIERARCHY else 0
+            check = self.profiler.wrap(
+                self.result_cache.wrap(spec) if use_cache else spec.check,
+                spec.check_id,
+                "check",
+                spec.result_key,
+                functools.partial(
+                    model_check_funcs.scans.resumes, spec.result_key, snapshot
+                ),
             )
-        )
-
-        self.model_checks.master_group_pivot_origin_widgets_set.buttons[
-            -1
-        ].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["master_group_with_offset_pivot"]
-                )
+            coverage = functools.partial(
+                model_check_funcs.scans.coverage, spec.result_key
             )
-        )
-
-        self.model_checks.center_pivot_points_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["geometry_with_offset_pivot"]
-                )
+            jobs.append(
+                model_check_thread.CheckJob(spec.check_id, check, nodes, coverage)
             )
-        )
+            self.pending_checks[spec.check_id] = self.model_checks.widgets_sets[
+                spec.check_id
+            ]
+        self.thread.jobs = jobs
+        self.check_asset_pushbutton.setEnabled(False)
+        self.fix_issues_pushbutton.setEnabled(False)
+        self.preview_fixes_pushbutton.setEnabled(False)
+        self.continue_checks_pushbutton.setEnabled(False)
+        self.accept_partial_pushbutton.setEnabled(False)
+        self.cancel_check_pushbutton.setEnabled(True)
+        self.thread.start()
 
-        self.model_checks.construction_history_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["construction_history_list"]
-                )
-            )
-        )
+    def update_check_status(self, check_id: str) -> None:
+        """This function colors the status button of a finished check.
 
-        self.model_checks.frozen_transforms_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["freeze_tranform_list"]
-                )
-            )
+        Args:
+            check_id (str): Registered id of the finished check.
+        """
+        self.pending_checks.pop(check_id)
+        result_key = check_registry.CHECKS[check_id].result_key
+        self.model_checks.show_status(
+            check_id,
+            bool(model_check_funcs.results.count(result_key)),
+            model_check_funcs.scans.coverage(result_key),
         )
+        # checks executed again refresh the findings shown
+        if self.results_browser.model.result_key == result_key:
+            self.results_browser.show_result(result_key)
 
-        self.model_checks.no_duplicate_shape_nodes_widgets_set.buttons[
-            -1
-        ].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_multiple_shape_nodes"]
-                )
-            )
-        )
+    def finish_check_asset(self, cancelled: bool) -> None:
+        """This function ends the check run and reports checks which did not finish.
 
-        self.model_checks.no_expressions_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_expressions"]
-                )
+        Args:
+            cancelled (bool): The run was cancelled before all the checks finished.
+        """
+        if self.live_validation_checkbox.isChecked() and not cancelled:
+            self.live_validator.watch(model_check_funcs.current_snapshot)
+        model_check_funcs.current_snapshot = None
+        model_check_funcs.time_budget = 0.0
+        self.check_asset_pushbutton.setEnabled(True)
+        self.fix_issues_pushbutton.setEnabled(True)
+        self.preview_fixes_pushbutton.setEnabled(True)
+        self.cancel_check_pushbutton.setEnabled(False)
+        if cancelled or self.thread.failed_checks:
+            self.information_plaintextedit.setPlainText(
+                f"Finished {len(self.thread.finished_checks)} of "
+                f"{len(self.thread.jobs)} checks, partial results are shown.\n"
+                f"Failed: {utilities.joinmylist(self.thread.failed_checks)}"
             )
-        )
-
-        self.model_checks.no_animation_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_animation_curves"]
-                )
+        elif self.result_cache.hits:
+            self.information_plaintextedit.setPlainText(
+                f"{len(self.result_cache.hits)} of {len(self.thread.jobs)} checks "
+                "read from the result cache, the scene content they check is "
+                "unchanged."
             )
-        )
-
-        self.model_checks.no_render_layers_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_rendersetup_layers"]
+        incomplete = self._incomplete_checks()
+        self.continue_checks_pushbutton.setEnabled(bool(incomplete))
+        self.accept_partial_pushbutton.setEnabled(bool(incomplete))
+        if incomplete:
+            self.information_plaintextedit.appendPlainText(
+                "Stopped at the time budget, partial results are shown: "
+                + utilities.joinmylist(
+                    [
+                        f"{check_id} {coverage:.0%}"
+                        for check_id, coverage in incomplete.items()
+                    ]
                 )
+                + "\nContinue the checks or accept the sampled results."
             )
-        )
-
-        self.model_checks.no_display_layers_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_display_layers"]
-                )
+        self.pending_checks = {}
+
+    def _incomplete_checks(self) -> Dict[str, float]:
+        """Helper function to return the coverage of the checks which stopped at
+        their time budget, by check id."""
+        coverages = model_check_funcs.scans.incomplete()
+        return {
+            check_id: coverages[spec.result_key]
+            for check_id, spec in check_registry.CHECKS.items()
+            if spec.result_key in coverages
+        }
+
+    def continue_checks(self) -> None:
+        """This function executes the checks which stopped at their time budget
+        again on the snapshot they went through, from where they stopped."""
+        snapshot = model_check_funcs.scans.snapshot()
+        if self.thread.isRunning() or snapshot is None:
+            return
+        self._start_check_run(list(self._incomplete_checks()), snapshot=snapshot)
+
+    def accept_partial_results(self) -> None:
+        """This function keeps the partial results of the checks which stopped at
+        their time budget as a sampled result, the next run checks every node."""
+        for check_id, coverage in self._incomplete_checks().items():
+            result_key = check_registry.CHECKS[check_id].result_key
+            self.model_checks.show_status(
+                check_id,
+                bool(model_check_funcs.results.count(result_key)),
+                coverage,
+                accepted=True,
             )
-        )
+        model_check_funcs.scans.clear()
+        self.continue_checks_pushbutton.setEnabled(False)
+        self.accept_partial_pushbutton.setEnabled(False)
 
-        self.model_checks.no_lights_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_vray_lights"]
-                )
-            )
-        )
+    def toggle_live_validation(self, state: bool) -> None:
+        """This function stops watching the scene when live validation is turned
+        off, it starts watching after the next check run.
 
-        self.model_checks.no_additional_cameras_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_cameras"]
-                )
-            )
-        )
+        Args:
+            state (bool): The live validation checkbox is checked.
+        """
+        if not state:
+            self.live_validator.stop()
 
-        self.model_checks.no_unknown_nodes_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unknown_nodes"]
-                )
-            )
-        )
+    def run_live_checks(self, changed: List[str]) -> None:
+        """This function executes again the enabled checks reading snapshot data
+        which edits changed, later when a run is executing.
 
-        self.model_checks.viewport_shaded_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["viewport_shaded"]
-                )
-            )
+        Args:
+            changed (List[str]): Snapshot data reported by the live validator.
+        """
+        if self.thread.isRunning():
+            self.live_validator.postpone(changed)
+            return
+        check_ids = check_registry.checks_reading(
+            self.model_checks.enabled_checks(), changed
         )
+        # the watched hierarchy is checked whatever is selected now
+        if check_ids:
+            self._start_check_run(check_ids, self.live_validator.root_uuids)
 
-        self.model_checks.no_non_manifold_geometry_widgets_set.buttons[
-            -1
-        ].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["nonmanifold_list"]
-                )
+    def display_check_results(self) -> None:
+        """This function helps to display the results that are saved by all the
+        functions during executions. Results are listed in the results browser
+        by clicking color buttons. Connected once when the UI is created.
+        """
+        for check_id, widgets_set in self.model_checks.widgets_sets.items():
+            result_key = check_registry.CHECKS[check_id].result_key
+            widgets_set.buttons[-1].clicked.connect(
+                functools.partial(self.show_check_results, result_key)
             )
-        )
 
-        self.model_checks.no_n_sided_faces_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(model_check_funcs.model_check_dict["nsided_faces"])
-            )
-        )
+    def show_check_results(self, result_key: str) -> None:
+        """This function lists the results of a check in the results browser,
+        grouped by node, without building the text of every finding.
 
-        self.model_checks.no_hidden_geometry_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["hidden_geometries"]
-                )
-            )
-        )
+        Args:
+            result_key (str): Result key of the check.
+        """
+        self.results_browser.show_result(result_key)
 
-        self.model_checks.no_uv_in_negative_area_widgets_set.buttons[
-            -1
-        ].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["uvs_in_negative_space"]
-                )
-            )
+    def fix_issues(self) -> None:
+        """This function fixes all the recorded issues in one undo step, history
+        before freeze before pivots, and reruns only the checks the fixes affect."""
+        if self.thread.isRunning():
+            return
+        self.profiler.clear()
+        self.profiler.python_profile = self.python_profile_checkbox.isChecked()
+        operations = fix_engine.plan_fixes(check_registry.CHECKS)
+        affected_checks = fix_engine.apply_fixes(operations, self.profiler)
+        self._start_check_run(affected_checks)
+
+    def preview_fixes(self) -> None:
+        """This function lists the edits "Fix All Issues" would make, in order,
+        without editing the scene."""
+        self.information_plaintextedit.setPlainText(
+            fix_engine.dry_run_report(fix_engine.plan_fixes(check_registry.CHECKS))
         )
 
-        self.model_checks.no_namespaces_widgets_set.buttons[-1].clicked.connect(
-            lambda: self.information_plaintextedit.setPlainText(
-                utilities.joinmylist(
-                    model_check_funcs.model_check_dict["unwanted_namespaces"]
-                )
+    def fix_individual_issues(self) -> None:
+        """This function helps to fix all the recorded issues on individual level.
+        Connected once when the UI is created."""
+        for check_id, widgets_set in self.model_checks.widgets_sets.items():
+            widgets_set.buttons[0].clicked.connect(
+                functools.partial(self.fix_individual_issue, check_id)
             )
-        )
 
-    def fix_issues(self) -> None:
-        """This function fixes all the recorded issues at once and reruns
-        the check_asset function."""
-        model_check_funcs.delete_constraints()
-        model_check_funcs.center_pivot_master_group()
-        model_check_funcs.center_pivot_all_objects()
-        model_check_funcs.remove_float_precision_issue_nodes()
-        model_check_funcs.delete_construction_history()
-        model_check_funcs.freeze_transforms()
-        model_check_funcs.delete_expressions()
-        model_check_funcs.delete_animation_curves()
-        model_check_funcs.delete_render_layers()
-        model_check_funcs.delete_display_layers()
-        model_check_funcs.delete_vray_lights()
-        model_check_funcs.delete_unwanted_cameras()
-        model_check_funcs.delete_unknown_nodes()
-        model_check_funcs.set_viewport_shading()
-        model_check_funcs.unhide_geometries()
-        model_check_funcs.remove_unwanted_namespaces()
-        self.check_asset()
+    def fix_individual_issue(self, check_id: str) -> None:
+        """This function executes and profiles the fix of one check.
 
-    def fix_individual_issues(self) -> None:
-        """This function helps to fix all the recorded issues on individual level."""
-        self.model_checks.constraint_check_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_constraints
-        )
-        self.model_checks.master_group_pivot_origin_widgets_set.buttons[
-            0
-        ].clicked.connect(model_check_funcs.center_pivot_master_group)
-        self.model_checks.center_pivot_points_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.center_pivot_all_objects
-        )
-        self.model_checks.center_pivot_points_widgets_set.buttons[1].clicked.connect(
-            model_check_funcs.remove_float_precision_issue_nodes
-        )
-        self.model_checks.construction_history_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_construction_history
-        )
-        self.model_checks.frozen_transforms_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.freeze_transforms
-        )
-        self.model_checks.no_duplicate_shape_nodes_widgets_set.buttons[
-            0
-        ].clicked.connect(model_check_funcs.highlight_shapes_with_extra_shape_nodes)
-        self.model_checks.no_expressions_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_expressions
-        )
-        self.model_checks.no_animation_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_animation_curves
-        )
-        self.model_checks.no_render_layers_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_render_layers
-        )
-        self.model_checks.no_display_layers_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_display_layers
-        )
-        self.model_checks.no_lights_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_vray_lights
-        )
-        self.model_checks.no_additional_cameras_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_unwanted_cameras
-        )
-        self.model_checks.no_unknown_nodes_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.delete_unknown_nodes
-        )
-        self.model_checks.viewport_shaded_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.set_viewport_shading
-        )
-        self.model_checks.no_non_manifold_geometry_widgets_set.buttons[
-            0
-        ].clicked.connect(model_check_funcs.highlight_nonmanifold_geometry)
-        self.model_checks.no_n_sided_faces_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.highlight_n_sided_faces
-        )
-        self.model_checks.no_hidden_geometry_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.unhide_geometries
-        )
-        self.model_checks.no_uv_in_negative_area_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.highlight_obj_uvs_in_negative_space
-        )
-        self.model_checks.no_namespaces_widgets_set.buttons[0].clicked.connect(
-            model_check_funcs.remove_unwanted_namespaces
-        )
+        Args:
+            check_id (str): Registered id of the check.
+        """
+        spec = check_registry.CHECKS[check_id]
+        with scene_backend.get_backend().undo_chunk(spec.fix_label):
+            with self.profiler.measure(check_id, "fix"):
+                spec.fix()
+        model_check_funcs.results.mark_stale()
+
+    def show_profile(self) -> None:
+        """This function displays the measurements of the last run in PlainTextEdit."""
+        self.information_plaintextedit.setPlainText(self.profiler.summary())
+
+    def export_profile(self) -> None:
+        """This function exports the measurements as json or as Chrome trace events."""
+        file_path, file_filter = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Export Profile",
+            "model_check_profile.json",
+            "Profile JSON (*.json);;Chrome Trace (*.json)",
+        )
+        if not file_path:
+            return
+        if file_filter.startswith("Chrome Trace"):
+            self.profiler.export_chrome_trace(file_path)
+        else:
+            self.profiler.export_json(file_path)
 
-    def start_thread(self) -> None:
+    def update_progress_bar(self, value: int) -> None:
         """
-        This function is to start the progress bar.
+        This function sets the value reported by the check thread.
+        Args:
+            value(int) : Percent of the scheduled check work done.
+
+        Returns:
 
-        :return:
         """
-        self.thread.start()
+        self.check_asset_progress_bar.setValue(value)
 
-    def update_progress_bar(self, value: int) -> None:
+    def update_progress_status(self, status: str) -> None:
         """
-        This function sets the value with the help of start_thread funciton.
+        This function shows checks done, nodes processed and ETA on the progress bar.
         Args:
-            value(int) :
+            status(str) : Status text reported by the check thread.
 
         Returns:
 
         """
-        self.check_asset_progress_bar.setValue(value)
+        self.check_asset_progress_bar.setFormat(f"%p%  {status}")
 
     # pylint: disable=invalid-name
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """This function closes the application event."""
+        self.live_validator.stop()
         event.accept()
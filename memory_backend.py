@@ -0,0 +1,817 @@
+"""Modules to hold a scene in python memory, a stand-in for the Maya session.
+
+The scene covers what the checks read: the dag, node types, transforms, pivots,
+visibility, mesh topology, uvs, construction history and namespaces. Checks run
+on it without Maya, eg: in CI or in benchmark loops.
+
+    scene = memory_backend.MemoryScene()
+    group = scene.create_transform("asset_grp")
+    scene.create_mesh("geo", memory_backend.MemoryMesh.cube(), parent=group)
+    scene.select([group.path])
+    scene_backend.set_backend(memory_backend.MemoryBackend(scene))
+"""
+import contextlib
+import uuid
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# pylint: disable=import-error
+import mesh_engine
+import scene_backend
+from scene_backend import DagNodeInfo, MeshUvs, SceneBackend
+from visibility_engine import VISIBILITY_PLUGS
+
+# parent type of every known node type, a subset of the Maya type tree
+TYPE_PARENTS: Dict[str, Optional[str]] = {
+    "dagNode": None,
+    "transform": "dagNode",
+    "shape": "dagNode",
+    "surfaceShape": "shape",
+    "mesh": "surfaceShape",
+    "camera": "shape",
+    "stereoRigCamera": "camera",
+    "constraint": "transform",
+    "aimConstraint": "constraint",
+    "orientConstraint": "constraint",
+    "parentConstraint": "constraint",
+    "pointConstraint": "constraint",
+    "scaleConstraint": "constraint",
+    "expression": None,
+    "animCurve": None,
+    "animCurveTA": "animCurve",
+    "animCurveTL": "animCurve",
+    "animCurveTU": "animCurve",
+    "displayLayer": None,
+    "renderLayer": None,
+    "renderSetupLayer": None,
+    "unknown": None,
+    "unknownDag": "dagNode",
+    "polyBase": None,
+    "polyCreator": "polyBase",
+    "polyCube": "polyCreator",
+    "polyModifier": "polyBase",
+    "polyDelEdge": "polyModifier",
+    "polyTweakUV": "polyModifier",
+    "geometryFilter": None,
+    "tweak": "geometryFilter",
+    "skinCluster": "geometryFilter",
+    "blendShape": "geometryFilter",
+    "groupParts": None,
+    "groupId": None,
+    "VRayLightRectShape": "shape",
+    "VRayLightSphereShape": "shape",
+    "VRayLightDomeShape": "shape",
+    "VRayLightIESShape": "shape",
+    "VRayLightMesh": "shape",
+    "VRaySunShape": "shape",
+    "VRaySunTarget": "transform",
+}
+
+# attributes with X, Y and Z children
+VECTOR_ATTRIBUTES = ("translate", "rotate", "scale", "rotatePivot", "scalePivot")
+AXES = {"X": 0, "Y": 1, "Z": 2}
+
+# cameras and layers of a new Maya scene
+DEFAULT_CAMERAS = ("persp", "top", "front", "side")
+DEFAULT_NAMESPACES = ("UI", "shared")
+
+
+def inherited_types(type_name: str) -> List[str]:
+    """This function lists a node type and the types it derives from, root first.
+
+    Args:
+        type_name (str): Node type name eg: "stereoRigCamera".
+
+    Returns:
+        List of type names eg: ['dagNode', 'shape', 'camera', 'stereoRigCamera']
+
+    """
+    types = []
+    current: Optional[str] = type_name
+    while current is not None:
+        types.append(current)
+        current = TYPE_PARENTS.get(current)
+    return types[::-1]
+
+
+class UvSet(NamedTuple):
+    """Uvs of a mesh.
+
+    Attributes:
+        u (np.ndarray): U coordinate of every uv.
+        v (np.ndarray): V coordinate of every uv.
+        uv_ids (np.ndarray): Uv of every face vertex, in face_indices order.
+    """
+
+    u: np.ndarray
+    v: np.ndarray
+    uv_ids: np.ndarray
+
+
+# pylint: disable=too-few-public-methods
+class MemoryMesh:
+    """Polygon topology, point positions and uv sets of a mesh shape."""
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        face_counts: np.ndarray,
+        face_indices: np.ndarray,
+        uv_sets: Optional[Dict[str, UvSet]] = None,
+    ) -> None:
+        """This function stores the mesh arrays.
+
+        Args:
+            points (np.ndarray): (N, 3) vertex positions.
+            face_counts (np.ndarray): Number of vertices of every face.
+            face_indices (np.ndarray): Vertices of all the faces, face after face.
+            uv_sets (Dict[str, UvSet]): Uv sets by name, the first is current.
+        """
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.face_counts = np.asarray(face_counts, dtype=np.int32)
+        self.face_indices = np.asarray(face_indices, dtype=np.int32)
+        self.uv_sets = dict(uv_sets or {})
+        self.current_uv_set = next(iter(self.uv_sets), "")
+
+    @classmethod
+    def cube(cls, size: float = 1.0) -> "MemoryMesh":
+        """This function returns a cube laid out like polyCube, every face mapped
+        to the 0-1 uv square.
+
+        Args:
+            size (float): Width of the cube.
+
+        Returns:
+            MemoryMesh of the cube.
+
+        """
+        half = size / 2.0
+        points = np.array(
+            [
+                (-half, -half, half),
+                (half, -half, half),
+                (-half, half, half),
+                (half, half, half),
+                (-half, half, -half),
+                (half, half, -half),
+                (-half, -half, -half),
+                (half, -half, -half),
+            ]
+        )
+        face_indices = np.array(
+            [0, 1, 3, 2, 2, 3, 5, 4, 4, 5, 7, 6, 6, 7, 1, 0, 1, 7, 5, 3, 6, 0, 2, 4]
+        )
+        face_counts = np.full(6, 4)
+        return cls(points, face_counts, face_indices, {"map1": face_uvs(face_counts)})
+
+    def face_count(self) -> int:
+        """This function returns the number of faces."""
+        return len(self.face_counts)
+
+    def uv_set(self) -> Optional[UvSet]:
+        """This function returns the current uv set, None for meshes without uvs."""
+        return self.uv_sets.get(self.current_uv_set)
+
+
+def face_uvs(face_counts: np.ndarray) -> UvSet:
+    """This function maps every face to its own 0-1 uv square, corners in order.
+
+    Args:
+        face_counts (np.ndarray): Number of vertices of every face.
+
+    Returns:
+        UvSet with one uv per face vertex.
+
+    """
+    corners_u = np.array([0.0, 1.0, 1.0, 0.0])
+    corners_v = np.array([0.0, 0.0, 1.0, 1.0])
+    face_starts = np.repeat(np.cumsum(face_counts) - face_counts, face_counts)
+    corner = (np.arange(int(np.sum(face_counts))) - face_starts) % 4
+    return UvSet(
+        corners_u[corner], corners_v[corner], np.arange(len(corner), dtype=np.int32)
+    )
+
+
+# pylint: disable=too-many-instance-attributes
+class MemoryNode:
+    """A node of the memory scene, dag nodes have a parent and children."""
+
+    def __init__(self, name: str, node_type: str, dag: bool) -> None:
+        self.name = name
+        self.node_type = node_type
+        self.dag = dag
+        self.uuid = str(uuid.uuid4()).upper()
+        self.parent: Optional["MemoryNode"] = None
+        self.children: List["MemoryNode"] = []
+        self.mesh: Optional[MemoryMesh] = None
+        # history nodes upstream of a shape
+        self.history: List["MemoryNode"] = []
+        self.shading_group = ""
+        # display layer whose visibility drives the drawing override
+        self.display_layer: Optional["MemoryNode"] = None
+        # False once the node is deleted from the scene
+        self.alive = True
+        self.types = inherited_types(node_type)
+        self.attrs: Dict[str, Any] = {}
+        if "transform" in self.types:
+            self.attrs.update(
+                translate=np.zeros(3),
+                rotate=np.zeros(3),
+                scale=np.ones(3),
+                rotatePivot=np.zeros(3),
+                scalePivot=np.zeros(3),
+            )
+        if dag or "displayLayer" in self.types:
+            self.attrs["visibility"] = True
+        if dag:
+            self.attrs.update(
+                lodVisibility=True, overrideEnabled=False, overrideVisibility=True
+            )
+        if "shape" in self.types:
+            self.attrs["intermediateObject"] = False
+
+    @property
+    def path(self) -> str:
+        """Full dag path of dag nodes, the name of dependency nodes."""
+        if not self.dag:
+            return self.name
+        names = []
+        node: Optional[MemoryNode] = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(names))
+
+    def is_a(self, type_name: str) -> bool:
+        """This function returns whether the node is of the type or derives from it."""
+        return type_name in self.types
+
+    def walk(self) -> Iterator["MemoryNode"]:
+        """This function yields the node and its descendents depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def local_matrix(self) -> np.ndarray:
+        """This function returns the 4x4 matrix of the transform values, for row
+        vectors like Maya. Pivots do not move the geometry in the memory scene."""
+        matrix = np.identity(4)
+        if "translate" not in self.attrs:
+            return matrix
+        cos_x, cos_y, cos_z = np.cos(np.radians(self.attrs["rotate"]))
+        sin_x, sin_y, sin_z = np.sin(np.radians(self.attrs["rotate"]))
+        rotate_x = np.array([[1, 0, 0], [0, cos_x, sin_x], [0, -sin_x, cos_x]])
+        rotate_y = np.array([[cos_y, 0, -sin_y], [0, 1, 0], [sin_y, 0, cos_y]])
+        rotate_z = np.array([[cos_z, sin_z, 0], [-sin_z, cos_z, 0], [0, 0, 1]])
+        matrix[:3, :3] = np.diag(self.attrs["scale"]) @ rotate_x @ rotate_y @ rotate_z
+        matrix[3, :3] = self.attrs["translate"]
+        return matrix
+
+
+def _transform_points(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Helper function to multiply (N, 3) points by a 4x4 matrix."""
+    return points @ matrix[:3, :3] + matrix[3, :3]
+
+
+# pylint: disable=too-many-instance-attributes
+class MemoryScene:
+    """Nodes, selection and scene settings of a scene held in memory."""
+
+    def __init__(self, default_nodes: bool = True) -> None:
+        """This function creates an empty scene.
+
+        Args:
+            default_nodes (bool): Create the cameras and layers of a new Maya scene.
+        """
+        self.nodes: List[MemoryNode] = []
+        self.selection: List[str] = []
+        self.namespaces: List[str] = list(DEFAULT_NAMESPACES)
+        self.wireframe_on_shaded = False
+        self.smooth_preview = False
+        # names of the undo chunks the edits were grouped in
+        self.undo_chunks: List[str] = []
+        # callbacks of MemoryBackend.watch_changes(), called on every edit
+        self.watchers: List[scene_backend.ChangeCallback] = []
+        # lookup tables, rebuilt after nodes are created, renamed or deleted
+        self._by_path: Optional[Dict[str, MemoryNode]] = None
+        self._by_name: Dict[str, List[MemoryNode]] = {}
+        if default_nodes:
+            for camera in DEFAULT_CAMERAS:
+                transform = self.create_transform(camera)
+                self.create_node("camera", f"{camera}Shape", parent=transform)
+            self.create_node("displayLayer", "defaultLayer")
+            self.create_node("renderLayer", "defaultRenderLayer")
+
+    # Building
+    def create_node(
+        self, node_type: str, name: str, parent: Optional[MemoryNode] = None
+    ) -> MemoryNode:
+        """This function creates a node, dag types are created under the parent.
+
+        Args:
+            node_type (str): Node type name eg: "expression".
+            name (str): Short name of the node, may carry a namespace "ns:name".
+            parent (MemoryNode): Parent of dag nodes, None for the world.
+
+        Returns:
+            The created node.
+
+        """
+        node = MemoryNode(name, node_type, "dagNode" in inherited_types(node_type))
+        if parent is not None:
+            node.parent = parent
+            parent.children.append(node)
+        self.nodes.append(node)
+        self._by_path = None
+        self.notify(scene_backend.NODE_ADDED, node)
+        if parent is not None:
+            self.notify(scene_backend.DAG_CHANGED, node, parent.uuid)
+        return node
+
+    def create_transform(
+        self, name: str, parent: Optional[MemoryNode] = None
+    ) -> MemoryNode:
+        """This function creates an empty group."""
+        return self.create_node("transform", name, parent)
+
+    def create_mesh(
+        self,
+        name: str,
+        mesh: MemoryMesh,
+        parent: Optional[MemoryNode] = None,
+        history: Sequence[str] = (),
+    ) -> MemoryNode:
+        """This function creates a mesh transform and its shape.
+
+        Args:
+            name (str): Name of the transform, the shape is named f"{name}Shape".
+            mesh (MemoryMesh): Geometry of the shape.
+            parent (MemoryNode): Parent group.
+            history (Sequence[str]): Types of the history nodes connected to the
+                shape eg: ("polyCube",).
+
+        Returns:
+            The mesh transform.
+
+        """
+        transform = self.create_transform(name, parent)
+        shape = self.create_node("mesh", f"{name}Shape", transform)
+        shape.mesh = mesh
+        for type_name in history:
+            shape.history.append(
+                self.create_node(type_name, f"{type_name}{len(self.nodes)}")
+            )
+        return transform
+
+    def create_display_layer(
+        self, name: str, members: Sequence[MemoryNode], visible: bool = True
+    ) -> MemoryNode:
+        """This function creates a display layer driving the drawing override of
+        its members, like editDisplayLayerMembers."""
+        layer = self.create_node("displayLayer", name)
+        layer.attrs["visibility"] = visible
+        for node in members:
+            node.display_layer = layer
+        return layer
+
+    def select(self, names: Sequence[str]) -> None:
+        """This function replaces the selection."""
+        self.selection = list(names)
+
+    def notify(self, event: str, node: MemoryNode, detail: str = "") -> None:
+        """This function reports an edit to the watchers, like Maya messages.
+
+        Args:
+            event (str): Event eg: scene_backend.ATTRIBUTE_CHANGED.
+            node (MemoryNode): Edited node.
+            detail (str): Attribute name or uuid of the new parent.
+        """
+        for watcher in list(self.watchers):
+            watcher(event, node.uuid, detail)
+
+    # Lookups
+    def _index(self) -> Dict[str, MemoryNode]:
+        """Helper function to return the nodes by long name, rebuilt when needed."""
+        if self._by_path is None:
+            self._by_path = {}
+            self._by_name = {}
+            for node in self.nodes:
+                self._by_path[node.path] = node
+                self._by_name.setdefault(node.name, []).append(node)
+        return self._by_path
+
+    def find(self, name: str) -> MemoryNode:
+        """This function returns a node from its long, partial or short name.
+
+        Args:
+            name (str): Name of the node eg: "|grp|geo", "grp|geo" or "geo".
+
+        Returns:
+            The node.
+
+        Raises:
+            ValueError: No node or more than one node matches the name, like Maya.
+
+        """
+        by_path = self._index()
+        if name in by_path:
+            return by_path[name]
+        matches = [
+            node
+            for node in self._by_name.get(name.rsplit("|", 1)[-1], [])
+            if node.path.endswith("|" + name) or node.path == name
+        ]
+        if len(matches) != 1:
+            raise ValueError(f"No object matches name: {name}")
+        return matches[0]
+
+    def dag_roots(self) -> List[MemoryNode]:
+        """This function returns the world level dag nodes."""
+        return [node for node in self.nodes if node.dag and node.parent is None]
+
+    # Editing
+    def delete(self, nodes: Sequence[MemoryNode]) -> None:
+        """This function deletes nodes, dag nodes with their descendents and the
+        history of their shapes."""
+        for node in nodes:
+            if not node.alive:
+                continue
+            for dag_node in node.walk():
+                dag_node.alive = False
+                self.notify(scene_backend.NODE_REMOVED, dag_node)
+                for history_node in dag_node.history:
+                    history_node.alive = False
+                    self.notify(scene_backend.NODE_REMOVED, history_node)
+            if node.parent is not None:
+                node.parent.children.remove(node)
+        self.nodes = [node for node in self.nodes if node.alive]
+        self._by_path = None
+
+    def rename(self, node: MemoryNode, name: str) -> None:
+        """This function renames a node, its uuid is kept."""
+        node.name = name
+        self._by_path = None
+        self.notify(scene_backend.NODE_RENAMED, node)
+
+    def reparent(self, node: MemoryNode, parent: Optional[MemoryNode]) -> None:
+        """This function moves a dag node under another parent, None for the world."""
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+        self._by_path = None
+        self.notify(scene_backend.DAG_CHANGED, node, parent.uuid if parent else "")
+
+    def bounding_box(
+        self,
+        node: MemoryNode,
+        cache: Optional[Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]]] = None,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """This function returns the object space bounding box of a dag node and
+        its descendents.
+
+        Args:
+            node (MemoryNode): Dag node.
+            cache (Dict): Bounding boxes by uuid shared by the calls of one read,
+                so nested groups are measured once.
+
+        Returns:
+            Minimum and maximum corners, None when there is no geometry below.
+
+        """
+        if cache is not None and node.uuid in cache:
+            return cache[node.uuid]
+        corners = []
+        for child in node.children:
+            if child.mesh is not None:
+                if len(child.mesh.points) and not child.attrs["intermediateObject"]:
+                    corners.append(child.mesh.points)
+            elif child.is_a("transform"):
+                child_box = self.bounding_box(child, cache)
+                if child_box is not None:
+                    box_corners = np.array(
+                        [
+                            [child_box[x][0], child_box[y][1], child_box[z][2]]
+                            for x in (0, 1)
+                            for y in (0, 1)
+                            for z in (0, 1)
+                        ]
+                    )
+                    corners.append(_transform_points(box_corners, child.local_matrix()))
+        bounding_box = None
+        if corners:
+            points = np.concatenate(corners)
+            bounding_box = points.min(axis=0), points.max(axis=0)
+        if cache is not None:
+            cache[node.uuid] = bounding_box
+        return bounding_box
+
+    def freeze(self, node: MemoryNode) -> None:
+        """This function bakes a transform and its descendent transforms into the
+        geometry below, like makeIdentity(apply=True)."""
+        stack = [(node, node.local_matrix())]
+        while stack:
+            transform, matrix = stack.pop()
+            for child in transform.children:
+                if child.mesh is not None:
+                    child.mesh.points = _transform_points(child.mesh.points, matrix)
+                    self.notify(scene_backend.ATTRIBUTE_CHANGED, child, "pnts")
+                elif child.is_a("transform"):
+                    stack.append((child, child.local_matrix() @ matrix))
+            for pivot in ("rotatePivot", "scalePivot"):
+                transform.attrs[pivot] = _transform_points(
+                    transform.attrs[pivot][np.newaxis], matrix
+                )[0]
+            transform.attrs.update(
+                translate=np.zeros(3), rotate=np.zeros(3), scale=np.ones(3)
+            )
+            for attribute in ("translate", "rotate", "scale", "rotatePivot"):
+                self.notify(scene_backend.ATTRIBUTE_CHANGED, transform, attribute)
+
+
+def _split_attr(node_attr: str) -> Tuple[str, str]:
+    """Helper function to split "node.attribute" into node and attribute names."""
+    node, _, attribute = node_attr.rpartition(".")
+    return node, attribute
+
+
+# pylint: disable=too-many-public-methods
+class MemoryBackend(SceneBackend):
+    """Backend of a MemoryScene, handles are MemoryNode objects."""
+
+    def __init__(self, scene: Optional[MemoryScene] = None) -> None:
+        self.scene = scene if scene is not None else MemoryScene()
+
+    def selected_hierarchy(
+        self, roots: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Any], List[DagNodeInfo]]:
+        nodes = []
+        infos = []
+        for name in self.scene.selection if roots is None else roots:
+            root = self.scene.find(name)
+            if not root.dag:
+                continue
+            for node in root.walk():
+                nodes.append(node)
+                infos.append(
+                    DagNodeInfo(
+                        node.path,
+                        node.node_type,
+                        node.uuid,
+                        node.is_a("transform"),
+                        node.is_a("shape"),
+                        node.is_a("mesh"),
+                        bool(node.attrs.get("intermediateObject", False)),
+                    )
+                )
+        return nodes, infos
+
+    def read_transforms(self, handles: Sequence[Any]) -> np.ndarray:
+        values = np.empty((len(handles), 9), dtype=np.float64)
+        for row, node in enumerate(handles):
+            values[row, 0:3] = node.attrs["translate"]
+            values[row, 3:6] = node.attrs["rotate"]
+            values[row, 6:9] = node.attrs["scale"]
+        return values
+
+    def read_pivots(
+        self, handles: Sequence[Any]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rotate_pivots = np.empty((len(handles), 3), dtype=np.float64)
+        scale_pivots = np.empty((len(handles), 3), dtype=np.float64)
+        centers = np.zeros((len(handles), 3), dtype=np.float64)
+        cache: Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        for row, node in enumerate(handles):
+            rotate_pivots[row] = node.attrs["rotatePivot"]
+            scale_pivots[row] = node.attrs["scalePivot"]
+            bounding_box = self.scene.bounding_box(node, cache)
+            if bounding_box is not None:
+                centers[row] = (bounding_box[0] + bounding_box[1]) / 2.0
+        return rotate_pivots, scale_pivots, centers
+
+    def list_nodes_with_types(self) -> List[str]:
+        names_and_types = []
+        for node in self.scene.nodes:
+            names_and_types.extend((node.path, node.node_type))
+        return names_and_types
+
+    def inherited_types(self, type_name: str) -> List[str]:
+        return inherited_types(type_name)
+
+    def read_history(self, handles: Sequence[Any]) -> List[List[Tuple[str, str]]]:
+        return [
+            [(history.name, history.node_type) for history in node.history]
+            for node in handles
+        ]
+
+    def read_visibility(self, handles: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        plugs = np.ones((len(handles), len(VISIBILITY_PLUGS)), dtype=bool)
+        layer_driven = np.zeros(len(handles), dtype=bool)
+        for row, node in enumerate(handles):
+            plugs[row] = [node.attrs[plug] for plug in VISIBILITY_PLUGS]
+            layer = node.display_layer
+            if layer is not None and layer.alive:
+                plugs[row, 2:] = True, layer.attrs["visibility"]
+                layer_driven[row] = True
+        return plugs, layer_driven
+
+    def get_attr(self, node_attr: str) -> Any:
+        node_name, attribute = _split_attr(node_attr)
+        attrs = self.scene.find(node_name).attrs
+        if attribute in attrs:
+            value = attrs[attribute]
+            return [tuple(value)] if isinstance(value, np.ndarray) else value
+        if attribute[:-1] in VECTOR_ATTRIBUTES and attribute[-1] in AXES:
+            return float(attrs[attribute[:-1]][AXES[attribute[-1]]])
+        raise ValueError(f"No object matches name: {node_attr}")
+
+    def read_mesh_topology(
+        self, handles: Sequence[Any]
+    ) -> List[Tuple[np.ndarray, np.ndarray, int]]:
+        return [
+            (node.mesh.face_counts, node.mesh.face_indices, len(node.mesh.points))
+            for node in handles
+        ]
+
+    def read_mesh_points(self, handles: Sequence[Any]) -> List[np.ndarray]:
+        return [node.mesh.points for node in handles]
+
+    def read_mesh_uvs(self, handles: Sequence[Any]) -> List[MeshUvs]:
+        meshes_uvs = []
+        for node in handles:
+            mesh = node.mesh
+            meshes_uvs.append(
+                {
+                    name: (
+                        uv_set.u,
+                        uv_set.v,
+                        mesh_engine.uv_shell_ids(
+                            mesh.face_counts, uv_set.uv_ids, len(uv_set.u)
+                        ),
+                    )
+                    for name, uv_set in mesh.uv_sets.items()
+                }
+            )
+        return meshes_uvs
+
+    def namespaces(self) -> List[str]:
+        return list(self.scene.namespaces)
+
+    def wireframe_on_shaded(self) -> bool:
+        return self.scene.wireframe_on_shaded
+
+    def top_groups(self) -> List[str]:
+        return [
+            node.path
+            for node in self.scene.dag_roots()
+            if node.name not in DEFAULT_CAMERAS
+        ]
+
+    def node_paths(self, uuids: Sequence[str]) -> List[str]:
+        by_uuid = {node.uuid: node for node in self.scene.nodes if node.alive}
+        return [
+            by_uuid[node_uuid].path if node_uuid in by_uuid else ""
+            for node_uuid in uuids
+        ]
+
+    def watch_changes(
+        self, handles: Sequence[Any], on_change: scene_backend.ChangeCallback
+    ) -> Any:
+        watched = {node.uuid for node in handles}
+        # like Maya node messages, edits of a node are only reported when the
+        # node is watched, added, removed and moved nodes always are
+        scene_wide = (
+            scene_backend.NODE_ADDED,
+            scene_backend.NODE_REMOVED,
+            scene_backend.DAG_CHANGED,
+        )
+
+        def watcher(event: str, node_uuid: str, detail: str) -> None:
+            if event in scene_wide or node_uuid in watched:
+                on_change(event, node_uuid, detail)
+
+        self.scene.watchers.append(watcher)
+        return watcher
+
+    def unwatch_changes(self, watch: Any) -> None:
+        if watch in self.scene.watchers:
+            self.scene.watchers.remove(watch)
+
+    def open_file(self, path: str) -> None:
+        raise RuntimeError(f"The memory scene cannot open {path}")
+
+    def new_scene(self) -> None:
+        self.scene = MemoryScene()
+
+    @contextlib.contextmanager
+    def undo_chunk(self, name: str) -> Iterator[None]:
+        self.scene.undo_chunks.append(name)
+        yield
+
+    def select(self, nodes: Sequence[str]) -> None:
+        self.scene.select(nodes)
+
+    def parents(self, nodes: Sequence[str]) -> List[str]:
+        parents = []
+        for name in nodes:
+            node = self.scene.find(name)
+            if node.parent is not None:
+                parents.append(node.parent.path)
+        return parents
+
+    def delete(self, nodes: Sequence[str]) -> None:
+        # look every node up first, deleting a group deletes its descendents
+        self.scene.delete([self.scene.find(name) for name in nodes])
+
+    def zero_pivots(self, nodes: Sequence[str]) -> None:
+        for name in nodes:
+            node = self.scene.find(name)
+            node.attrs.update(rotatePivot=np.zeros(3), scalePivot=np.zeros(3))
+            self.scene.notify(scene_backend.ATTRIBUTE_CHANGED, node, "rotatePivot")
+
+    def center_pivots(self, nodes: Sequence[str]) -> None:
+        # moving pivots keeps the geometry, the bounding boxes stay valid
+        cache: Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        for name in nodes:
+            node = self.scene.find(name)
+            bounding_box = self.scene.bounding_box(node, cache)
+            center = (
+                np.zeros(3)
+                if bounding_box is None
+                else (bounding_box[0] + bounding_box[1]) / 2.0
+            )
+            node.attrs.update(rotatePivot=center.copy(), scalePivot=center.copy())
+            self.scene.notify(scene_backend.ATTRIBUTE_CHANGED, node, "rotatePivot")
+
+    def delete_history(
+        self, nodes: Sequence[str], keep_deformers: bool = False
+    ) -> None:
+        history = []
+        for name in nodes:
+            node = self.scene.find(name)
+            for shape in [node] + node.children:
+                kept = [
+                    history_node
+                    for history_node in shape.history
+                    if keep_deformers and history_node.is_a("geometryFilter")
+                ]
+                history.extend(
+                    history_node
+                    for history_node in shape.history
+                    if history_node not in kept
+                )
+                if len(kept) != len(shape.history):
+                    self.scene.notify(scene_backend.CONNECTION_CHANGED, shape)
+                shape.history = kept
+        self.scene.delete(history)
+
+    def freeze_transforms(self, nodes: Sequence[str]) -> None:
+        for name in nodes:
+            self.scene.freeze(self.scene.find(name))
+
+    def set_attr(self, node_attr: str, value: Any) -> None:
+        node_name, attribute = _split_attr(node_attr)
+        node = self.scene.find(node_name)
+        attrs = node.attrs
+        if attribute in VECTOR_ATTRIBUTES:
+            attrs[attribute] = np.array(value, dtype=np.float64).reshape(3)
+        elif attribute[:-1] in VECTOR_ATTRIBUTES and attribute[-1] in AXES:
+            attrs[attribute[:-1]][AXES[attribute[-1]]] = value
+        elif attribute in attrs:
+            attrs[attribute] = type(attrs[attribute])(value)
+        else:
+            raise ValueError(f"No object matches name: {node_attr}")
+        self.scene.notify(scene_backend.ATTRIBUTE_CHANGED, node, attribute)
+
+    def clear_render_setup(self) -> None:
+        self.scene.delete(
+            [node for node in self.scene.nodes if node.is_a("renderSetupLayer")]
+        )
+
+    def set_wireframe_on_shaded(self, state: bool) -> None:
+        self.scene.wireframe_on_shaded = state
+
+    def reset_display_smoothness(self) -> None:
+        self.scene.smooth_preview = False
+
+    def remove_namespace(self, namespace: str) -> None:
+        if namespace not in self.scene.namespaces:
+            raise RuntimeError(f"Namespace {namespace} does not exist")
+        prefix = f"{namespace}:"
+        for node in self.scene.nodes:
+            if node.name.startswith(prefix):
+                self.scene.rename(node, node.name[len(prefix) :])
+        self.scene.namespaces.remove(namespace)
+
+    def assign_shading_group(self, nodes: Sequence[str], shading_group: str) -> None:
+        for name in nodes:
+            self.scene.find(name).shading_group = shading_group
+
+    def delete_unused_shading_nodes(self) -> None:
+        # shading networks are not part of the memory scene, shapes only keep
+        # the name of their shading group
+        return None
@@ -0,0 +1,363 @@
+"""Modules to analyse mesh topology read in batches by the scene backend."""
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+
+
+class MeshTopology(NamedTuple):
+    """Polygon connectivity of a mesh as returned by MFnMesh.getVertices().
+
+    Attributes:
+        face_counts (np.ndarray): Number of vertices of every face.
+        face_indices (np.ndarray): Vertices of all the faces, face after face.
+        vertex_count (int): Number of vertices of the mesh.
+    """
+
+    face_counts: np.ndarray
+    face_indices: np.ndarray
+    vertex_count: int
+
+
+class MeshBatch(NamedTuple):
+    """Topology of many meshes read in one pass.
+
+    Attributes:
+        paths (List[str]): Names the components are addressed with, the mesh
+            transform or the shape when the transform has several meshes.
+        topologies (List[MeshTopology]): Topology of every mesh.
+    """
+
+    paths: List[str]
+    topologies: List[MeshTopology]
+
+
+class UvShellBounds(NamedTuple):
+    """Uv bounding box of every uv shell of a uv set.
+
+    Attributes:
+        uv_set (str): Name of the uv set.
+        minimum (np.ndarray): (S, 2) smallest u and v of every shell.
+        maximum (np.ndarray): (S, 2) largest u and v of every shell.
+    """
+
+    uv_set: str
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+
+class NonManifoldReport(NamedTuple):
+    """Non-manifold components of a mesh.
+
+    Attributes:
+        vertices (np.ndarray): Non-manifold vertices, on a non-manifold edge or
+            joining faces which share no edge (bow-tie).
+        edges (np.ndarray): (N, 2) vertex pairs of the edges shared by more than
+            two faces.
+        lamina_faces (np.ndarray): Faces which share all their vertices with
+            another face.
+    """
+
+    vertices: np.ndarray
+    edges: np.ndarray
+    lamina_faces: np.ndarray
+
+
+def face_starts(face_counts: np.ndarray) -> np.ndarray:
+    """This function returns the index of the first face vertex of every face."""
+    return np.cumsum(face_counts) - face_counts
+
+
+def next_corners(face_counts: np.ndarray) -> np.ndarray:
+    """This function returns the following face vertex of every face vertex, the
+    last face vertex of a face is followed by the first one.
+
+    Args:
+        face_counts (np.ndarray): Number of vertices of every face.
+
+    Returns:
+        Face vertex index array.
+
+    """
+    corners = np.arange(int(np.sum(face_counts)), dtype=np.int64) + 1
+    ends = np.cumsum(face_counts) - 1
+    corners[ends] = face_starts(face_counts)
+    return corners
+
+
+def connected_labels(
+    count: int, pairs_a: np.ndarray, pairs_b: np.ndarray
+) -> np.ndarray:
+    """This function labels the connected groups of a graph, the smallest index of
+    a group spreads to all of it.
+
+    Args:
+        count (int): Number of graph nodes.
+        pairs_a (np.ndarray): First node of every link.
+        pairs_b (np.ndarray): Second node of every link.
+
+    Returns:
+        Label of every node, the smallest node index of its group.
+
+    """
+    labels = np.arange(count, dtype=np.int64)
+    while True:
+        previous = labels
+        joined = np.minimum(labels[pairs_a], labels[pairs_b])
+        labels = labels.copy()
+        np.minimum.at(labels, pairs_a, joined)
+        np.minimum.at(labels, pairs_b, joined)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _fan_labels(
+    vertex_of_corner: np.ndarray,
+    corners: np.ndarray,
+    following: np.ndarray,
+    edge_ids: np.ndarray,
+    manifold: np.ndarray,
+) -> np.ndarray:
+    """Helper function to label the face vertices around every vertex by the fan
+    of faces they belong to, face vertices are joined across manifold edges.
+
+    Args:
+        vertex_of_corner (np.ndarray): Vertex of every face vertex.
+        corners (np.ndarray): Start face vertex of every edge use.
+        following (np.ndarray): End face vertex of every edge use.
+        edge_ids (np.ndarray): Edge of every edge use.
+        manifold (np.ndarray): Edges used by exactly two faces.
+
+    Returns:
+        Fan label of every face vertex.
+
+    """
+    uses = np.flatnonzero(manifold[edge_ids])
+    uses = uses[np.argsort(edge_ids[uses], kind="stable")]
+    first, second = uses[0::2], uses[1::2]
+    # the two uses of an edge run in the same or in opposite direction
+    same_start = vertex_of_corner[corners[first]] == vertex_of_corner[corners[second]]
+    pairs_a = np.concatenate([corners[first], following[first]])
+    pairs_b = np.concatenate(
+        [
+            np.where(same_start, corners[second], following[second]),
+            np.where(same_start, following[second], corners[second]),
+        ]
+    )
+    return connected_labels(len(vertex_of_corner), pairs_a, pairs_b)
+
+
+def lamina_faces(topology: MeshTopology) -> np.ndarray:
+    """This function flags the faces which use the same vertices as another face.
+
+    Args:
+        topology (MeshTopology): Mesh to analyse.
+
+    Returns:
+        Sorted face indices.
+
+    """
+    laminas = []
+    starts = face_starts(topology.face_counts)
+    for size in np.unique(topology.face_counts):
+        faces = np.flatnonzero(topology.face_counts == size)
+        if len(faces) < 2:
+            continue
+        keys = np.sort(
+            topology.face_indices[starts[faces][:, np.newaxis] + np.arange(size)],
+            axis=1,
+        )
+        order = np.lexsort(keys.T[::-1])
+        sorted_keys = keys[order]
+        duplicate = np.all(sorted_keys[1:] == sorted_keys[:-1], axis=1)
+        flagged = np.zeros(len(faces), dtype=bool)
+        flagged[1:] |= duplicate
+        flagged[:-1] |= duplicate
+        laminas.append(faces[order[flagged]])
+    if not laminas:
+        return np.empty(0, dtype=np.int64)
+    return np.sort(np.concatenate(laminas))
+
+
+def nonmanifold_report(topology: MeshTopology) -> NonManifoldReport:
+    """This function finds the non-manifold vertices, edges and lamina faces of a
+    mesh with sorted edge keys and bincount, without any per face python loop.
+
+    Args:
+        topology (MeshTopology): Mesh to analyse.
+
+    Returns:
+        NonManifoldReport of the mesh.
+
+    """
+    face_indices = topology.face_indices.astype(np.int64)
+    vertex_count = max(topology.vertex_count, int(face_indices.max(initial=-1)) + 1)
+    corners = np.arange(len(face_indices), dtype=np.int64)
+    following = next_corners(topology.face_counts)
+    low = np.minimum(face_indices, face_indices[following])
+    high = np.maximum(face_indices, face_indices[following])
+    keys, edge_ids, edge_faces = np.unique(
+        low * vertex_count + high, return_inverse=True, return_counts=True
+    )
+    edge_ids = edge_ids.reshape(-1)
+    shared = edge_faces > 2
+    edges = np.stack([keys[shared] // vertex_count, keys[shared] % vertex_count], 1)
+
+    # more than one fan of faces around a vertex makes it a bow-tie, every fan
+    # has one face vertex keeping its own index as label
+    labels = _fan_labels(face_indices, corners, following, edge_ids, edge_faces == 2)
+    fans = np.bincount(face_indices[labels == corners], minlength=vertex_count)
+    bow_ties = np.flatnonzero(fans > 1)
+
+    vertices = np.union1d(edges.reshape(-1), bow_ties)
+    return NonManifoldReport(vertices, edges, lamina_faces(topology))
+
+
+def n_sided_faces(topology: MeshTopology, max_sides: int) -> np.ndarray:
+    """This function flags the faces with more sides than allowed.
+
+    Args:
+        topology (MeshTopology): Mesh to analyse.
+        max_sides (int): Most sides a face may have eg: 4.
+
+    Returns:
+        Sorted face indices.
+
+    """
+    return np.flatnonzero(topology.face_counts > max_sides)
+
+
+def concave_quads(topology: MeshTopology, points: np.ndarray) -> np.ndarray:
+    """This function flags the quads with a corner turning against the quad normal.
+
+    Args:
+        topology (MeshTopology): Mesh to analyse.
+        points (np.ndarray): (N, 3) vertex positions.
+
+    Returns:
+        Sorted face indices.
+
+    """
+    quads = np.flatnonzero(topology.face_counts == 4)
+    starts = face_starts(topology.face_counts)[quads]
+    corners = points[topology.face_indices[starts[:, np.newaxis] + np.arange(4)]]
+    # the cross product of the diagonals points along the quad normal
+    normals = np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1])
+    incoming = corners - np.roll(corners, 1, axis=1)
+    outgoing = np.roll(corners, -1, axis=1) - corners
+    turns = np.einsum("qcx,qx->qc", np.cross(incoming, outgoing), normals)
+    return quads[np.any(turns < 0.0, axis=1)]
+
+
+def triangle_count(topology: MeshTopology) -> int:
+    """This function returns the number of triangles of the triangulated mesh."""
+    return int(np.sum(np.maximum(topology.face_counts.astype(np.int64) - 2, 0)))
+
+
+def uv_shell_ids(
+    face_counts: np.ndarray, uv_ids: np.ndarray, uv_count: int
+) -> np.ndarray:
+    """This function groups the uvs into shells, uvs of a face are in one shell.
+
+    Args:
+        face_counts (np.ndarray): Number of vertices of every face.
+        uv_ids (np.ndarray): Uv of every face vertex.
+        uv_count (int): Number of uvs.
+
+    Returns:
+        Shell index of every uv, shells numbered from 0.
+
+    """
+    uv_ids = uv_ids.astype(np.int64)
+    labels = connected_labels(uv_count, uv_ids, uv_ids[next_corners(face_counts)])
+    return np.unique(labels, return_inverse=True)[1].reshape(-1).astype(np.int32)
+
+
+def uv_shell_bounds(
+    uv_set: str, u: np.ndarray, v: np.ndarray, shell_ids: np.ndarray
+) -> UvShellBounds:
+    """This function reduces the uvs of every shell to its bounding box.
+
+    Args:
+        uv_set (str): Name of the uv set.
+        u (np.ndarray): U coordinate of every uv.
+        v (np.ndarray): V coordinate of every uv.
+        shell_ids (np.ndarray): Shell of every uv.
+
+    Returns:
+        UvShellBounds of the uv set.
+
+    """
+    shells = int(shell_ids.max(initial=-1)) + 1
+    coordinates = np.stack([u, v], axis=1).astype(np.float64)
+    minimum = np.full((shells, 2), np.inf)
+    maximum = np.full((shells, 2), -np.inf)
+    np.minimum.at(minimum, shell_ids, coordinates)
+    np.maximum.at(maximum, shell_ids, coordinates)
+    return UvShellBounds(uv_set, minimum, maximum)
+
+
+def negative_uv_shells(bounds: UvShellBounds, tolerance: float) -> np.ndarray:
+    """This function flags the shells reaching below 0 in u or v."""
+    return np.flatnonzero(np.any(bounds.minimum < -tolerance, axis=1))
+
+
+def outside_unit_uv_shells(bounds: UvShellBounds, tolerance: float) -> np.ndarray:
+    """This function flags the shells reaching out of the 0-1 uv square."""
+    return np.flatnonzero(
+        np.any(bounds.minimum < -tolerance, axis=1)
+        | np.any(bounds.maximum > 1.0 + tolerance, axis=1)
+    )
+
+
+def udim_crossing_uv_shells(bounds: UvShellBounds, tolerance: float) -> np.ndarray:
+    """This function flags the shells lying across the border of two UDIM tiles."""
+    first_tiles = np.floor(bounds.minimum + tolerance)
+    last_tiles = np.floor(bounds.maximum - tolerance)
+    # shells narrower than the tolerance sit on a border without crossing it
+    wide = bounds.maximum - bounds.minimum > 2.0 * tolerance
+    return np.flatnonzero(np.any((first_tiles != last_tiles) & wide, axis=1))
+
+
+def component_ranges(indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """This function collapses consecutive component indices into ranges.
+
+    Args:
+        indices (np.ndarray): Sorted component indices.
+
+    Returns:
+        First and last index of every range.
+
+    """
+    if not len(indices):
+        return indices[:0], indices[:0]
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    firsts = indices[np.concatenate([[0], breaks])]
+    lasts = indices[np.concatenate([breaks - 1, [len(indices) - 1]])]
+    return firsts, lasts
+
+
+def range_name(component: str, first: int, last: int) -> str:
+    """This function names a component range eg: "f[3]" or "f[7:12]"."""
+    if first == last:
+        return f"{component}[{first}]"
+    return f"{component}[{first}:{last}]"
+
+
+def component_names(path: str, component: str, indices: np.ndarray) -> List[str]:
+    """This function names components, consecutive indices as one range.
+
+    Args:
+        path (str): Mesh transform or shape.
+        component (str): Component type eg: "vtx", "e" or "f".
+        indices (np.ndarray): Sorted component indices.
+
+    Returns:
+        Component names eg: ['|grp|geo.vtx[3]', '|grp|geo.vtx[7:12]']
+
+    """
+    firsts, lasts = component_ranges(indices)
+    return [
+        f"{path}.{range_name(component, first, last)}"
+        for first, last in zip(firsts, lasts)
+    ]
@@ -0,0 +1,93 @@
+"""Modules to remember the analysis of every mesh by geometry fingerprint."""
+import collections
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+# pylint: disable=import-error
+import constants
+
+
+class MeshMemo:
+    """This class keeps the analyses of meshes by fingerprint across check runs,
+    unchanged, duplicated and instanced meshes are analysed once. The least
+    recently used analyses are dropped over the size limit.
+    """
+
+    def __init__(self, max_entries: int = constants.MESH_MEMO_MAX_ENTRIES) -> None:
+        """This function creates an empty memo.
+
+        Args:
+            max_entries (int): Most analyses kept.
+        """
+        self.max_entries = max_entries
+        self._entries: "collections.OrderedDict[Tuple[str, str], Any]" = (
+            collections.OrderedDict()
+        )
+        # meshes read from the memo and analysed
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """This function forgets every analysis."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def analyse(
+        self,
+        analysis: str,
+        fingerprints: Sequence[str],
+        compute: Callable[[int], Any],
+    ) -> List[Any]:
+        """This function returns the analysis of every mesh, computing it only for
+        fingerprints which are not remembered.
+
+        Args:
+            analysis (str): Name of the analysis with its settings eg:
+                "n_sided_faces:4", analyses with other settings are kept apart.
+            fingerprints (Sequence[str]): Fingerprint of every mesh.
+            compute (Callable[[int], Any]): Analyses the mesh at an index, the
+                returned value is shared, it must not be edited.
+
+        Returns:
+            Analysis of every mesh, in fingerprints order.
+
+        """
+        return list(self.iter_analyses(analysis, fingerprints, compute))
+
+    def iter_analyses(
+        self,
+        analysis: str,
+        fingerprints: Sequence[str],
+        compute: Callable[[int], Any],
+        start: int = 0,
+    ) -> Iterator[Any]:
+        """This function yields the analysis of every mesh like analyse(), a mesh
+        is only analysed once the previous one was used, so a check stopping
+        early leaves the other meshes alone.
+
+        Args:
+            analysis (str): Name of the analysis with its settings.
+            fingerprints (Sequence[str]): Fingerprint of every mesh.
+            compute (Callable[[int], Any]): Analyses the mesh at an index.
+            start (int): Index of the first mesh, eg: to resume a check.
+
+        Yields:
+            Analysis of every mesh from start, in fingerprints order.
+
+        """
+        for idx in range(start, len(fingerprints)):
+            key = (analysis, fingerprints[idx])
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                yield self._entries[key]
+                continue
+            value = compute(idx)
+            self._entries[key] = value
+            self.misses += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            yield value
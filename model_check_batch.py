@@ -0,0 +1,488 @@
+"""Modules to check many scene files headless on a pool of Maya processes.
+
+Run under mayapy from the tool folder:
+    mayapy model_check_batch.py "assets/**/*.ma" --workers 8 --output results.jsonl
+Files are given as paths, glob patterns or manifests with one path per line.
+Every worker initializes Maya once and checks the top groups of the files it is
+given one after the other, a json line is written as soon as a file is checked.
+A worker which crashes or exceeds --timeout only fails the file it was checking,
+a new worker takes its place.
+"""
+import argparse
+import collections
+import glob
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+)
+
+# pylint: disable=import-error
+import check_registry
+import model_check_funcs
+import result_cache
+import scene_backend
+import scene_snapshot
+
+# statuses of a checked file and of its checks
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+CRASHED = "crashed"
+TIMEOUT = "timeout"
+# checks not executed once a gate found a failing check
+SKIPPED = "skipped"
+
+# findings listed per check in a result line, the others are only counted
+MAX_FINDINGS = 100
+# seconds the batch waits for a worker before looking at the timeouts
+POLL_INTERVAL = 0.5
+
+
+def collect_files(patterns: Sequence[str], manifests: Sequence[str] = ()) -> List[str]:
+    """This function lists the files to check.
+
+    Args:
+        patterns (Sequence[str]): File paths or glob patterns, "**" matches
+            folders recursively.
+        manifests (Sequence[str]): Text files with one path or pattern per line,
+            empty lines and lines starting with "#" are skipped.
+
+    Returns:
+        Absolute paths, every file once, in the given order.
+
+    """
+    patterns = list(patterns)
+    for manifest in manifests:
+        with open(manifest, encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    patterns.append(line)
+    files: Dict[str, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for path in matches:
+            files.setdefault(os.path.abspath(path))
+    return list(files)
+
+
+def default_checks() -> List[str]:
+    """This function returns the checks enabled when the tool opens, without the
+    checks of the UI state which mayapy has no viewport for."""
+    return [
+        spec.check_id
+        for spec in check_registry.CHECKS.values()
+        if spec.enabled and spec.headless
+    ]
+
+
+def check_scene(
+    check_ids: Sequence[str],
+    max_findings: int = MAX_FINDINGS,
+    use_cache: bool = False,
+    snapshot: Optional[scene_snapshot.SceneSnapshot] = None,
+    gate: int = 0,
+) -> Dict[str, Any]:
+    """This function executes checks on the top groups of the open scene.
+
+    Args:
+        check_ids (Sequence[str]): Registered checks to execute.
+        max_findings (int): Findings listed per check, the others are counted.
+        use_cache (bool): Read unchanged results from the result cache.
+        snapshot (scene_snapshot.SceneSnapshot): Hierarchy to check instead of
+            the top groups.
+        gate (int): Only tell whether the scene passes: checks stop after this
+            many findings, cheapest first, and the first check with findings
+            skips the others. Checks of the UI state are skipped and a check
+            which cannot run is reported without skipping the others. 0
+            executes every check completely.
+
+    Returns:
+        Report with the overall "status" and, by check id, the "status",
+        "count" and first "findings" of every check or its "error".
+
+    """
+    if snapshot is None:
+        backend = scene_backend.get_backend()
+        groups = backend.top_groups()
+        if groups:
+            backend.select(groups)
+        snapshot = scene_snapshot.SceneSnapshot.from_selection(backend)
+    results = model_check_funcs.results
+    results.clear()
+    model_check_funcs.current_snapshot = snapshot
+    model_check_funcs.finding_limit = gate
+    cache = result_cache.ResultCache(results) if use_cache else None
+    checks: Dict[str, Dict[str, Any]] = {}
+    passing = True
+    try:
+        for spec in check_registry.schedule(check_ids):
+            if gate and (not passing or not spec.headless):
+                checks[spec.check_id] = {"status": SKIPPED}
+                continue
+            check = cache.wrap(spec) if cache is not None else spec.check
+            try:
+                check()
+            # a check failing must not stop the other checks of the file
+            # pylint: disable=broad-except
+            except Exception as error:
+                checks[spec.check_id] = {"status": ERROR, "error": str(error)}
+                continue
+            count = results.count(spec.result_key)
+            checks[spec.check_id] = {
+                "status": FAILED if count else PASSED,
+                "count": count,
+                "findings": results.get(spec.result_key, max_findings),
+            }
+            passing = passing and not count
+    finally:
+        model_check_funcs.current_snapshot = None
+        model_check_funcs.finding_limit = 0
+    statuses = {check["status"] for check in checks.values()}
+    status = FAILED if FAILED in statuses else ERROR if ERROR in statuses else PASSED
+    groups = [snapshot.paths[idx] for idx in snapshot.root_indices()]
+    return {"status": status, "groups": groups, "checks": checks}
+
+
+def check_file(
+    path: str,
+    check_ids: Sequence[str],
+    max_findings: int = MAX_FINDINGS,
+    use_cache: bool = False,
+    gate: int = 0,
+) -> Dict[str, Any]:
+    """This function opens a scene file and checks its top groups.
+
+    Args:
+        path (str): Scene file.
+        check_ids (Sequence[str]): Registered checks to execute.
+        max_findings (int): Findings listed per check, the others are counted.
+        use_cache (bool): Read unchanged results from the result cache.
+        gate (int): Stop at the first findings, see check_scene().
+
+    Returns:
+        Report of check_scene() with the "file" and the "seconds" it took.
+
+    """
+    start = time.perf_counter()
+    try:
+        scene_backend.get_backend().open_file(path)
+    except RuntimeError as error:
+        report: Dict[str, Any] = {"status": ERROR, "error": str(error)}
+    else:
+        report = check_scene(check_ids, max_findings, use_cache, gate=gate)
+    report.update(file=path, seconds=round(time.perf_counter() - start, 3))
+    return report
+
+
+class Job(NamedTuple):
+    """A file sent to a worker.
+
+    Attributes:
+        path (str): Scene file to check.
+        check_ids (List[str]): Registered checks to execute.
+        max_findings (int): Findings listed per check.
+        use_cache (bool): Read unchanged results from the result cache.
+        gate (int): Stop at the first findings, see check_scene().
+    """
+
+    path: str
+    check_ids: List[str]
+    max_findings: int = MAX_FINDINGS
+    use_cache: bool = False
+    gate: int = 0
+
+
+def worker_main(connection: Any) -> None:
+    """This function is the loop of a worker process, it checks the jobs sent
+    through the connection until it receives None. Maya is initialized once and
+    the scene is emptied after every job.
+
+    Args:
+        connection (multiprocessing.connection.Connection): Pipe to the pool.
+    """
+    # pylint: disable=import-outside-toplevel
+    import maya.standalone  # type: ignore
+
+    maya.standalone.initialize(name="python")
+    try:
+        while True:
+            job = connection.recv()
+            if job is None:
+                break
+            report = check_file(*job)
+            # the next job starts from an empty scene, not from this asset
+            scene_backend.get_backend().new_scene()
+            connection.send(report)
+    finally:
+        maya.standalone.uninitialize()
+
+
+class Worker:
+    """A worker process and the job it is checking."""
+
+    def __init__(self, worker_id: int, target: Callable[[Any], None]) -> None:
+        """This function starts a worker process.
+
+        Args:
+            worker_id (int): Number of the worker, reported with its results.
+            target (Callable): Worker loop, see worker_main().
+        """
+        context = multiprocessing.get_context("spawn")
+        self.worker_id = worker_id
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(
+            target=target, args=(worker_connection,), daemon=True
+        )
+        self.process.start()
+        # the worker end only lives in the worker, a crash closes the pipe
+        worker_connection.close()
+        self.job: Optional[Job] = None
+        self.started = 0.0
+        # the worker died before it could read its job
+        self.pipe_failed = False
+
+    def send(self, job: Optional[Job]) -> None:
+        """This function gives a job to the worker, None stops it. A worker which
+        died is reported as crashed by collect()."""
+        self.job = job
+        self.started = time.monotonic()
+        try:
+            self.connection.send(job)
+        except OSError:
+            self.pipe_failed = True
+
+    def collect(
+        self, ready: Sequence[Any], timeout: float = 0.0
+    ) -> Optional[Dict[str, Any]]:
+        """This function reads the report of the current job, the worker is
+        stopped when it crashed or exceeded the timeout.
+
+        Args:
+            ready (Sequence[Any]): Objects returned by
+                multiprocessing.connection.wait() on the connection and sentinel.
+            timeout (float): Seconds the job may take, 0 for no limit.
+
+        Returns:
+            Report of check_file(), a "crashed" or "timeout" report when the
+            worker was stopped, None while the job is running.
+
+        """
+        crashed = self.pipe_failed or self.process.sentinel in ready
+        if self.connection in ready:
+            try:
+                report = self.connection.recv()
+                report["worker"] = self.worker_id
+                return report
+            except (EOFError, OSError):
+                # the worker died, its end of the pipe is closed or reset
+                crashed = True
+        elapsed = time.monotonic() - self.started
+        if not crashed and not (timeout and elapsed > timeout):
+            return None
+        self.stop()
+        return {
+            "status": CRASHED if crashed else TIMEOUT,
+            "error": (
+                f"worker exit code {self.process.exitcode}"
+                if crashed
+                else f"no report after {timeout}s"
+            ),
+            "file": self.job.path if self.job is not None else None,
+            "seconds": round(elapsed, 3),
+            "worker": self.worker_id,
+        }
+
+    def is_stopped(self) -> bool:
+        """This function returns whether the process ended."""
+        return self.process.exitcode is not None
+
+    def stop(self) -> None:
+        """This function ends the worker process whatever it is doing."""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def run_batch(
+    files: Sequence[str],
+    check_ids: Sequence[str],
+    emit: Callable[[Dict[str, Any]], None],
+    workers: int = 0,
+    timeout: float = 0.0,
+    max_findings: int = MAX_FINDINGS,
+    use_cache: bool = False,
+    gate: int = 0,
+    target: Callable[[Any], None] = worker_main,
+) -> List[Dict[str, Any]]:
+    """This function checks files on a pool of worker processes.
+
+    Args:
+        files (Sequence[str]): Scene files to check.
+        check_ids (Sequence[str]): Registered checks to execute.
+        emit (Callable): Called with the report of every file once it is checked.
+        workers (int): Number of worker processes, the number of cores when 0.
+        timeout (float): Seconds a file may take before its worker is stopped,
+            0 for no limit.
+        max_findings (int): Findings listed per check.
+        use_cache (bool): Read unchanged results from the result cache.
+        gate (int): Stop at the first findings, see check_scene().
+        target (Callable): Worker loop, see worker_main().
+
+    Returns:
+        Reports of every file in the order they finished.
+
+    """
+    queued: Deque[Job] = collections.deque(
+        Job(path, list(check_ids), max_findings, use_cache, gate) for path in files
+    )
+    worker_count = max(1, min(workers or os.cpu_count() or 1, len(queued)))
+    reports: List[Dict[str, Any]] = []
+
+    def next_job(worker: Worker) -> None:
+        worker.send(queued.popleft() if queued else None)
+
+    busy = [Worker(worker_id, target) for worker_id in range(worker_count)]
+    for worker in busy:
+        next_job(worker)
+    while busy:
+        ready = multiprocessing.connection.wait(
+            [worker.connection for worker in busy]
+            + [worker.process.sentinel for worker in busy],
+            timeout=POLL_INTERVAL,
+        )
+        for worker in list(busy):
+            if worker.job is None:
+                # told to stop, the worker exits once it is done
+                busy.remove(worker)
+                worker.process.join()
+                continue
+            report = worker.collect(ready, timeout)
+            if report is None:
+                continue
+            reports.append(report)
+            emit(report)
+            if not worker.is_stopped():
+                next_job(worker)
+                continue
+            # a new worker takes the place of the stopped one
+            busy.remove(worker)
+            if queued:
+                replacement = Worker(worker.worker_id, target)
+                busy.append(replacement)
+                next_job(replacement)
+    return reports
+
+
+def summary(reports: Sequence[Dict[str, Any]], seconds: float) -> str:
+    """This function counts the files of every status.
+
+    Args:
+        reports (Sequence[Dict[str, Any]]): Reports of run_batch().
+        seconds (float): Wall time of the batch.
+
+    Returns:
+        Summary line eg: "120 files in 35.2s: 110 passed, 10 failed".
+
+    """
+    counts = collections.Counter(report["status"] for report in reports)
+    statuses = ", ".join(f"{counts[status]} {status}" for status in sorted(counts))
+    return f"{len(reports)} files in {seconds:.1f}s: {statuses}"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """This function parses the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="Scene files or glob patterns.")
+    parser.add_argument(
+        "--manifest",
+        action="append",
+        default=[],
+        help="Text file listing one scene file or pattern per line.",
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        choices=sorted(check_registry.CHECKS),
+        metavar="CHECK",
+        help="Checks to execute, the checks enabled in the UI but the viewport "
+        "ones by default.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Worker processes, 0 for every core."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=0.0, help="Seconds allowed per file."
+    )
+    parser.add_argument("--max-findings", type=int, default=MAX_FINDINGS)
+    parser.add_argument(
+        "--cache", action="store_true", help="Read unchanged results from the cache."
+    )
+    parser.add_argument(
+        "--gate",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Only tell whether files pass: checks stop after K findings and a "
+        "file stops at its first failing check.",
+    )
+    parser.add_argument("--output", help="Write the json lines to this file.")
+    args = parser.parse_args(argv)
+    if not args.files and not args.manifest:
+        parser.error("no scene file given")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """This function checks the files from the command line.
+
+    Returns:
+        Exit code, 1 when a file did not pass.
+
+    """
+    args = parse_args(argv)
+    files = collect_files(args.files, args.manifest)
+    check_ids = args.checks or default_checks()
+    output: TextIO = (
+        open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    )
+
+    def emit(report: Dict[str, Any]) -> None:
+        output.write(json.dumps(report) + "\n")
+        output.flush()
+
+    start = time.perf_counter()
+    try:
+        reports = run_batch(
+            files,
+            check_ids,
+            emit,
+            workers=args.workers,
+            timeout=args.timeout,
+            max_findings=args.max_findings,
+            use_cache=args.cache,
+            gate=args.gate,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(summary(reports, time.perf_counter() - start), file=sys.stderr)
+    return int(any(report["status"] != PASSED for report in reports))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
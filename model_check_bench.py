@@ -0,0 +1,518 @@
+"""Modules to benchmark the model checks and fixes on synthetic scenes.
+
+Run under mayapy from the tool folder:
+    mayapy model_check_bench.py --sizes 100 1000 10000
+or without Maya on the in-memory scene:
+    python model_check_bench.py --backend memory
+The gate mode of the batch tools is verified on clean and defective scenes with:
+    python model_check_bench.py --backend memory --verify-gate
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# scaling exponent of time vs node count above which a function is flagged
+SCALING_EXPONENT_LIMIT = 1.5
+
+
+class SceneSpec(NamedTuple):
+    """Size and defect ratios of a synthetic asset.
+
+    Attributes:
+        transforms (int): Number of transforms, groups and meshes.
+        meshes (int): Number of mesh transforms among them.
+        depth (int): Depth of the group hierarchy.
+        unfrozen (float): Ratio of transforms with translate values.
+        offset_pivots (float): Ratio of transforms with offset pivots.
+        history (float): Ratio of meshes keeping construction history.
+        ngons (float): Ratio of meshes with a n-sided face.
+        hidden (float): Ratio of hidden transforms.
+        negative_uvs (float): Ratio of meshes with uvs in negative space.
+        seed (int): Random seed, the same spec always builds the same scene.
+    """
+
+    transforms: int
+    meshes: int
+    depth: int = 4
+    unfrozen: float = 0.1
+    offset_pivots: float = 0.1
+    history: float = 0.1
+    ngons: float = 0.05
+    hidden: float = 0.05
+    negative_uvs: float = 0.05
+    seed: int = 0
+
+
+class SceneLayout(NamedTuple):
+    """Backend independent description of a synthetic asset.
+
+    Attributes:
+        group_parents (np.ndarray): Parent group of every group, -1 for the root.
+        mesh_parents (np.ndarray): Parent group of every mesh.
+        flags (Dict[str, np.ndarray]): Defect masks, transform masks cover the
+            groups followed by the meshes, mesh masks only the meshes.
+    """
+
+    group_parents: np.ndarray
+    mesh_parents: np.ndarray
+    flags: Dict[str, np.ndarray]
+
+
+def generate_layout(spec: SceneSpec) -> SceneLayout:
+    """This function lays out the hierarchy and the defects of a synthetic asset.
+
+    Args:
+        spec (SceneSpec): Size and defect ratios.
+
+    Returns:
+        SceneLayout of the asset.
+
+    """
+    rng = np.random.default_rng(spec.seed)
+    meshes = min(spec.meshes, spec.transforms - 1)
+    groups = spec.transforms - meshes
+    # children per group so the hierarchy reaches the requested depth
+    fan_out = max(2, math.ceil(groups ** (1.0 / max(spec.depth, 1))))
+    group_parents = (np.arange(groups) - 1) // fan_out
+    group_parents[0] = -1
+    mesh_parents = rng.integers(0, groups, size=meshes)
+    flags = {
+        "unfrozen": rng.random(spec.transforms) < spec.unfrozen,
+        "offset_pivots": rng.random(spec.transforms) < spec.offset_pivots,
+        "hidden": rng.random(spec.transforms) < spec.hidden,
+        "history": rng.random(meshes) < spec.history,
+        "ngons": rng.random(meshes) < spec.ngons,
+        "negative_uvs": rng.random(meshes) < spec.negative_uvs,
+    }
+    # the root group stays clean so the master group checks have a known answer
+    for name in ("unfrozen", "offset_pivots", "hidden"):
+        flags[name][0] = False
+    return SceneLayout(group_parents, mesh_parents, flags)
+
+
+def build_maya_scene(layout: SceneLayout) -> str:
+    """This function builds the synthetic asset in a new Maya scene and selects it.
+
+    Args:
+        layout (SceneLayout): Asset to build.
+
+    Returns:
+        Name of the root group.
+
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    from maya import cmds
+
+    cmds.file(new=True, force=True)
+    groups: List[str] = []
+    for idx, parent in enumerate(layout.group_parents):
+        if parent < 0:
+            groups.append(cmds.group(empty=True, name=f"bench_grp{idx}"))
+        else:
+            groups.append(
+                cmds.group(empty=True, name=f"bench_grp{idx}", parent=groups[parent])
+            )
+    meshes: List[str] = []
+    for idx, parent in enumerate(layout.mesh_parents):
+        mesh = cmds.polyCube(name=f"bench_geo{idx}")[0]
+        if layout.flags["ngons"][idx]:
+            # merging two quads of the cube leaves a six sided face
+            cmds.polyDelEdge(f"{mesh}.e[0]", cleanVertices=False)
+        if layout.flags["negative_uvs"][idx]:
+            cmds.polyEditUV(f"{mesh}.map[*]", uValue=-2.0, relative=True)
+        if not layout.flags["history"][idx]:
+            cmds.delete(mesh, constructionHistory=True)
+        meshes.append(cmds.parent(mesh, groups[parent])[0])
+    transforms = groups + meshes
+    for idx in np.flatnonzero(layout.flags["unfrozen"]):
+        cmds.setAttr(f"{transforms[idx]}.translateX", 1.0 + idx % 7)
+    for idx in np.flatnonzero(layout.flags["offset_pivots"]):
+        cmds.xform(transforms[idx], rotatePivot=(1, 2, 3), scalePivot=(1, 2, 3))
+    for idx in np.flatnonzero(layout.flags["hidden"]):
+        cmds.setAttr(f"{transforms[idx]}.visibility", 0)
+    cmds.select(groups[0])
+    return groups[0]
+
+
+def build_memory_scene(layout: SceneLayout) -> str:
+    """This function builds the synthetic asset in a new memory scene, selects it
+    and makes it the scene the checks read.
+
+    Args:
+        layout (SceneLayout): Asset to build.
+
+    Returns:
+        Name of the root group.
+
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    import memory_backend
+    import scene_backend
+
+    scene = memory_backend.MemoryScene()
+    groups: List[Any] = []
+    for idx, parent in enumerate(layout.group_parents):
+        groups.append(
+            scene.create_transform(
+                f"bench_grp{idx}", groups[parent] if parent >= 0 else None
+            )
+        )
+    meshes: List[Any] = []
+    for idx, parent in enumerate(layout.mesh_parents):
+        mesh = memory_backend.MemoryMesh.cube()
+        history = ["polyCube"]
+        if layout.flags["ngons"][idx]:
+            # the first two quads of the cube merged into a six sided face
+            mesh.face_counts = np.array([6, 4, 4, 4, 4], dtype=np.int32)
+            mesh.face_indices = np.concatenate(
+                [[0, 1, 3, 5, 4, 2], mesh.face_indices[8:]]
+            ).astype(np.int32)
+            mesh.uv_sets["map1"] = memory_backend.face_uvs(mesh.face_counts)
+            history.append("polyDelEdge")
+        if layout.flags["negative_uvs"][idx]:
+            uv_set = mesh.uv_sets["map1"]
+            mesh.uv_sets["map1"] = uv_set._replace(u=uv_set.u - 2.0)
+            history.append("polyTweakUV")
+        meshes.append(
+            scene.create_mesh(
+                f"bench_geo{idx}",
+                mesh,
+                parent=groups[parent],
+                history=history if layout.flags["history"][idx] else (),
+            )
+        )
+    transforms = groups + meshes
+    for idx in np.flatnonzero(layout.flags["unfrozen"]):
+        transforms[idx].attrs["translate"][0] = 1.0 + idx % 7
+    for idx in np.flatnonzero(layout.flags["offset_pivots"]):
+        transforms[idx].attrs["rotatePivot"] = np.array([1.0, 2.0, 3.0])
+        transforms[idx].attrs["scalePivot"] = np.array([1.0, 2.0, 3.0])
+    for idx in np.flatnonzero(layout.flags["hidden"]):
+        transforms[idx].attrs["visibility"] = False
+    scene.select([groups[0].path])
+    scene_backend.set_backend(memory_backend.MemoryBackend(scene))
+    return groups[0].name
+
+
+class BenchResult(NamedTuple):
+    """Measurement of one function on one scene size.
+
+    Attributes:
+        name (str): Name of the check or fix function.
+        nodes (int): Number of transforms of the scene.
+        seconds (float): Wall time.
+        peak_kb (float): Peak python memory allocated during the call.
+    """
+
+    name: str
+    nodes: int
+    seconds: float
+    peak_kb: float
+
+
+def measure(function: Callable[[], Any]) -> Tuple[Dict[str, float], Any]:
+    """This function times a call and records its peak python allocations.
+
+    Args:
+        function (Callable): Function to call.
+
+    Returns:
+        Dict with "seconds" and "peak_kb", and the value the function returned.
+
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        value = function()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": seconds, "peak_kb": peak / 1024}, value
+
+
+def _measure_into(
+    results: List[BenchResult], name: str, nodes: int, function: Callable[[], Any]
+) -> Any:
+    """Helper function to measure a function and keep the result, functions that
+    need the interactive UI (eg: viewport checks under mayapy) are skipped."""
+    try:
+        timing, value = measure(function)
+    except RuntimeError as error:
+        print(f"Skipped {name}: {error}", file=sys.stderr)
+        return None
+    results.append(BenchResult(name, nodes, **timing))
+    return value
+
+
+def run_benchmark(
+    specs: Sequence[SceneSpec],
+    build_scene: Callable[[SceneLayout], str],
+    with_fixes: bool = True,
+) -> List[BenchResult]:
+    """This function times every registered check and fix on every scene size.
+
+    Args:
+        specs (Sequence[SceneSpec]): Scenes to build, usually growing sizes.
+        build_scene (Callable): Builds a layout in the checked scene and selects it.
+        with_fixes (bool): Time the fixes as well, every fix gets a fresh scene.
+
+    Returns:
+        List of BenchResult.
+
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    import check_registry
+    import model_check_funcs
+    import scene_snapshot
+
+    results = []
+    for spec in specs:
+        layout = generate_layout(spec)
+        build_scene(layout)
+        model_check_funcs.results.clear()
+        # every size is timed with cold mesh analyses
+        model_check_funcs.mesh_analyses.clear()
+        model_check_funcs.current_snapshot = _measure_into(
+            results,
+            "scene_snapshot",
+            spec.transforms,
+            scene_snapshot.SceneSnapshot.from_selection,
+        )
+        for spec_check in check_registry.CHECKS.values():
+            _measure_into(
+                results, spec_check.check.__name__, spec.transforms, spec_check.check
+            )
+        model_check_funcs.current_snapshot = None
+        if not with_fixes:
+            continue
+        for spec_check in check_registry.CHECKS.values():
+            build_scene(layout)
+            model_check_funcs.results.clear()
+            try:
+                spec_check.check()
+            except RuntimeError:
+                continue
+            _measure_into(
+                results, spec_check.fix.__name__, spec.transforms, spec_check.fix
+            )
+    return results
+
+
+def verify_gate(
+    specs: Sequence[SceneSpec], build_scene: Callable[[SceneLayout], str]
+) -> List[str]:
+    """This function gates every scene through the headless checks like the batch
+    tools, a scene without defects must pass and a scene with defects must fail.
+
+    Args:
+        specs (Sequence[SceneSpec]): Scenes to build, their defect ratios are
+            used for the defective scene.
+        build_scene (Callable): Builds a layout in the checked scene and selects it.
+
+    Returns:
+        Description of every scene whose gate status is wrong, empty when the
+        gate works.
+
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    import model_check_batch
+
+    errors = []
+    for spec in specs:
+        clean = spec._replace(
+            unfrozen=0.0,
+            offset_pivots=0.0,
+            history=0.0,
+            ngons=0.0,
+            hidden=0.0,
+            negative_uvs=0.0,
+        )
+        for scene_spec, expected in (
+            (clean, model_check_batch.PASSED),
+            (spec, model_check_batch.FAILED),
+        ):
+            build_scene(generate_layout(scene_spec))
+            report = model_check_batch.check_scene(
+                model_check_batch.default_checks(), gate=1
+            )
+            if report["status"] != expected:
+                checks = {
+                    check_id: check["status"]
+                    for check_id, check in report["checks"].items()
+                    if check["status"] != model_check_batch.PASSED
+                }
+                errors.append(
+                    f"{scene_spec.transforms} transforms "
+                    f"{'clean' if scene_spec is clean else 'with defects'}: "
+                    f"{report['status']} instead of {expected} {checks}"
+                )
+    return errors
+
+
+def scaling_exponent(nodes: Sequence[int], seconds: Sequence[float]) -> Optional[float]:
+    """This function fits time = c * nodes ** k and returns k.
+
+    Args:
+        nodes (Sequence[int]): Scene sizes.
+        seconds (Sequence[float]): Wall times.
+
+    Returns:
+        The exponent, None with less than two sizes.
+
+    """
+    if len(set(nodes)) < 2:
+        return None
+    log_nodes = np.log(np.asarray(nodes, dtype=np.float64))
+    log_seconds = np.log(np.maximum(np.asarray(seconds, dtype=np.float64), 1e-9))
+    return float(np.polyfit(log_nodes, log_seconds, 1)[0])
+
+
+def scaling_table(results: Sequence[BenchResult]) -> List[Dict[str, Any]]:
+    """This function groups the results per function with their scaling exponent.
+
+    Args:
+        results (Sequence[BenchResult]): Measurements of run_benchmark().
+
+    Returns:
+        One row per function with times, peak memory, exponent and a flag for
+        functions growing faster than SCALING_EXPONENT_LIMIT.
+
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        row = rows.setdefault(result.name, {"name": result.name, "sizes": {}})
+        row["sizes"][result.nodes] = {
+            "seconds": result.seconds,
+            "peak_kb": result.peak_kb,
+        }
+    for row in rows.values():
+        sizes = sorted(row["sizes"])
+        exponent = scaling_exponent(
+            sizes, [row["sizes"][size]["seconds"] for size in sizes]
+        )
+        row["exponent"] = exponent
+        row["regression"] = exponent is not None and exponent > SCALING_EXPONENT_LIMIT
+    return list(rows.values())
+
+
+def format_table(rows: Sequence[Dict[str, Any]]) -> str:
+    """This function formats the scaling table as text.
+
+    Args:
+        rows (Sequence[Dict[str, Any]]): Rows of scaling_table().
+
+    Returns:
+        Text table with time(ms)/peak(KB) per size.
+
+    """
+    sizes = sorted({size for row in rows for size in row["sizes"]})
+    header = f"{'function':<40}" + "".join(f"{size:>22}" for size in sizes)
+    lines = [header + f"{'exponent':>10}"]
+    for row in rows:
+        cells = []
+        for size in sizes:
+            value = row["sizes"].get(size)
+            cells.append(
+                f"{value['seconds'] * 1000:>11.2f}ms/{value['peak_kb']:>7.0f}KB"
+                if value
+                else f"{'-':>22}"
+            )
+        exponent = "-" if row["exponent"] is None else f"{row['exponent']:.2f}"
+        flag = "  O(n^2)?" if row["regression"] else ""
+        lines.append(f"{row['name']:<40}" + "".join(cells) + f"{exponent:>10}{flag}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """This function parses the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument(
+        "--backend",
+        choices=("maya", "memory"),
+        default="maya",
+        help="Build the scenes in Maya or in the in-memory scene.",
+    )
+    parser.add_argument(
+        "--mesh-ratio", type=float, default=0.8, help="Meshes among the transforms."
+    )
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--unfrozen", type=float, default=0.1)
+    parser.add_argument("--offset-pivots", type=float, default=0.1)
+    parser.add_argument("--history", type=float, default=0.1)
+    parser.add_argument("--ngons", type=float, default=0.05)
+    parser.add_argument("--hidden", type=float, default=0.05)
+    parser.add_argument("--negative-uvs", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-fixes", action="store_true", help="Only time checks.")
+    parser.add_argument("--json", help="Write the scaling table to this json file.")
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with 1 when a function scales worse than "
+        f"n^{SCALING_EXPONENT_LIMIT}.",
+    )
+    parser.add_argument(
+        "--verify-gate",
+        action="store_true",
+        help="Only gate clean and defective scenes of every size, exit with 1 "
+        "when a clean scene does not pass or a defective one does not fail.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """This function runs the benchmark from the command line.
+
+    Returns:
+        Exit code.
+
+    """
+    args = parse_args(argv)
+    specs = [
+        SceneSpec(
+            transforms=size,
+            meshes=int(size * args.mesh_ratio),
+            depth=args.depth,
+            unfrozen=args.unfrozen,
+            offset_pivots=args.offset_pivots,
+            history=args.history,
+            ngons=args.ngons,
+            hidden=args.hidden,
+            negative_uvs=args.negative_uvs,
+            seed=args.seed,
+        )
+        for size in args.sizes
+    ]
+    build_scene = build_memory_scene
+    if args.backend == "maya":
+        # pylint: disable=import-outside-toplevel,import-error
+        import maya.standalone  # type: ignore
+
+        maya.standalone.initialize()
+        build_scene = build_maya_scene
+    if args.verify_gate:
+        errors = verify_gate(specs, build_scene)
+        print("\n".join(errors) or f"Gate verified on {len(specs)} sizes")
+        return int(bool(errors))
+    rows = scaling_table(
+        run_benchmark(specs, build_scene, with_fixes=not args.no_fixes)
+    )
+    print(format_table(rows))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file_handle:
+            json.dump(rows, file_handle, indent=4)
+    if args.fail_on_regression and any(row["regression"] for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Modules to serve the model checks from warm Maya sessions over local HTTP.
+
+Run under mayapy from the tool folder:
+    mayapy model_check_daemon.py --workers 4 --port 8765
+then check a file with a POST request, the response is the json report of
+model_check_batch.check_file():
+    curl -d '{"file": "/assets/chair.ma", "checks": ["cameras"]}' \\
+        http://127.0.0.1:8765/check
+Every worker initializes Maya once when the daemon starts, a job only costs the
+file open and the checks. The scene is emptied between jobs, a worker which
+crashes or exceeds --timeout is replaced.
+"""
+import argparse
+import http.server
+import json
+import multiprocessing.connection
+import queue
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# pylint: disable=import-error
+import check_registry
+import model_check_batch
+
+# the daemon only listens on the local machine
+HOST = "127.0.0.1"
+PORT = 8765
+
+
+def parse_job(payload: Any, use_cache: bool = False) -> model_check_batch.Job:
+    """This function validates the body of a check request.
+
+    Args:
+        payload (Any): Decoded json eg: {"file": "chair.ma", "checks": ["cameras"],
+            "max_findings": 10, "gate": 1}, only "file" is required. Without
+            "checks" the headless checks of model_check_batch.default_checks()
+            are executed, see model_check_batch.check_scene() for the gate.
+        use_cache (bool): Read unchanged results from the result cache.
+
+    Returns:
+        Job to send to a worker.
+
+    Raises:
+        ValueError: The request is not valid.
+
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("file"), str):
+        raise ValueError('expected a json object with a "file" path')
+    check_ids = payload.get("checks") or model_check_batch.default_checks()
+    if not isinstance(check_ids, list):
+        raise ValueError('"checks" must be a list of check ids')
+    unknown = [
+        check_id
+        for check_id in check_ids
+        if not isinstance(check_id, str) or check_id not in check_registry.CHECKS
+    ]
+    if unknown:
+        raise ValueError(f"unknown checks: {', '.join(map(str, unknown))}")
+    max_findings = payload.get("max_findings", model_check_batch.MAX_FINDINGS)
+    if not isinstance(max_findings, int) or max_findings < 0:
+        raise ValueError('"max_findings" must be a positive integer')
+    gate = payload.get("gate", 0)
+    if not isinstance(gate, int) or gate < 0:
+        raise ValueError('"gate" must be a positive integer')
+    return model_check_batch.Job(
+        payload["file"], list(check_ids), max_findings, use_cache, gate
+    )
+
+
+class WorkerPool:
+    """This class keeps warm worker processes, every job waits for an idle
+    worker and a stopped worker is replaced by a new one."""
+
+    def __init__(
+        self,
+        workers: int,
+        timeout: float = 0.0,
+        target: Callable[[Any], None] = model_check_batch.worker_main,
+    ) -> None:
+        """This function starts the workers, they initialize Maya right away.
+
+        Args:
+            workers (int): Number of worker processes.
+            timeout (float): Seconds a job may take, 0 for no limit.
+            target (Callable): Worker loop, see model_check_batch.worker_main().
+        """
+        self.timeout = timeout
+        self.target = target
+        self.workers = workers
+        self.idle: "queue.Queue[model_check_batch.Worker]" = queue.Queue()
+        for worker_id in range(workers):
+            self.idle.put(model_check_batch.Worker(worker_id, target))
+        self.jobs = 0
+        self._lock = threading.Lock()
+
+    def check(self, job: model_check_batch.Job) -> Dict[str, Any]:
+        """This function checks a file on the next idle worker.
+
+        Args:
+            job (model_check_batch.Job): File and checks.
+
+        Returns:
+            Report of model_check_batch.check_file().
+
+        """
+        worker = self.idle.get()
+        try:
+            # a worker which died while idle is reported as crashed by collect()
+            worker.send(job)
+            report = None
+            while report is None:
+                ready = multiprocessing.connection.wait(
+                    [worker.connection, worker.process.sentinel],
+                    timeout=model_check_batch.POLL_INTERVAL,
+                )
+                report = worker.collect(ready, self.timeout)
+        finally:
+            # a stopped worker is replaced before it goes back to the pool
+            if worker.pipe_failed or worker.is_stopped():
+                worker.stop()
+                worker = model_check_batch.Worker(worker.worker_id, self.target)
+            self.idle.put(worker)
+        with self._lock:
+            self.jobs += 1
+        return report
+
+    def status(self) -> Dict[str, int]:
+        """This function returns the number of workers, idle workers and jobs."""
+        return {"workers": self.workers, "idle": self.idle.qsize(), "jobs": self.jobs}
+
+    def close(self) -> None:
+        """This function stops the workers once their job is done."""
+        for _ in range(self.workers):
+            worker = self.idle.get()
+            worker.send(None)
+            worker.process.join(timeout=model_check_batch.POLL_INTERVAL * 10)
+            worker.stop()
+
+
+class ValidationServer(http.server.ThreadingHTTPServer):
+    """HTTP server handing the check requests to a worker pool, every request
+    is served by its own thread."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, address: Tuple[str, int], pool: WorkerPool, use_cache: bool = False
+    ) -> None:
+        super().__init__(address, ValidationHandler)
+        self.pool = pool
+        self.use_cache = use_cache
+
+
+class ValidationHandler(http.server.BaseHTTPRequestHandler):
+    """Requests of the daemon:
+    POST /check with a json body, see parse_job(), returns the report.
+    GET /status returns the workers, idle workers and jobs done.
+    """
+
+    server: ValidationServer
+
+    def _send_json(self, status: int, body: Any) -> None:
+        """Helper function to send a json response."""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # pylint: disable=invalid-name
+    def do_GET(self) -> None:
+        """This function answers the status requests."""
+        if self.path != "/status":
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        self._send_json(200, self.server.pool.status())
+
+    def do_POST(self) -> None:
+        """This function answers the check requests."""
+        if self.path != "/check":
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = parse_job(json.loads(self.rfile.read(length)), self.server.use_cache)
+        except ValueError as error:
+            self._send_json(400, {"error": str(error)})
+            return
+        self._send_json(200, self.server.pool.check(job))
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """This function parses the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument(
+        "--workers", type=int, default=2, help="Warm Maya sessions to keep."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=0.0, help="Seconds allowed per file."
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="Read unchanged results from the cache."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """This function serves the checks until it is interrupted.
+
+    Returns:
+        Exit code.
+
+    """
+    args = parse_args(argv)
+    pool = WorkerPool(max(1, args.workers), args.timeout)
+    server = ValidationServer((HOST, args.port), pool, args.cache)
+    print(
+        f"Serving on http://{HOST}:{args.port} with {pool.workers} workers",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,40 @@
 """Modules to sanity check maya models."""
-from typing import List
-
-import maya.app.renderSetup.model.renderSetup  # type: ignore
-from maya import cmds, mel
-
-# dictionary to store the values of the statuses
-model_check_dict = {}
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+# pylint: disable=import-error
+import check_profiler
+import check_scan
+import constants
+import history_engine
+import mesh_engine
+import mesh_memo
+import node_type_index
+import result_store
+import scene_backend
+import scene_snapshot
+import transform_engine
+import visibility_engine
+
+# findings of every check by result key, nodes are stored by uuid
+results = result_store.ResultStore()
+# analyses of every mesh by geometry fingerprint, kept across check runs so only
+# changed meshes are analysed again
+mesh_analyses = mesh_memo.MeshMemo()
+# hierarchy of the selected group read once by check_asset, shared by all the checks
+current_snapshot: Optional[scene_snapshot.SceneSnapshot] = None
+# findings the checks look for before they stop, 0 for all of them, eg: a gate
+# only needs to know whether an asset passes
+finding_limit = 0
+# seconds an execution of a check going through the meshes or nodes one by one may
+# take before it records its findings so far, 0 for no limit, the next execution
+# on the same snapshot continues where it stopped
+time_budget = 0.0
+# progress of the checks which stopped at their time budget, by result key
+scans = check_scan.CheckScans()
+
+_Found = TypeVar("_Found", List[str], np.ndarray)
 
 
 # Utility Functions
@@ -14,16 +43,57 @@ def select_parent_node(checks_dict: List[str]) -> None:
     the name from full path.
 
     Args:
-        checks_dict: (dict): Model check dictionary to fetch list of values
-                eg: select_parent_node(model_check_dict["geometry_with_offset_pivot"])
+        checks_dict: (List[str]): Nodes found by a check
+                eg: select_parent_node(results.get("geometry_with_offset_pivot"))
     """
-    parent_group = cmds.listRelatives(
-        checks_dict,
-        fullPath=True,
-        parent=True,
-    )
+    backend = scene_backend.get_backend()
+    parent_group = backend.parents(checks_dict)
     parent_node = parent_group[0].split("|")[1]
-    cmds.select(parent_node)
+    backend.select([parent_node])
+
+
+def found_enough(count: int) -> bool:
+    """This function returns whether a check found the findings it looks for and
+    can stop, see finding_limit.
+
+    Args:
+        count (int): Findings found so far.
+
+    Returns:
+        True when the remaining nodes do not need to be checked.
+
+    """
+    return bool(finding_limit) and count >= finding_limit
+
+
+def _first(found: _Found) -> _Found:
+    """Helper function to keep the findings a check looks for, see finding_limit."""
+    return found[:finding_limit] if finding_limit else found
+
+
+def _resume_scan(result_key: str, total: int) -> check_scan.CheckScan:
+    """Helper function to return the scan of a check on the current snapshot,
+    continued when its previous execution stopped at the time budget."""
+    return scans.resume(result_key, get_snapshot(), total, time_budget)
+
+
+def _end_scan(result_key: str, scan: check_scan.CheckScan) -> None:
+    """Helper function to forget the scan of a check which checked every item or
+    found the findings it looks for."""
+    scans.end(result_key, scan, stopped=found_enough(len(scan.found)))
+
+
+def get_snapshot() -> scene_snapshot.SceneSnapshot:
+    """This function returns the snapshot of the current check run. When a check
+    is executed on its own, a snapshot of the selection is read for it.
+
+    Returns:
+        snapshot: (scene_snapshot.SceneSnapshot): Hierarchy of the selection group.
+
+    """
+    if current_snapshot is not None:
+        return current_snapshot
+    return scene_snapshot.SceneSnapshot.from_selection()
 
 
 def hierarchy_selection() -> List[str]:
@@ -34,11 +104,9 @@ def hierarchy_selection() -> List[str]:
                      eg: Result: ['|main|group2|group1|pCube1', '|main|group2|group1|pTorus1', ...]
 
     """
-    group_selection: List[str] = cmds.ls(selection=True)
-    group_transforms: List[str] = cmds.listRelatives(
-        group_selection, allDescendents=True, fullPath=True, type="transform"
-    )  # full hierarchy path incase there are name clashes
-    return group_transforms
+    snapshot = get_snapshot()
+    # full hierarchy path incase there are name clashes
+    return snapshot.select_paths(snapshot.hierarchy_transforms())
 
 
 # Constaints Function
@@ -46,17 +114,9 @@ def check_constraints() -> None:
     """This function lists the type constraints from the scene and saves the
     values in a dictionary.
     """
-    model_check_dict["unwanted_constraints"] = (
-            cmds.ls(
-                type=[
-                    "parentConstraint",
-                    "pointConstraint",
-                    "orientConstraint",
-                    "scaleConstraint",
-                    "aimConstraint",
-                ]
-            )
-            or []
+    results.set_names(
+        "unwanted_constraints",
+        get_snapshot().type_index().nodes_of_type(constants.CONSTRAINT_TYPES),
     )
 
 
@@ -64,420 +124,586 @@ def delete_constraints() -> None:
     """This function queries "unwanted_constraints" key, and deletes all the
     constraints from the scene.
     """
-    cmds.delete(model_check_dict.get("unwanted_constraints"))
+    scene_backend.get_backend().delete(results.get("unwanted_constraints"))
 
 
 # Master Group Pivot Function
-def check_master_group_pivot() -> None:
-    """This function checks assets master group pivot position saves the values in a
-    dictionary.
+def check_master_group_pivot(tolerance: float = constants.PIVOT_TOLERANCE) -> None:
+    """This function checks assets master group pivot is at the origin and saves
+    the values in a dictionary. Pivots are only read, the scene is not edited.
+
+    Args:
+        tolerance (float): Largest distance from the origin treated as placed.
     """
-    group_selection: List[str] = cmds.ls(selection=True)
-    offset_scalepivot_value: List[int] = cmds.xform(
-        group_selection, scalePivot=True, query=True
-    )
-    offset_rotatepivot_value: List[int] = cmds.xform(
-        group_selection, rotatePivot=True, query=True
-    )
-    # centerpivot the geo
-    cmds.xform(group_selection, zeroTransformPivots=True, preserve=True)
-    # then we take the center pivot value
-    centerpivot_scalepivot_pivot: List[int] = cmds.xform(
-        group_selection, scalePivot=True, query=True
-    )
-    centerpivot_rotatepivot_pivot: List[int] = cmds.xform(
-        group_selection, rotatePivot=True, query=True
-    )
-    # set the pivots back to offset position
-    # set_offset_scalepivot_vlaue to selected geo
-    cmds.xform(group_selection, scalePivot=offset_scalepivot_value)
-    # set_offset_rotatepivot_vlaue to selected geo
-    cmds.xform(group_selection, rotatePivot=offset_rotatepivot_value)
-    # compare the offset and center pivots if not equal save in a list
-    model_check_dict["master_group_with_offset_pivot"] = (
-        group_selection
-        if offset_scalepivot_value != centerpivot_scalepivot_pivot
-           or offset_rotatepivot_value != centerpivot_rotatepivot_pivot
-        else []
+    snapshot = get_snapshot()
+    paths = transform_engine.offset_pivots(
+        snapshot.pivots(roots=True), np.zeros(3), tolerance
     )
+    results.set_nodes("master_group_with_offset_pivot", paths, snapshot.uuids_of(paths))
 
 
 def center_pivot_master_group() -> None:
     """This function center pivots to the object."""
-    cmds.xform(
-        model_check_dict.get("master_group_with_offset_pivot"),
-        zeroTransformPivots=True,
-        preserve=True,
+    scene_backend.get_backend().zero_pivots(
+        results.get("master_group_with_offset_pivot")
     )
 
 
 # Center Pivots Functions
-def check_geometry_center_pivot() -> None:
-    """This function checks assets(geo) pivot position.
+def check_geometry_center_pivot(tolerance: float = constants.PIVOT_TOLERANCE) -> None:
+    """This function checks assets(geo) pivots are at their bounding box center.
+    Pivots and bounding boxes are only read, the scene is not edited.
     Maya docs page for reference
     https://knowledge.autodesk.com/support/maya-lt/learn-explore/caas/CloudHelp/cloudhelp/2015/ENU/MayaLT/files/FAQ-How-can-I-get-an-objects-pivot-point-in-world-space-htm.html
-    """
-    geo_with_offset = []
-    group_transforms = hierarchy_selection()
-    for transform in group_transforms:
-        # we are taking the offset value
-        offset_scalepivot_value = cmds.xform(transform, scalePivot=True, query=True)
-        offset_rotatepivot_value = cmds.xform(transform, rotatePivot=True, query=True)
-        # centerpivot the geo
-        cmds.xform(transform, centerPivots=True, preserve=True)
-        # then we take the center pivot value
-        centerpivot_scalepivot_pivot = cmds.xform(
-            transform, scalePivot=True, query=True
-        )
-        centerpivot_rotatepivot_pivot = cmds.xform(
-            transform, rotatePivot=True, query=True
-        )
-        # set the pivots back to offset position
-        # set_offset_scalepivot_vlaue to selected geo
-        cmds.xform(transform, scalePivot=offset_scalepivot_value)
-        # set_offset_rotatepivot_vlaue to selected geo
-        cmds.xform(transform, rotatePivot=offset_rotatepivot_value)
-        # compare the offset and center pivots if not equal save in a list
-        if (
-                offset_scalepivot_value != centerpivot_scalepivot_pivot
-                or offset_rotatepivot_value != centerpivot_rotatepivot_pivot
-        ):
-            geo_with_offset.append(transform)
 
-    model_check_dict["geometry_with_offset_pivot"] = geo_with_offset
+    Args:
+        tolerance (float): Largest distance from the center treated as centered.
+    """
+    snapshot = get_snapshot()
+    batch = snapshot.pivots()
+    paths = transform_engine.offset_pivots(batch, batch.centers, tolerance)
+    results.set_nodes("geometry_with_offset_pivot", paths, snapshot.uuids_of(paths))
 
 
 def center_pivot_all_objects() -> None:
     """This function center pivots the assets(geo)."""
-    if model_check_dict.get("geometry_with_offset_pivot"):
-        for geo in model_check_dict["geometry_with_offset_pivot"]:
-            cmds.xform(geo, centerPivots=True, preserve=True)
-        select_parent_node(model_check_dict["geometry_with_offset_pivot"])
-
-
-def remove_float_precision_issue_nodes() -> None:
-    """This function is only to be used if center_pivot_all function fails.
-    Reason this was created becauseoffset and center pivot when compared
-    showed difference in 10th place decimal values.
-    """
-    model_check_dict["geometry_with_offset_pivot"] = []
+    offset_pivot_geos = results.get("geometry_with_offset_pivot")
+    if offset_pivot_geos:
+        scene_backend.get_backend().center_pivots(offset_pivot_geos)
+        select_parent_node(offset_pivot_geos)
 
 
 # Construction History Functions
 def check_construction_histories() -> None:
-    """This function checks the history on geometries.
+    """This function checks the history on geometries, the upstream history of every
+    shape is read in one pass and classified by node type.
     Maya docs page for reference.
     https://help.autodesk.com/view/MAYAUL/2020/ENU/?guid=__Nodes_polyBase_html
     """
-    geo_with_history = []
-    group_transforms = hierarchy_selection()
-    for transform in group_transforms:
-        shapes = cmds.listRelatives(transform, fullPath=True, shapes=True)
-        if shapes:
-            if cmds.listConnections(shapes[0], type="polyBase"):
-                geo_with_history.append(shapes[0])
-
-    model_check_dict["construction_history_list"] = geo_with_history
+    snapshot = get_snapshot()
+    batch = snapshot.history()
+    check_profiler.count_nodes(len(batch.node_names))
+    categories = history_engine.classify(
+        batch,
+        constants.HISTORY_CATEGORIES,
+        scene_backend.get_backend().inherited_types,
+    )
+    with_history = np.zeros(len(batch.paths), dtype=bool)
+    for category in constants.CONSTRUCTION_HISTORY_CATEGORIES:
+        with_history |= categories[category]
+    paths = [batch.paths[idx] for idx in np.flatnonzero(with_history)]
+    results.set_nodes("construction_history_list", paths, snapshot.uuids_of(paths))
+    # deformed shapes keep their deformers when the history is deleted
+    paths = [
+        batch.paths[idx]
+        for idx in np.flatnonzero(with_history & categories["deformer"])
+    ]
+    results.set_nodes("deformed_history_list", paths, snapshot.uuids_of(paths))
 
 
 def delete_construction_history() -> None:
-    """This function deletes the histories of the geometries."""
-    if model_check_dict.get("construction_history_list"):
-        for geo in model_check_dict["construction_history_list"]:
-            cmds.delete(geo, constructionHistory=True)
-        select_parent_node(model_check_dict["construction_history_list"])
+    """This function deletes the histories of the geometries, deformers are kept."""
+    history_geos = results.get("construction_history_list")
+    if history_geos:
+        backend = scene_backend.get_backend()
+        deformed = results.get("deformed_history_list")
+        deformed_set = set(deformed)
+        backend.delete_history([geo for geo in history_geos if geo not in deformed_set])
+        if deformed:
+            backend.delete_history(deformed, keep_deformers=True)
+        select_parent_node(history_geos)
 
 
 # Freeze Transform Functions
-def check_all_transforms_are_frozen() -> None:
-    """This function checks the geometries transform values."""
-    geo_with_values = []
-    group_transforms = hierarchy_selection()
-    value = [0.0, 0.0, 0.0]
-    scale_relative_value = [1.0, 1.0, 1.0]
-    for transform in group_transforms:
-        translate = cmds.xform(transform, translation=True, query=True)
-        rotation = cmds.xform(transform, rotation=True, query=True)
-        scale = cmds.xform(transform, scale=True, query=True, relative=True)
-        if translate != value or rotation != value or scale != scale_relative_value:
-            geo_with_values.append(transform)
-
-    model_check_dict["freeze_tranform_list"] = geo_with_values
+def check_all_transforms_are_frozen(
+    tolerance: float = constants.FREEZE_TOLERANCE,
+) -> None:
+    """This function checks the geometries transform values in one batched pass.
+
+    Args:
+        tolerance (float): Largest difference from identity treated as frozen.
+    """
+    snapshot = get_snapshot()
+    paths = transform_engine.unfrozen_transforms(snapshot.transform_values(), tolerance)
+    results.set_nodes("freeze_tranform_list", paths, snapshot.uuids_of(paths))
 
 
 def freeze_transforms() -> None:
     """This function freezes the transforms of the assets(geo)"""
-    if model_check_dict.get("freeze_tranform_list"):
-        for geo in model_check_dict["freeze_tranform_list"]:
-            cmds.makeIdentity(geo, apply=True)
-        select_parent_node(model_check_dict["freeze_tranform_list"])
+    unfrozen_geos = results.get("freeze_tranform_list")
+    if unfrozen_geos:
+        scene_backend.get_backend().freeze_transforms(unfrozen_geos)
+        select_parent_node(unfrozen_geos)
 
 
 # Duplicate Shapes Functions
 def check_duplicate_shape_nodes() -> None:
     """This function checks the geometries shapes."""
-    geo_with_more_shapes = []
-    group_selection = cmds.ls(selection=True)
-    group_transforms = cmds.ls(group_selection, dagObjects=True, type="transform")
-    for child in group_transforms:
-        shapes = cmds.listRelatives(child, shapes=True, noIntermediate=True)
-        if shapes:
-            if len(shapes) > 1:
-                geo_with_more_shapes.append(child)
-    model_check_dict["unwanted_multiple_shape_nodes"] = geo_with_more_shapes
+    snapshot = get_snapshot()
+    shape_counts = snapshot.shape_counts(no_intermediate=True)
+    check_profiler.count_nodes(len(snapshot))
+    paths = snapshot.select_paths(
+        np.flatnonzero(snapshot.is_transform & (shape_counts > 1))
+    )
+    results.set_nodes("unwanted_multiple_shape_nodes", paths, snapshot.uuids_of(paths))
 
 
 def highlight_shapes_with_extra_shape_nodes() -> None:
     """This function highlights geo with extra shapes."""
-    cmds.select(model_check_dict.get("unwanted_multiple_shape_nodes"))
+    scene_backend.get_backend().select(results.get("unwanted_multiple_shape_nodes"))
 
 
 # Check Expressions functions
 def check_expressions() -> None:
     """This function lists the expression nodes from the scene."""
-    model_check_dict["unwanted_expressions"] = cmds.ls(type="expression") or []
+    results.set_names(
+        "unwanted_expressions",
+        get_snapshot().type_index().nodes_of_type(constants.EXPRESSION_TYPES),
+    )
 
 
 def delete_expressions() -> None:
     """This function deletes all the expressions from the scene."""
-    cmds.delete(model_check_dict.get("unwanted_expressions"))
+    scene_backend.get_backend().delete(results.get("unwanted_expressions"))
 
 
 # check animation curves functions
 def check_animation_curves() -> None:
     """This function lists the anim curves nodes from the scene."""
-    model_check_dict["unwanted_animation_curves"] = (
-            cmds.ls(type=["animCurveTL", "animCurveTA", "animCurveTU"]) or []
+    results.set_names(
+        "unwanted_animation_curves",
+        get_snapshot().type_index().nodes_of_type(constants.ANIMATION_CURVE_TYPES),
     )
 
 
 def delete_animation_curves() -> None:
     """This function deletes all the anim curves nodes from the scene."""
-    cmds.delete(model_check_dict.get("unwanted_animation_curves"))
+    scene_backend.get_backend().delete(results.get("unwanted_animation_curves"))
 
 
 # check render setup layers functions
 def check_render_layers() -> None:
     """This function lists the render setups layers from the scene"""
-    model_check_dict["unwanted_rendersetup_layers"] = (
-            cmds.ls(type="renderSetupLayer") or []
+    results.set_names(
+        "unwanted_rendersetup_layers",
+        get_snapshot().type_index().nodes_of_type(constants.RENDER_SETUP_LAYER_TYPES),
     )
 
 
 def delete_render_layers() -> None:
     """This function deletes all the rendersetup layers from the scene"""
-    if model_check_dict.get("unwanted_rendersetup_layers"):
-        rs = maya.app.renderSetup.model.renderSetup.instance()
-        rs.clearAll()
+    if results.count("unwanted_rendersetup_layers"):
+        scene_backend.get_backend().clear_render_setup()
 
 
 # Display Layers Functions
 def check_display_layers() -> None:
     """This function lists the display layers from the scene."""
-    default_layers = ["defaultLayer"]
-    list_display_layers = cmds.ls(type="displayLayer")
-    model_check_dict["unwanted_display_layers"] = [
-                                                      layers for layers in list_display_layers if
-                                                      layers not in default_layers
-                                                  ] or []
+    list_display_layers = (
+        get_snapshot().type_index().nodes_of_type(constants.DISPLAY_LAYER_TYPES)
+    )
+    results.set_names(
+        "unwanted_display_layers",
+        [
+            layers
+            for layers in list_display_layers
+            if layers not in constants.DEFAULT_DISPLAY_LAYERS
+        ],
+    )
 
 
 def delete_display_layers() -> None:
     """This function deletes all the display layers from the scene."""
-    cmds.delete(model_check_dict.get("unwanted_display_layers"))
+    scene_backend.get_backend().delete(results.get("unwanted_display_layers"))
 
 
 # Vray Light Functions
 def check_vray_lights() -> None:
     """This function lists the vray lights from the scene."""
-    model_check_dict["unwanted_vray_lights"] = (
-            cmds.ls(
-                type=[
-                    "VRayLightRectShape",
-                    "VRayLightDomeShape",
-                    "VRayLightIESShape",
-                    "VRayLightSphereShape",
-                    "VRaySunTarget",
-                ]
-            )
-            or []
+    results.set_names(
+        "unwanted_vray_lights",
+        get_snapshot().type_index().nodes_of_type(constants.VRAY_LIGHT_TYPES),
     )
 
 
 def delete_vray_lights() -> None:
-    """This function deletes all the vray lights from the scene."""
-    cmds.delete(
-        cmds.listRelatives(model_check_dict.get("unwanted_vray_lights"), parent=True)
+    """This function deletes all the vray lights from the scene, dag lights are
+    deleted with their transforms."""
+    lights = results.get("unwanted_vray_lights")
+    parent = node_type_index.NodeTypeIndex.parent
+    scene_backend.get_backend().delete(
+        list(dict.fromkeys(parent(light) or light for light in lights))
     )
 
 
 # cameras functions
 def check_cameras() -> None:
     """This function lists the cameras from the scene."""
-    default_cameras = ["frontShape", "perspShape", "sideShape", "topShape"]
-    list_cameras = cmds.ls(type="camera")
-    unwanted_cameras = [cam for cam in list_cameras if cam not in default_cameras]
-    model_check_dict["unwanted_cameras"] = [
-                                               cmds.listRelatives(parents, allParents=True)[0] for parents in
-                                               unwanted_cameras
-                                           ] or []
+    type_index = get_snapshot().type_index()
+    list_cameras = type_index.nodes_of_type(constants.CAMERA_TYPES)
+    results.set_names(
+        "unwanted_cameras",
+        [
+            type_index.parent(cam)
+            for cam in list_cameras
+            if type_index.short_name(cam) not in constants.DEFAULT_CAMERAS
+        ],
+    )
 
 
 def delete_unwanted_cameras() -> None:
     """This function deletes all the unwanted cameras from the scene."""
-    cmds.delete(model_check_dict.get("unwanted_cameras"))
+    scene_backend.get_backend().delete(results.get("unwanted_cameras"))
 
 
 # Unknown Functions
 def check_unknown_nodes() -> None:
     """This function lists the unknown nodes from the scene."""
-    model_check_dict["unknown_nodes"] = cmds.ls(type="unknown") or []
+    results.set_names(
+        "unknown_nodes",
+        get_snapshot().type_index().nodes_of_type(constants.UNKNOWN_TYPES),
+    )
 
 
 def delete_unknown_nodes() -> None:
     """This function deletes all the unknown nodes from the scene."""
-    cmds.delete(model_check_dict.get("unknown_nodes"))
+    scene_backend.get_backend().delete(results.get("unknown_nodes"))
 
 
 # Shaded Viewport Functions
 def check_viewport_shading() -> None:
     """This function checks the viewport for wireframe shading."""
-    model_check_dict["viewport_shaded"] = [] if cmds.modelEditor("modelPanel4", query=True,
-                                                                 wireframeOnShaded=True) else [
-        "Not Shaded with Wireframe"]
+    shaded = scene_backend.get_backend().wireframe_on_shaded()
+    results.set_names(
+        "viewport_shaded", [] if shaded else ["Not Shaded with Wireframe"]
+    )
 
 
 def set_viewport_shading() -> None:
     """This function sets the viewport to wireframe shading."""
-    cmds.modelEditor("modelPanel4", edit=True, wireframeOnShaded=True)
+    scene_backend.get_backend().set_wireframe_on_shaded(True)
 
 
 # Viewport Display Smoothness
 def viewport_smoothness() -> None:
     """This function sets the scene geo smoothness."""
-    cmds.displaySmoothness(
-        divisionsU=0, divisionsV=0, pointsWire=4, pointsShaded=1, polygonObject=1
-    )
+    scene_backend.get_backend().reset_display_smoothness()
 
 
 # Non-Mainfold Functions
 def check_nonmanifold_geometry() -> None:
-    """This function checks the geometries non-manifold faces in the selected group."""
-    list_of_vertices_and_faces = []
-    group_transforms = hierarchy_selection()
-    for transform in group_transforms:
-        if cmds.polyInfo(transform, nonManifoldVertices=True, laminaFaces=True):
-            list_of_vertices_and_faces.append(
-                cmds.polyInfo(transform, nonManifoldVertices=True, laminaFaces=True)
-            )
-    flatten_list = [
-        each for vertex_face in list_of_vertices_and_faces for each in vertex_face
-    ]
-    model_check_dict["nonmanifold_list"] = flatten_list or []
+    """This function checks the geometries non-manifold vertices and lamina faces
+    in the selected group from the mesh topology read in one pass, only meshes
+    with a topology fingerprint not analysed before are analysed."""
+    snapshot = get_snapshot()
+    batch = snapshot.mesh_topology()
+    scan = _resume_scan("nonmanifold_list", len(batch.paths))
+    reports = mesh_analyses.iter_analyses(
+        "nonmanifold",
+        snapshot.mesh_fingerprints(),
+        lambda idx: mesh_engine.nonmanifold_report(batch.topologies[idx]),
+        scan.done,
+    )
+    for path, report in zip(batch.paths[scan.done :], reports):
+        for component_type, indices in (
+            ("vtx", report.vertices),
+            ("f", report.lamina_faces),
+        ):
+            if len(indices):
+                scan.found.append((path, component_type, _first(indices)))
+        if not scan.advance() or found_enough(len(scan.found)):
+            break
+    check_profiler.count_nodes(scan.done - scan.resumed_at)
+    _end_scan("nonmanifold_list", scan)
+    paths = [path for path, _, _ in scan.found]
+    results.set_components(
+        "nonmanifold_list",
+        paths,
+        snapshot.uuids_of(paths),
+        [component_type for _, component_type, _ in scan.found],
+        [indices for _, _, indices in scan.found],
+    )
 
 
 def highlight_nonmanifold_geometry() -> None:
     """This function selects the non-manifold faces from dictionary which is
     higlighted in viewport."""
-    cmds.select(model_check_dict.get("nonmanifold_list"))
+    scene_backend.get_backend().select(results.get("nonmanifold_list"))
 
 
 # N-Sided Faces Functions
-def check_n_sided_faces() -> None:
-    """This function checks the geometries n-sided faces in the selected group."""
-    group_selection = cmds.ls(selection=True)
-    # pylint: disable=line-too-long
-    ngons_list = mel.eval(
-        'polyCleanupArgList 4 { "0","2","0","0","1","0","0","0","0","1e-05","0","1e-05","0","1e-05","0","-1","0",'
-        '"0" };'
+def check_n_sided_faces(
+    max_sides: int = constants.MAX_FACE_SIDES,
+    flag_concave_quads: bool = constants.FLAG_CONCAVE_QUADS,
+    triangle_budget: int = constants.TRIANGLE_BUDGET,
+) -> None:
+    """This function checks the geometries n-sided faces in the selected group from
+    the face vertex counts of every mesh, the selection is not used. Meshes whose
+    fingerprint was analysed before are not analysed again.
+
+    Args:
+        max_sides (int): Faces with more sides are n-gons.
+        flag_concave_quads (bool): Report quads with a concave corner as well.
+        triangle_budget (int): Report meshes with more triangles, 0 for no budget.
+    """
+    snapshot = get_snapshot()
+    batch = snapshot.mesh_topology()
+    scan = _resume_scan("nsided_faces", len(batch.paths))
+    points = snapshot.mesh_points() if flag_concave_quads else []
+    fingerprints = snapshot.mesh_fingerprints()
+    # concave quads depend on the vertex positions as well, shared by the
+    # executions of a check stopped at its time budget
+    if flag_concave_quads:
+        fingerprints = snapshot.cached(
+            "mesh_shape_fingerprints",
+            lambda: [
+                topology + position
+                for topology, position in zip(
+                    snapshot.mesh_fingerprints(), snapshot.mesh_point_fingerprints()
+                )
+            ],
+        )
+
+    def analyse_mesh(idx: int) -> Tuple[np.ndarray, int]:
+        topology = batch.topologies[idx]
+        faces = mesh_engine.n_sided_faces(topology, max_sides)
+        if flag_concave_quads:
+            faces = np.union1d(faces, mesh_engine.concave_quads(topology, points[idx]))
+        return faces, mesh_engine.triangle_count(topology)
+
+    analyses = mesh_analyses.iter_analyses(
+        f"n_sided_faces:{max_sides}:{flag_concave_quads}",
+        fingerprints,
+        analyse_mesh,
+        scan.done,
+    )
+    for path, (faces, triangles) in zip(batch.paths[scan.done :], analyses):
+        if len(faces):
+            scan.found.append((path, _first(faces)))
+        # meshes over the budget are recorded whole, with no face
+        if triangle_budget and triangles > triangle_budget:
+            scan.found.append((path, np.empty(0, dtype=np.int32)))
+        if not scan.advance() or found_enough(len(scan.found)):
+            break
+    check_profiler.count_nodes(scan.done - scan.resumed_at)
+    _end_scan("nsided_faces", scan)
+    paths = [path for path, _ in scan.found]
+    results.set_components(
+        "nsided_faces",
+        paths,
+        snapshot.uuids_of(paths),
+        ["f"] * len(paths),
+        [faces for _, faces in scan.found],
     )
-    cmds.select(group_selection)
-    model_check_dict["nsided_faces"] = ngons_list or []
 
 
 def highlight_n_sided_faces() -> None:
     """This function selects the n-sided faces from dictionary which is higlighted in viewport."""
-    cmds.select(model_check_dict.get("nsided_faces"))
+    scene_backend.get_backend().select(results.get("nsided_faces"))
 
 
 # Hidden Geometries Functions
 def check_hidden_geometry() -> None:
-    """This function checks the hidden geometries in the scene."""
-    hidden_items = []
-    group_transforms = hierarchy_selection()
-    for transform in group_transforms:
-        if not cmds.getAttr(f"{transform}.visibility"):
-            hidden_items.append(transform)
-    model_check_dict["hidden_geometries"] = hidden_items
+    """This function checks the hidden geometries in the selected group from the
+    visibility plugs of the whole hierarchy read in one pass. A transform is hidden
+    by itself or an ancestor, or when all its shapes are hidden, eg: intermediate
+    shapes only or shapes in a hidden display layer."""
+    snapshot = get_snapshot()
+    state = snapshot.visibility()
+    transforms = snapshot.hierarchy_transforms()
+    shapes = snapshot.shape_indices
+    visible_shapes = np.bincount(
+        snapshot.parents[shapes],
+        weights=state.sources[shapes] < 0,
+        minlength=len(snapshot),
+    )
+    shapes_hidden = (snapshot.shape_counts() > 0) & (visible_shapes == 0)
+    hidden = (state.sources >= 0) | shapes_hidden
+    hidden_transforms = transforms[hidden[transforms]]
+    scan = _resume_scan("hidden_geometries", len(hidden_transforms))
+    # the transforms are counted once for the executions of a check
+    if not scan.resumed_at:
+        check_profiler.count_nodes(len(transforms))
+    for idx in hidden_transforms[scan.done :]:
+        # a visible transform is reported through its first hidden shape
+        node = idx if state.sources[idx] >= 0 else snapshot.shapes(idx)[0]
+        source = state.sources[node]
+        plug = visibility_engine.CAUSE_PLUGS[state.causes[source]]
+        scan.found.append(
+            (
+                snapshot.paths[idx],
+                visibility_engine.describe(state, snapshot.paths, node),
+                (snapshot.paths[source], plug) if plug else None,
+            )
+        )
+        if not scan.advance() or found_enough(len(scan.found)):
+            break
+    _end_scan("hidden_geometries", scan)
+    hidden_items = [path for path, _, _ in scan.found]
+    hidden_causes = [cause for _, cause, _ in scan.found]
+    hiding_plugs = dict.fromkeys(plug for _, _, plug in scan.found if plug)
+    results.set_nodes(
+        "hidden_geometries",
+        hidden_items,
+        snapshot.uuids_of(hidden_items),
+        details=hidden_causes,
+    )
+    sources = [source for source, _ in hiding_plugs]
+    results.set_nodes(
+        "hidden_geometry_plugs",
+        sources,
+        snapshot.uuids_of(sources),
+        attributes=[plug for _, plug in hiding_plugs],
+    )
 
 
 def unhide_geometries() -> None:
-    """This function unhides the hidden geo in the scene."""
-    if model_check_dict.get("hidden_geometries"):
-        for geo in model_check_dict["hidden_geometries"]:
-            cmds.setAttr(f"{geo}.visibility", 1)
-        select_parent_node(model_check_dict["hidden_geometries"])
+    """This function unhides the hidden geo in the scene by turning on the plugs
+    hiding them, intermediate objects and display layers are left untouched."""
+    hidden_geos = results.get("hidden_geometries")
+    if hidden_geos:
+        backend = scene_backend.get_backend()
+        for plug in results.get("hidden_geometry_plugs"):
+            backend.set_attr(plug, 1)
+        select_parent_node(hidden_geos)
 
 
 # UVS in Negative Spaces Functions
-def check_uvs_in_negative_space() -> None:
+def uv_shell_bounds() -> List[List[mesh_engine.UvShellBounds]]:
+    """This function returns the uv shell bounding boxes of every uv set of the
+    meshes in the selected group, shared by the uv checks of a run.
+
+    Returns:
+        Bounds of every uv set, for every mesh in SceneSnapshot.mesh_paths() order.
+
     """
-    This function checks the uv's are in x 0.0 and y 0.0 positive space for geometry.
+    snapshot = get_snapshot()
+    return snapshot.cached(
+        "uv_shell_bounds", lambda: list(_iter_uv_shell_bounds(snapshot))
+    )
+
+
+def _iter_uv_shell_bounds(
+    snapshot: scene_snapshot.SceneSnapshot, start: int = 0
+) -> Iterator[List[mesh_engine.UvShellBounds]]:
+    """Helper function to return the uv shell bounds of the meshes one by one from
+    start, a mesh is only analysed once the previous one was used."""
+    meshes_uvs = snapshot.mesh_uvs()
+    return mesh_analyses.iter_analyses(
+        "uv_shell_bounds",
+        snapshot.mesh_uv_fingerprints(),
+        lambda idx: [
+            mesh_engine.uv_shell_bounds(uv_set, *uvs)
+            for uv_set, uvs in meshes_uvs[idx].items()
+        ],
+        start,
+    )
+
+
+def _record_meshes_with_uv_shells(
+    key: str,
+    find_shells: Callable[[mesh_engine.UvShellBounds, float], np.ndarray],
+    tolerance: float,
+) -> None:
+    """Helper function to record the meshes with flagged shells in any uv set,
+    every mesh once. Checks looking for a few findings or stopping at their time
+    budget analyse the meshes one by one instead of sharing the bounds of all of
+    them."""
+    snapshot = get_snapshot()
+    mesh_paths = snapshot.mesh_paths()
+    scan = _resume_scan(key, len(mesh_paths))
+    shell_bounds = (
+        _iter_uv_shell_bounds(snapshot, scan.done)
+        if finding_limit or time_budget
+        else uv_shell_bounds()[scan.done :]
+    )
+    for path, meshes_bounds in zip(mesh_paths[scan.done :], shell_bounds):
+        if any(len(find_shells(bounds, tolerance)) for bounds in meshes_bounds):
+            scan.found.append(path)
+        if not scan.advance() or found_enough(len(scan.found)):
+            break
+    check_profiler.count_nodes(scan.done - scan.resumed_at)
+    _end_scan(key, scan)
+    results.set_nodes(key, scan.found, snapshot.uuids_of(scan.found))
+
+
+def check_uvs_in_negative_space(tolerance: float = constants.UV_TOLERANCE) -> None:
     """
-    geo_in_negative_space = []
-    group_transforms = hierarchy_selection()
-    for transform in group_transforms:
-        boundingbox_evaluate = cmds.polyEvaluate(transform, boundingBox2d=True)
-        try:
-            value_u1 = boundingbox_evaluate[0][0]
-            if value_u1 < 0.0:
-                geo_in_negative_space.append(transform)
-        except TypeError:
-            pass
-        try:
-            value_v1 = boundingbox_evaluate[1][0]
-            if value_v1 < 0.0:
-                geo_in_negative_space.append(transform)
-        except TypeError:
-            pass
-    model_check_dict["uvs_in_negative_space"] = geo_in_negative_space
+    This function checks the uv's are in x 0.0 and y 0.0 positive space for geometry,
+    in every uv set.
+
+    Args:
+        tolerance (float): Largest distance below 0 treated as positive.
+    """
+    _record_meshes_with_uv_shells(
+        "uvs_in_negative_space", mesh_engine.negative_uv_shells, tolerance
+    )
+
+
+def check_uvs_outside_unit_square(tolerance: float = constants.UV_TOLERANCE) -> None:
+    """This function checks the uv shells of every uv set are in the 0-1 square.
+
+    Args:
+        tolerance (float): Largest distance out of the square treated as inside.
+    """
+    _record_meshes_with_uv_shells(
+        "uvs_outside_unit_square", mesh_engine.outside_unit_uv_shells, tolerance
+    )
+
+
+def check_uv_shells_crossing_udims(tolerance: float = constants.UV_TOLERANCE) -> None:
+    """This function checks no uv shell of any uv set lies across two UDIM tiles.
+
+    Args:
+        tolerance (float): Largest distance beyond a tile border treated as inside.
+    """
+    _record_meshes_with_uv_shells(
+        "uv_shells_crossing_udims", mesh_engine.udim_crossing_uv_shells, tolerance
+    )
 
 
 def highlight_obj_uvs_in_negative_space() -> None:
     """This function highlights the uv's in negative space in viewport."""
-    cmds.select(model_check_dict.get("uvs_in_negative_space"))
+    scene_backend.get_backend().select(results.get("uvs_in_negative_space"))
+
+
+def highlight_obj_uvs_outside_unit_square() -> None:
+    """This function highlights the geometries with uvs out of the 0-1 square."""
+    scene_backend.get_backend().select(results.get("uvs_outside_unit_square"))
+
+
+def highlight_obj_uv_shells_crossing_udims() -> None:
+    """This function highlights the geometries with uv shells across UDIM tiles."""
+    scene_backend.get_backend().select(results.get("uv_shells_crossing_udims"))
 
 
 # Namespaces Functions
 def check_namespaces() -> None:
     """This function lists the namespaces in the scene."""
     default_namespace = ["UI", "shared"]
-    all_namespaces = cmds.namespaceInfo(listOnlyNamespaces=True)
-    model_check_dict["unwanted_namespaces"] = [
-                                                  names for names in all_namespaces if names not in default_namespace
-                                              ] or []
+    all_namespaces = scene_backend.get_backend().namespaces()
+    results.set_names(
+        "unwanted_namespaces",
+        [names for names in all_namespaces if names not in default_namespace],
+    )
 
 
 def remove_unwanted_namespaces() -> None:
     """This function deletes the namespaces from the scene."""
-    unwanted_namespaces = model_check_dict["unwanted_namespaces"]
+    unwanted_namespaces = results.get("unwanted_namespaces")
+    backend = scene_backend.get_backend()
     for names in unwanted_namespaces:
-        try:
-            cmds.namespace(removeNamespace=f"{names}", mergeNamespaceWithRoot=True)
-        except RuntimeError:
-            cmds.namespace(removeNamespace=f"{names}")
+        backend.remove_namespace(names)
 
 
 def assign_lambert1() -> None:
     """This function assigns the default lambert shader to every geo in the group."""
-    group_selection = cmds.ls(selection=True)
-    group_shape = cmds.listRelatives(
-        group_selection, allDescendents=True, fullPath=True, type="shape"
+    snapshot = get_snapshot()
+    scene_backend.get_backend().assign_shading_group(
+        snapshot.select_paths(np.flatnonzero(snapshot.is_shape)), "initialShadingGroup"
     )
-    for shape in group_shape:
-        cmds.sets(shape, forceElement="initialShadingGroup", edit=True)
 
 
 def delete_unused_shader_nodes() -> None:
     """Delete unused shader nodes in the scene file."""
-    mel.eval('hyperShadePanelMenuCommand("hyperShadePanel1", "deleteUnusedNodes")')
+    scene_backend.get_backend().delete_unused_shading_nodes()
@@ -0,0 +1,170 @@
+"""Modules to pre-screen Maya ascii files for scene wide issues without Maya.
+
+Run with python from the tool folder, no Maya license needed:
+    python model_check_prescreen.py "assets/**/*.ma" --workers 8 --output screen.jsonl
+The scene wide checks execute on the nodes ma_reader reads from the file and
+report the same result keys and findings as in Maya, one json line per file
+like model_check_batch.py. Files failing here do not need to be opened in Maya.
+"""
+import argparse
+import functools
+import json
+import multiprocessing
+import sys
+import time
+from typing import Any, Dict, Optional, Sequence, TextIO
+
+# pylint: disable=import-error
+import constants
+import ma_reader
+import model_check_batch
+import scene_backend
+import scene_snapshot
+
+# checks reading only the node names, types and namespaces of the scene
+PRESCREEN_CHECKS = (
+    "constraints",
+    "expressions",
+    "animation_curves",
+    "render_layers",
+    "display_layers",
+    "vray_lights",
+    "cameras",
+    "unknown_nodes",
+    "namespaces",
+)
+
+
+def prescreen_file(
+    path: str,
+    check_ids: Sequence[str] = PRESCREEN_CHECKS,
+    max_findings: int = model_check_batch.MAX_FINDINGS,
+    missing_plugins: Sequence[str] = constants.PRESCREEN_MISSING_PLUGINS,
+    gate: int = 0,
+) -> Dict[str, Any]:
+    """This function reads an ascii file and executes the scene wide checks.
+
+    Args:
+        path (str): Maya ascii file.
+        check_ids (Sequence[str]): Checks of PRESCREEN_CHECKS to execute.
+        max_findings (int): Findings listed per check, the others are counted.
+        missing_plugins (Sequence[str]): Plugins which are not loaded, their
+            nodes are reported as unknown nodes.
+        gate (int): Stop at the first failing check, see
+            model_check_batch.check_scene().
+
+    Returns:
+        Report like model_check_batch.check_file() with the required "plugins".
+
+    """
+    start = time.perf_counter()
+    reader = ma_reader.MaReader(missing_plugins)
+    try:
+        if not path.lower().endswith(".ma"):
+            raise OSError(f"Only Maya ascii files can be read: {path}")
+        with open(path, encoding="utf-8", errors="replace") as ma_file:
+            reader.read(ma_file)
+    except OSError as error:
+        report: Dict[str, Any] = {
+            "status": model_check_batch.ERROR,
+            "error": str(error),
+        }
+    else:
+        backend = reader.backend()
+        snapshot = scene_snapshot.SceneSnapshot([], [], backend)
+        # the nodes are read from the file, the backend only holds the namespaces
+        snapshot.cached("type_index", lambda: reader.type_index(backend))
+        with scene_backend.use_backend(backend):
+            report = model_check_batch.check_scene(
+                check_ids, max_findings, snapshot=snapshot, gate=gate
+            )
+        del report["groups"]
+        report["plugins"] = reader.plugins
+    report.update(file=path, seconds=round(time.perf_counter() - start, 3))
+    return report
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """This function parses the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="Ascii files or glob patterns.")
+    parser.add_argument(
+        "--manifest",
+        action="append",
+        default=[],
+        help="Text file listing one ascii file or pattern per line.",
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        choices=PRESCREEN_CHECKS,
+        default=list(PRESCREEN_CHECKS),
+        metavar="CHECK",
+        help="Checks to execute, every scene wide check by default.",
+    )
+    parser.add_argument(
+        "--missing-plugins",
+        nargs="*",
+        default=list(constants.PRESCREEN_MISSING_PLUGINS),
+        help="Plugins whose nodes are reported as unknown nodes.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Processes, 0 for every core."
+    )
+    parser.add_argument(
+        "--max-findings", type=int, default=model_check_batch.MAX_FINDINGS
+    )
+    parser.add_argument(
+        "--gate",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Only tell whether files pass: checks stop after K findings and a "
+        "file stops at its first failing check.",
+    )
+    parser.add_argument("--output", help="Write the json lines to this file.")
+    args = parser.parse_args(argv)
+    if not args.files and not args.manifest:
+        parser.error("no ascii file given")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """This function pre-screens the files from the command line.
+
+    Returns:
+        Exit code, 1 when a file did not pass.
+
+    """
+    args = parse_args(argv)
+    files = model_check_batch.collect_files(args.files, args.manifest)
+    screen = functools.partial(
+        prescreen_file,
+        check_ids=args.checks,
+        max_findings=args.max_findings,
+        missing_plugins=args.missing_plugins,
+        gate=args.gate,
+    )
+    output: TextIO = (
+        open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    )
+    start = time.perf_counter()
+    reports = []
+    try:
+        with multiprocessing.Pool(args.workers or None) as pool:
+            for report in pool.imap_unordered(screen, files, chunksize=8):
+                reports.append(report)
+                output.write(json.dumps(report) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(
+        model_check_batch.summary(reports, time.perf_counter() - start),
+        file=sys.stderr,
+    )
+    return int(any(report["status"] != model_check_batch.PASSED for report in reports))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,8 @@
-"""This module is to run progressbar"""
+"""This module is to run the model checks and report their progress"""
+import time
+from typing import Callable, List, NamedTuple, Optional
+
+import maya.utils  # type: ignore
 
 try:
     from PySide2 import QtCore  # type: ignore
@@ -6,16 +10,111 @@ except ModuleNotFoundError:
     from PySide6 import QtCore  # type: ignore
 
 
-# pylint: disable=too-few-public-methods
+class CheckJob(NamedTuple):
+    """A check scheduled on the thread.
+
+    Attributes:
+        name (str): Registered id of the check.
+        function (Callable): Check function to execute.
+        nodes (int): Number of nodes the check walks, weights progress and ETA.
+        coverage (Callable): Ratio of the items the check went through, a check
+            stopping at its time budget is executed again until it reaches 1.
+            None for checks executed once.
+    """
+
+    name: str
+    function: Callable[[], None]
+    nodes: int
+    coverage: Optional[Callable[[], float]] = None
+
+
 class ModelCheckThread(QtCore.QThread):  # type: ignore
     """
-    This is a thread class for progressbar.
+    This is a thread class which schedules the checks and reports their progress.
+    Maya commands are not thread safe, so every check is executed on the main
+    thread one at a time; in between Maya processes the UI events and the
+    thread reports the progress. Checks going through the meshes one by one
+    stop after a short time and are executed again until they are done or their
+    time budget is spent, so Maya stays interactive during a long check.
     """
 
     progress_signal = QtCore.Signal(int)
+    status_signal = QtCore.Signal(str)
+    check_finished_signal = QtCore.Signal(str)
+    run_finished_signal = QtCore.Signal(bool)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.jobs: List[CheckJob] = []
+        self.finished_checks: List[str] = []
+        self.failed_checks: List[str] = []
+        # seconds a check may take in all before its partial findings are kept,
+        # 0 for no limit
+        self.time_budget = 0.0
+
+    def cancel(self) -> None:
+        """This function stops the run after the check which is executing."""
+        self.requestInterruption()
 
     def run(self) -> None:
-        """This function progress bar signal."""
-        # Do some work here
-        for i in range(101):
-            self.progress_signal.emit(i)
+        """This function executes the scheduled checks and emits their progress."""
+        self.finished_checks = []
+        self.failed_checks = []
+        total_weight = sum(job.nodes + 1 for job in self.jobs) or 1
+        done_weight = 0
+        done_nodes = 0
+        start_time = time.perf_counter()
+        self.progress_signal.emit(0)
+        for job in self.jobs:
+            if self.isInterruptionRequested():
+                break
+            try:
+                self._execute(job, done_weight, total_weight)
+            # pylint: disable=broad-except
+            except Exception:
+                self.failed_checks.append(job.name)
+            else:
+                self.finished_checks.append(job.name)
+                self.check_finished_signal.emit(job.name)
+            done_weight += job.nodes + 1
+            done_nodes += job.nodes
+            elapsed = time.perf_counter() - start_time
+            eta = elapsed / done_weight * (total_weight - done_weight)
+            self.progress_signal.emit(int(100 * done_weight / total_weight))
+            self.status_signal.emit(
+                f"{len(self.finished_checks)}/{len(self.jobs)} checks, "
+                f"{done_nodes} nodes, ETA {eta:.1f}s"
+            )
+        cancelled = len(self.finished_checks) + len(self.failed_checks) < len(self.jobs)
+        self.run_finished_signal.emit(cancelled)
+
+    def _execute(self, job: CheckJob, done_weight: int, total_weight: int) -> None:
+        """Helper function to execute a check on the main thread, again while it
+        stopped at its time budget and the check may go on. A check stops when
+        an execution does not get further, eg: its findings were read from the
+        result cache.
+
+        Args:
+            job (CheckJob): Check to execute.
+            done_weight (int): Weight of the checks done before, for the progress.
+            total_weight (int): Weight of every scheduled check.
+        """
+        start_time = time.perf_counter()
+        coverage = 0.0
+        while True:
+            maya.utils.executeInMainThreadWithResult(job.function)
+            previous = coverage
+            coverage = 1.0 if job.coverage is None else job.coverage()
+            if (
+                coverage >= 1
+                or coverage <= previous
+                or self.isInterruptionRequested()
+                or (
+                    self.time_budget
+                    and time.perf_counter() - start_time >= self.time_budget
+                )
+            ):
+                return
+            weight = done_weight + coverage * (job.nodes + 1)
+            self.progress_signal.emit(int(100 * weight / total_weight))
+            self.status_signal.emit(f"{job.name} {coverage:.0%}")
@@ -1,5 +1,5 @@
 """Modules to create model checks"""
-from typing import List
+from typing import Dict, List, Optional
 
 try:
     from PySide2 import QtGui, QtWidgets  # type: ignore
@@ -7,11 +7,11 @@ except ModuleNotFoundError:
     from PySide6 import QtGui, QtWidgets  # type: ignore
 
 # pylint: disable=import-error
+import check_registry
 import constants
 import ui_check_base
 
 
-# pylint: disable=too-many-instance-attributes
 class ModelCheckWidgets(QtWidgets.QWidget):  # type: ignore
     """A class that creates and holds model check widgets for the UI."""
 
@@ -19,158 +19,15 @@ class ModelCheckWidgets(QtWidgets.QWidget):  # type: ignore
         super().__init__()
         self.grid_layout = QtWidgets.QGridLayout()
 
-        # Constraint Widgets Set
-        self.constraint_check_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Constraints"),
-            QtWidgets.QPushButton("Delete All Constraints"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # Master Pivot Origin Widgets Set
-        self.master_group_pivot_origin_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("Master group pivot is at origin"),
-            QtWidgets.QPushButton("Reset master group pivot"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # Center Pivot Widgets Set
-        self.center_pivot_points_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("Check Pivot points are centered"),
-            QtWidgets.QPushButton("Center Pivots on all objects"),
-            QtWidgets.QPushButton("Float Precision fix"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # Construction History Widgets Set
-        self.construction_history_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("Check Construction History"),
-            QtWidgets.QPushButton("Delete Construction History"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # Frozen Transforms Widgets Set
-        self.frozen_transforms_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("All Transforms are frozen"),
-            QtWidgets.QPushButton("Freeze Transforms on all Objects"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Duplicate Shape Nodes Widgets Set
-        self.no_duplicate_shape_nodes_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Duplicate Shape Nodes"),
-            QtWidgets.QPushButton("Highlight nodes with extra shape nodes"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Expressions Widgets Set
-        self.no_expressions_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Expressions"),
-            QtWidgets.QPushButton("Delete All expressions"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Animation Widgets Set
-        self.no_animation_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Animation"),
-            QtWidgets.QPushButton("Delete All Animations"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Render Layers Widgets Set
-        self.no_render_layers_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Render Layers"),
-            QtWidgets.QPushButton("Delete Render Layers"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Display Layers Widgets Set
-        self.no_display_layers_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Display Layers"),
-            QtWidgets.QPushButton("Delete Display Layers"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Lights Widgets Set
-        self.no_lights_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Lights"),
-            QtWidgets.QPushButton("Delete Lights"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Additional Cameras Widgets Set
-        self.no_additional_cameras_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Additional Cameras"),
-            QtWidgets.QPushButton("Delete all Additional Cameras"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Unknown Nodes Widgets Set
-        self.no_unknown_nodes_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Unknown Nodes"),
-            QtWidgets.QPushButton("Delete Unknown Nodes"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # Viewport Set to Shaded, No Wireframe Widgets set
-        self.viewport_shaded_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("Viewport Set to Shaded"),
-            QtWidgets.QPushButton("Set Viewport to Shaded"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Non-Manifold Widgets set
-        self.no_non_manifold_geometry_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Non-Manifold Geometry"),
-            QtWidgets.QPushButton("Highlight Manifold Geometry"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No N-Sided Faces Widgets set
-        self.no_n_sided_faces_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No N-Sided Faces"),
-            QtWidgets.QPushButton("Highlight N-Sided Faces"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No UV's in Negative Areas Widgets set
-        self.no_uv_in_negative_area_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No UV's in Negative Areas"),
-            QtWidgets.QPushButton("Highlight Objects"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Hidden Geometry Widgets set
-        self.no_hidden_geometry_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Hidden Geometry"),
-            QtWidgets.QPushButton("Unhide All Objects"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
-
-        # No Namespaces Widgets Set
-        self.no_namespaces_widgets_set = ui_check_base.UiCheckBase(
-            QtWidgets.QCheckBox("No Namespaces"),
-            QtWidgets.QPushButton("Delete All Namespaces"),
-            QtWidgets.QPushButton(),
-            font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
-        )
+        # Widgets Set of every registered check, keyed by check id
+        self.widgets_sets: Dict[str, ui_check_base.UiCheckBase] = {}
+        for spec in check_registry.CHECKS.values():
+            self.widgets_sets[spec.check_id] = ui_check_base.UiCheckBase(
+                QtWidgets.QCheckBox(spec.label),
+                QtWidgets.QPushButton(spec.fix_label),
+                QtWidgets.QPushButton(),
+                font=QtGui.QFont(constants.FONT, constants.FONT_POINT_SIZE),
+            )
 
         self.add_widgets_set_to_layout()
         self.enable_all_checkboxes()
@@ -178,56 +35,56 @@ class ModelCheckWidgets(QtWidgets.QWidget):  # type: ignore
 
     def add_widgets_set_to_layout(self) -> None:
         """This function is to isolate widget sets(checkbox and button) and add in scrollarea."""
+        self._add_widgets_sets_to_layout(widgets_sets=list(self.widgets_sets.values()))
 
+    def enable_all_checkboxes(self) -> None:
+        """This function is to enable the model checks checkboxes, checks registered
+        as disabled stay unchecked."""
         checks_widgets_sets = [
-            self.constraint_check_widgets_set,
-            self.master_group_pivot_origin_widgets_set,
-            self.center_pivot_points_widgets_set,
-            self.construction_history_widgets_set,
-            self.frozen_transforms_widgets_set,
-            self.no_duplicate_shape_nodes_widgets_set,
-            self.no_expressions_widgets_set,
-            self.no_animation_widgets_set,
-            self.no_render_layers_widgets_set,
-            self.no_display_layers_widgets_set,
-            self.no_lights_widgets_set,
-            self.no_additional_cameras_widgets_set,
-            self.no_unknown_nodes_widgets_set,
-            self.viewport_shaded_widgets_set,
-            self.no_non_manifold_geometry_widgets_set,
-            self.no_n_sided_faces_widgets_set,
-            self.no_uv_in_negative_area_widgets_set,
-            self.no_hidden_geometry_widgets_set,
-            self.no_namespaces_widgets_set,
+            widgets_set.checkbox
+            for check_id, widgets_set in self.widgets_sets.items()
+            if check_registry.CHECKS[check_id].enabled
         ]
-        self._add_widgets_sets_to_layout(widgets_sets=checks_widgets_sets)
-
-    def enable_all_checkboxes(self) -> None:
-        """This function is to enable all the model checks checkboxes."""
+        self._set_all_checkboxes(checkboxes=checks_widgets_sets, state=True)
 
-        checks_widgets_sets = [
-            self.constraint_check_widgets_set.checkbox,
-            self.master_group_pivot_origin_widgets_set.checkbox,
-            self.center_pivot_points_widgets_set.checkbox,
-            self.construction_history_widgets_set.checkbox,
-            self.frozen_transforms_widgets_set.checkbox,
-            self.no_duplicate_shape_nodes_widgets_set.checkbox,
-            self.no_animation_widgets_set.checkbox,
-            self.no_expressions_widgets_set.checkbox,
-            self.no_render_layers_widgets_set.checkbox,
-            self.no_display_layers_widgets_set.checkbox,
-            self.no_lights_widgets_set.checkbox,
-            self.no_additional_cameras_widgets_set.checkbox,
-            self.no_unknown_nodes_widgets_set.checkbox,
-            self.viewport_shaded_widgets_set.checkbox,
-            self.no_non_manifold_geometry_widgets_set.checkbox,
-            self.no_n_sided_faces_widgets_set.checkbox,
-            self.no_uv_in_negative_area_widgets_set.checkbox,
-            self.no_hidden_geometry_widgets_set.checkbox,
-            self.no_namespaces_widgets_set.checkbox,
+    def enabled_checks(self) -> List[str]:
+        """This function lists the ids of the checks whose checkbox is checked."""
+        return [
+            check_id
+            for check_id, widgets_set in self.widgets_sets.items()
+            if widgets_set.checkbox.isChecked()
         ]
 
-        self._set_all_checkboxes(checkboxes=checks_widgets_sets, state=True)
+    def show_status(
+        self,
+        check_id: str,
+        failed: Optional[bool],
+        coverage: float = 1.0,
+        accepted: bool = False,
+    ) -> None:
+        """This function colors the status button of a check, red when it found
+        issues and green otherwise. A check which stopped at its time budget is
+        yellow until its partial results are accepted, the button shows the
+        ratio of the nodes it checked.
+
+        Args:
+            check_id (str): Registered id of the check.
+            failed (bool): The check found issues, None to clear the status.
+            coverage (float): Ratio of the nodes the check went through.
+            accepted (bool): The partial results are kept as a sampled result.
+        """
+        button = self.widgets_sets[check_id].buttons[-1]
+        if failed is None:
+            button.setStyleSheet("")
+        elif coverage < 1 and not accepted:
+            button.setStyleSheet(constants.YELLOW)
+        else:
+            button.setStyleSheet(constants.RED if failed else constants.GREEN)
+        partial = failed is not None and coverage < 1
+        button.setText(f"{coverage:.0%}" if partial else "")
+        button.setToolTip(
+            f"Incomplete, {coverage:.0%} of the nodes checked" if partial else ""
+        )
 
     def _add_widgets_sets_to_layout(
         self, widgets_sets: List[ui_check_base.UiCheckBase]
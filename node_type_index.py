@@ -0,0 +1,89 @@
+"""Modules to index every node of the scene by its type in one pass."""
+from typing import Dict, Iterable, List, Optional
+
+# pylint: disable=import-error
+import check_profiler
+import scene_backend
+
+
+class NodeTypeIndex:
+    """This class maps node types to the long names of the scene nodes of that type."""
+
+    def __init__(
+        self,
+        names_and_types: List[str],
+        backend: Optional[scene_backend.SceneBackend] = None,
+    ) -> None:
+        """This function groups the nodes by type.
+
+        Args:
+            names_and_types (List[str]): Flat list of node names and types as
+                returned by cmds.ls(long=True, showType=True).
+            backend (scene_backend.SceneBackend): Backend resolving the type
+                tree, the active backend when None.
+        """
+        check_profiler.count_nodes(len(names_and_types) // 2)
+        self.backend = backend or scene_backend.get_backend()
+        self.nodes_by_type: Dict[str, List[str]] = {}
+        for name, type_name in zip(names_and_types[0::2], names_and_types[1::2]):
+            self.nodes_by_type.setdefault(type_name, []).append(name)
+
+    @classmethod
+    def from_scene(
+        cls, backend: Optional[scene_backend.SceneBackend] = None
+    ) -> "NodeTypeIndex":
+        """This function lists every node of the scene with its type in one command.
+
+        Args:
+            backend (scene_backend.SceneBackend): Scene to read, the active
+                backend when None.
+
+        Returns:
+            NodeTypeIndex of the scene.
+
+        """
+        backend = backend or scene_backend.get_backend()
+        return cls(backend.list_nodes_with_types(), backend)
+
+    def __len__(self) -> int:
+        return sum(len(nodes) for nodes in self.nodes_by_type.values())
+
+    def nodes_of_type(self, type_names: Iterable[str]) -> List[str]:
+        """This function lists the nodes of the types, derived types included like
+        cmds.ls(type=type_names).
+
+        Args:
+            type_names (Iterable[str]): Node types eg: ["camera"].
+
+        Returns:
+            Long names of the nodes.
+
+        """
+        wanted = set(type_names)
+        nodes = []
+        for type_name, type_nodes in self.nodes_by_type.items():
+            if type_name in wanted or wanted.intersection(
+                self.backend.inherited_types(type_name)
+            ):
+                nodes.extend(type_nodes)
+        return nodes
+
+    @staticmethod
+    def parent(node: str) -> Optional[str]:
+        """This function returns the parent of a dag node from its long name.
+
+        Args:
+            node (str): Long name of the node eg: "|camera1|cameraShape1".
+
+        Returns:
+            Long name of the parent, None for dependency and world level nodes.
+
+        """
+        if "|" not in node:
+            return None
+        return node.rsplit("|", 1)[0] or None
+
+    @staticmethod
+    def short_name(node: str) -> str:
+        """This function returns the leaf name of a long node name."""
+        return node.rsplit("|", 1)[-1]
@@ -0,0 +1,264 @@
+"""Modules to cache the check results on disk, keyed by a fingerprint of the
+scene content the check reads.
+
+A check reading the same nodes, the same snapshot data, with the same version
+and settings finds the same issues, so its findings are read back from disk
+instead of executing it again. Checks whose data changed miss the cache.
+"""
+import os
+import zipfile
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# pylint: disable=import-error
+import check_registry
+import constants
+import model_check_funcs
+import result_store
+import scene_snapshot
+import utilities
+
+
+def _mesh_parts(snapshot: scene_snapshot.SceneSnapshot) -> List[Any]:
+    """Helper function to list the fingerprints of the meshes, the points only
+    matter to the concave quads test."""
+    parts: List[Any] = list(snapshot.mesh_fingerprints())
+    if constants.FLAG_CONCAVE_QUADS:
+        parts.extend(snapshot.mesh_point_fingerprints())
+    return parts
+
+
+def _type_index_parts(snapshot: scene_snapshot.SceneSnapshot) -> List[Any]:
+    """Helper function to list the nodes of the scene by type."""
+    nodes_by_type = snapshot.type_index().nodes_by_type
+    parts: List[Any] = []
+    for type_name in sorted(nodes_by_type):
+        parts.append(type_name)
+        parts.append(nodes_by_type[type_name])
+    return parts
+
+
+# data hashed for every snapshot need, checks needing data missing here are not
+# cached. "nodes" is the hierarchy itself, part of every hierarchy check key.
+FINGERPRINT_PARTS: Dict[str, Callable[[scene_snapshot.SceneSnapshot], List[Any]]] = {
+    "nodes": lambda snapshot: [
+        snapshot.paths,
+        snapshot.uuids,
+        snapshot.type_names,
+        snapshot.type_ids,
+        snapshot.parents,
+        snapshot.is_intermediate,
+    ],
+    # the shapes are nodes of the hierarchy
+    "shapes": lambda snapshot: [],
+    "transform_values": lambda snapshot: [snapshot.transform_values().values],
+    "pivots": lambda snapshot: list(snapshot.pivots()[1:]),
+    "root_pivots": lambda snapshot: list(snapshot.pivots(roots=True)[1:]),
+    "history": lambda snapshot: list(snapshot.history()[1:]),
+    "meshes": _mesh_parts,
+    "uvs": lambda snapshot: snapshot.mesh_uv_fingerprints(),
+    "visibility": lambda snapshot: list(snapshot.visibility()),
+    "type_index": _type_index_parts,
+}
+
+
+def fingerprint(snapshot: scene_snapshot.SceneSnapshot, data: str) -> str:
+    """This function hashes snapshot data once per snapshot.
+
+    Args:
+        snapshot (scene_snapshot.SceneSnapshot): Hierarchy of the check run.
+        data (str): Key of FINGERPRINT_PARTS eg: "transform_values".
+
+    Returns:
+        Hex digest of the data.
+
+    """
+    return snapshot.cached(
+        f"fingerprint_{data}",
+        lambda: utilities.digest(FINGERPRINT_PARTS[data](snapshot)),
+    )
+
+
+def settings_fingerprint() -> str:
+    """This function hashes the settings of constants, a changed tolerance or
+    node type list invalidates every cached result."""
+    return utilities.digest(
+        f"{name}={getattr(constants, name)!r}"
+        for name in sorted(dir(constants))
+        if name.isupper()
+    )
+
+
+def check_fingerprint(
+    snapshot: scene_snapshot.SceneSnapshot, spec: check_registry.CheckSpec
+) -> Optional[str]:
+    """This function hashes everything the findings of a check depend on.
+
+    Args:
+        snapshot (scene_snapshot.SceneSnapshot): Hierarchy of the check run.
+        spec (check_registry.CheckSpec): Declaration of the check.
+
+    Returns:
+        Cache key of the check, None for checks reading scene state the snapshot
+        does not hold eg: the viewport, they are always executed.
+
+    """
+    if not spec.needs or not set(spec.needs).issubset(FINGERPRINT_PARTS):
+        return None
+    data = list(spec.needs)
+    if spec.scope == check_registry.HIERARCHY:
+        data.insert(0, "nodes")
+    # checks stopping at the first findings record fewer findings
+    return utilities.digest(
+        [
+            spec.check_id,
+            spec.version,
+            model_check_funcs.finding_limit,
+            settings_fingerprint(),
+        ]
+        + [fingerprint(snapshot, name) for name in data]
+    )
+
+
+class ResultCache:
+    """This class stores the findings of every check execution in a folder, one
+    file per cache key, and evicts the least recently used files over the size
+    limit. A file is used when it is read or written.
+    """
+
+    def __init__(
+        self,
+        store: result_store.ResultStore,
+        directory: str = constants.RESULT_CACHE_DIR,
+        max_bytes: int = constants.RESULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """This function creates a cache, the folder is created on the first write.
+
+        Args:
+            store (result_store.ResultStore): Store the checks record into.
+            directory (str): Folder of the cached results.
+            max_bytes (int): Largest size of the folder.
+        """
+        self.store = store
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # checks of the run read from the cache and executed
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+
+    def _entry_path(self, key: str) -> str:
+        """Helper function to return the file of a cache key."""
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def load(self, key: str) -> Optional[List[str]]:
+        """This function records the cached findings of a cache key in the store.
+
+        Args:
+            key (str): Cache key eg: from check_fingerprint().
+
+        Returns:
+            Restored result keys, None when nothing usable is cached.
+
+        """
+        path = self._entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                result_keys = self.store.restore(arrays)
+            os.utime(path)
+        # unreadable files are written again by the next execution
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+        return result_keys
+
+    def save(self, key: str, result_keys: List[str]) -> None:
+        """This function writes findings of the store for a cache key.
+
+        Args:
+            key (str): Cache key eg: from check_fingerprint().
+            result_keys (List[str]): Result keys filled by the check.
+        """
+        path = self._entry_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                np.savez(cache_file, **self.store.export(result_keys))
+            # readers never see a partly written file
+            os.replace(temp_path, path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """This function deletes the least recently used files over the size limit."""
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".npz")
+            ]
+        except OSError:
+            return
+        stats = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in entries
+        )
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in stats:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """This function deletes every cached result."""
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                os.remove(entry.path)
+
+    def wrap(self, spec: check_registry.CheckSpec) -> Callable[[], None]:
+        """This function returns the check function reading its findings from the
+        cache when the scene content it reads did not change.
+
+        Args:
+            spec (check_registry.CheckSpec): Declaration of the check.
+
+        Returns:
+            Function executing the check or restoring its findings.
+
+        """
+
+        def cached_check() -> None:
+            snapshot = model_check_funcs.get_snapshot()
+            key = check_fingerprint(snapshot, spec)
+            if key is not None and self.load(key) is not None:
+                # the findings are complete, a scan stopped at the time budget
+                # has nothing left to check
+                model_check_funcs.scans.forget(spec.result_key)
+                self.hits.append(spec.check_id)
+                return
+            # the miss of a check stopped at its time budget is counted once
+            if not model_check_funcs.scans.resumes(spec.result_key, snapshot):
+                self.misses.append(spec.check_id)
+            before = dict(self.store.findings)
+            spec.check()
+            # findings of a check stopped at its time budget are partial
+            complete = model_check_funcs.scans.coverage(spec.result_key) == 1
+            if key is not None and complete:
+                # a check may fill several result keys eg: the plugs to unhide
+                self.save(
+                    key,
+                    [
+                        result_key
+                        for result_key, findings in self.store.findings.items()
+                        if before.get(result_key) is not findings
+                    ],
+                )
+
+        return cached_check
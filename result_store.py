@@ -0,0 +1,454 @@
+"""Modules to store the check results compactly, keyed by node uuid.
+
+Findings hold rows of a node table and numpy component indices instead of
+strings. Path strings are formatted when a result is read, from the node paths
+of the store, which are read again from the uuids after a fix renamed or moved
+nodes.
+"""
+import sys
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# pylint: disable=import-error
+import mesh_engine
+import scene_backend
+
+
+class Findings(NamedTuple):
+    """Findings of one check.
+
+    Attributes:
+        rows (np.ndarray): Node table row of every finding.
+        suffixes (List[str]): Attribute or component type of every finding eg:
+            "visibility" or "vtx", empty for the node itself. None when unused.
+        offsets (np.ndarray): Start of the component indices of every finding in
+            indices, one more than the findings. None for node findings.
+        indices (np.ndarray): Component indices of all the findings, an empty
+            range stands for the whole node.
+        details (List[str]): Explanation of every finding eg: "visibility off".
+        names (List[str]): Findings which are not nodes of the snapshot eg:
+            scene wide nodes or messages, kept as given.
+    """
+
+    rows: np.ndarray
+    suffixes: Optional[List[str]] = None
+    offsets: Optional[np.ndarray] = None
+    indices: Optional[np.ndarray] = None
+    details: Optional[List[str]] = None
+    names: Optional[List[str]] = None
+
+
+# Findings fields holding numpy arrays, the others are lists of strings
+_ARRAY_FIELDS = ("offsets", "indices")
+
+
+class ResultGroups(NamedTuple):
+    """Findings of a check grouped by node, as listed by the results browser.
+
+    Attributes:
+        names (List[str]): Name of every group, the node path for component
+            findings, the finding itself otherwise.
+        details (List[str]): Explanation of every group.
+        offsets (np.ndarray): Group g holds the findings
+            positions[offsets[g]:offsets[g + 1]].
+        positions (np.ndarray): Finding positions, group after group.
+        component_counts (np.ndarray): Number of components of every group.
+    """
+
+    names: List[str]
+    details: List[str]
+    offsets: np.ndarray
+    positions: np.ndarray
+    component_counts: np.ndarray
+
+
+def _range_counts(offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Helper function to count the names every component finding formats to,
+    consecutive indices make one range and an empty range one node name."""
+    breaks = np.zeros(len(indices), dtype=np.int64)
+    if len(indices):
+        breaks[1:] = np.diff(indices) != 1
+        breaks[offsets[:-1][offsets[:-1] < len(indices)]] = 1
+    starts = np.concatenate([[0], np.cumsum(breaks)])
+    return np.maximum(starts[offsets[1:]] - starts[offsets[:-1]], 1)
+
+
+class ResultStore:
+    """This class holds the findings of every check, the nodes are stored once in
+    a node table keyed by uuid so a finding costs a few integers.
+    """
+
+    def __init__(self, backend: Optional[scene_backend.SceneBackend] = None) -> None:
+        """This function creates an empty store.
+
+        Args:
+            backend (scene_backend.SceneBackend): Backend the paths are read
+                again from, the active backend when None.
+        """
+        self._backend = backend
+        self.findings: Dict[str, Findings] = {}
+        self._uuids: List[str] = []
+        self._paths: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # findings of every node row, rebuilt when a result changes
+        self._by_node: Optional[Dict[int, List[Tuple[str, int]]]] = None
+        self._stale = False
+
+    def clear(self) -> None:
+        """This function removes all the findings and nodes."""
+        self.findings = {}
+        self._uuids = []
+        self._paths = []
+        self._rows = {}
+        self._by_node = None
+        self._stale = False
+
+    def mark_stale(self) -> None:
+        """This function flags the stored paths as outdated, they are read again
+        from the uuids the next time a result is formatted. Called after fixes."""
+        self._stale = True
+
+    # Recording
+    def _node_rows(self, paths: Sequence[str], uuids: Sequence[str]) -> np.ndarray:
+        """Helper function to add the nodes to the node table once.
+
+        Args:
+            paths (Sequence[str]): Full paths of the nodes when recorded.
+            uuids (Sequence[str]): Uuid of every node.
+
+        Returns:
+            Node table row of every node.
+
+        """
+        rows = np.empty(len(uuids), dtype=np.int32)
+        for idx, (path, node_uuid) in enumerate(zip(paths, uuids)):
+            row = self._rows.get(node_uuid)
+            if row is None:
+                row = self._rows[node_uuid] = len(self._uuids)
+                self._uuids.append(node_uuid)
+                self._paths.append(path)
+            rows[idx] = row
+        return rows
+
+    def _set(self, key: str, findings: Findings) -> None:
+        """Helper function to replace the findings of a check."""
+        self.findings[key] = findings
+        self._by_node = None
+
+    def set_nodes(
+        self,
+        key: str,
+        paths: Sequence[str],
+        uuids: Sequence[str],
+        details: Optional[Sequence[str]] = None,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> None:
+        """This function records nodes found by a check.
+
+        Args:
+            key (str): Result key of the check.
+            paths (Sequence[str]): Full paths of the nodes.
+            uuids (Sequence[str]): Uuid of every node.
+            details (Sequence[str]): Explanation of every node.
+            attributes (Sequence[str]): Attribute of every node, the findings
+                are the plugs eg: "|grp|geo.visibility".
+        """
+        self._set(
+            key,
+            Findings(
+                self._node_rows(paths, uuids),
+                suffixes=list(attributes) if attributes is not None else None,
+                details=list(details) if details is not None else None,
+            ),
+        )
+
+    def set_components(
+        self,
+        key: str,
+        paths: Sequence[str],
+        uuids: Sequence[str],
+        components: Sequence[str],
+        indices: Sequence[np.ndarray],
+    ) -> None:
+        """This function records components found by a check as index arrays.
+
+        Args:
+            key (str): Result key of the check.
+            paths (Sequence[str]): Full paths of the meshes, may repeat.
+            uuids (Sequence[str]): Uuid of every mesh.
+            components (Sequence[str]): Component type of every entry eg: "f".
+            indices (Sequence[np.ndarray]): Sorted component indices of every
+                entry, empty to record the whole mesh.
+        """
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(component) for component in indices])
+        flat = (
+            np.concatenate(indices).astype(np.int32)
+            if len(indices)
+            else np.empty(0, dtype=np.int32)
+        )
+        self._set(
+            key,
+            Findings(self._node_rows(paths, uuids), list(components), offsets, flat),
+        )
+
+    def set_names(self, key: str, names: Sequence[str]) -> None:
+        """This function records findings which are not nodes of the snapshot.
+
+        Args:
+            key (str): Result key of the check.
+            names (Sequence[str]): Scene wide node names or messages.
+        """
+        self._set(key, Findings(np.empty(0, dtype=np.int32), names=list(names)))
+
+    def restore(self, arrays: Mapping[str, np.ndarray]) -> List[str]:
+        """This function records findings written by export(), eg: read from disk.
+
+        Args:
+            arrays (Mapping[str, np.ndarray]): Named arrays returned by export().
+
+        Returns:
+            Result keys of the restored findings.
+
+        """
+        keys = arrays["keys"].tolist()
+        for number, key in enumerate(keys):
+            prefix = f"{number}."
+            fields = {}
+            for field in Findings._fields[1:]:
+                if prefix + field not in arrays:
+                    continue
+                value = arrays[prefix + field]
+                fields[field] = value if field in _ARRAY_FIELDS else value.tolist()
+            rows = self._node_rows(
+                arrays[prefix + "paths"].tolist(), arrays[prefix + "uuids"].tolist()
+            )
+            self._set(key, Findings(rows, **fields))
+        return keys
+
+    # Reading
+    def _refresh_paths(self) -> None:
+        """Helper function to read the paths of the stored nodes from their uuids,
+        deleted nodes keep the path they were recorded with."""
+        self._stale = False
+        if not self._uuids:
+            return
+        backend = self._backend or scene_backend.get_backend()
+        for row, path in enumerate(backend.node_paths(self._uuids)):
+            if path:
+                self._paths[row] = path
+
+    def _format(self, findings: Findings, position: int) -> List[str]:
+        """Helper function to format one finding into names."""
+        path = self._paths[findings.rows[position]]
+        suffix = findings.suffixes[position] if findings.suffixes else ""
+        if findings.offsets is None:
+            return [f"{path}.{suffix}" if suffix else path]
+        start, end = findings.offsets[position], findings.offsets[position + 1]
+        if start == end:
+            return [path]
+        return mesh_engine.component_names(path, suffix, findings.indices[start:end])
+
+    def get(self, key: str, limit: Optional[int] = None) -> List[str]:
+        """This function formats the findings of a check into names.
+
+        Args:
+            key (str): Result key of the check.
+            limit (int): Most names to format, every name when None, see count()
+                for the number of names.
+
+        Returns:
+            Node, plug or component names eg: ['|grp|geo.f[2:5]'], empty when
+            the check found nothing or did not run.
+
+        """
+        findings = self.findings.get(key)
+        if findings is None:
+            return []
+        if findings.names is not None:
+            return list(findings.names[:limit])
+        if self._stale:
+            self._refresh_paths()
+        names: List[str] = []
+        for position in range(len(findings.rows)):
+            if limit is not None and len(names) >= limit:
+                break
+            names.extend(self._format(findings, position))
+        return names[:limit]
+
+    def groups(self, key: str) -> ResultGroups:
+        """This function groups the findings of a check by node, components of a
+        mesh are listed under the mesh. Component names are not formatted.
+
+        Args:
+            key (str): Result key of the check.
+
+        Returns:
+            ResultGroups in the order the nodes were found.
+
+        """
+        findings = self.findings.get(key)
+        if findings is None:
+            findings = Findings(np.empty(0, dtype=np.int32), names=[])
+        if self._stale:
+            self._refresh_paths()
+        if findings.offsets is None:
+            names = findings.names
+            if names is None:
+                names = [
+                    self._format(findings, position)[0]
+                    for position in range(len(findings.rows))
+                ]
+            count = len(names)
+            return ResultGroups(
+                list(names),
+                list(findings.details) if findings.details else [""] * count,
+                np.arange(count + 1),
+                np.arange(count),
+                np.zeros(count, dtype=np.int64),
+            )
+        _, firsts, inverse = np.unique(
+            findings.rows, return_index=True, return_inverse=True
+        )
+        # groups are numbered in the order their first finding was recorded
+        group_of = np.argsort(np.argsort(firsts))[inverse.reshape(-1)]
+        positions = np.argsort(group_of, kind="stable")
+        offsets = np.zeros(len(firsts) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(group_of, minlength=len(firsts)))
+        component_counts = np.bincount(
+            group_of, weights=np.diff(findings.offsets), minlength=len(firsts)
+        ).astype(np.int64)
+        names = [self._paths[row] for row in findings.rows[positions[offsets[:-1]]]]
+        return ResultGroups(
+            names, [""] * len(names), offsets, positions, component_counts
+        )
+
+    def component_ranges(
+        self, key: str, positions: np.ndarray
+    ) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+        """This function returns the component ranges of findings, unformatted.
+
+        Args:
+            key (str): Result key of a component check.
+            positions (np.ndarray): Findings of one group eg: from groups().
+
+        Returns:
+            Component type, first and last indices of the ranges of every finding
+            with components.
+
+        """
+        findings = self.findings[key]
+        ranges = []
+        for position in positions:
+            start, end = findings.offsets[position], findings.offsets[position + 1]
+            if start < end:
+                firsts, lasts = mesh_engine.component_ranges(
+                    findings.indices[start:end]
+                )
+                ranges.append((findings.suffixes[position], firsts, lasts))
+        return ranges
+
+    def details(self, key: str) -> List[str]:
+        """This function returns the explanation of every finding of a check,
+        empty when the check records none."""
+        findings = self.findings.get(key)
+        if findings is None or findings.details is None:
+            return []
+        return list(findings.details)
+
+    def count(self, key: str) -> int:
+        """This function returns the number of names get() returns, without
+        formatting them."""
+        findings = self.findings.get(key)
+        if findings is None:
+            return 0
+        if findings.names is not None:
+            return len(findings.names)
+        if findings.offsets is None:
+            return len(findings.rows)
+        return int(np.sum(_range_counts(findings.offsets, findings.indices)))
+
+    def node_findings(self, node_uuid: str) -> Dict[str, List[str]]:
+        """This function returns the findings of one node in constant time.
+
+        Args:
+            node_uuid (str): Uuid of the node.
+
+        Returns:
+            Names found on the node, by result key.
+
+        """
+        row = self._rows.get(node_uuid)
+        if row is None:
+            return {}
+        if self._by_node is None:
+            self._by_node = {}
+            for key, findings in self.findings.items():
+                for position, node_row in enumerate(findings.rows.tolist()):
+                    self._by_node.setdefault(node_row, []).append((key, position))
+        if self._stale:
+            self._refresh_paths()
+        found: Dict[str, List[str]] = {}
+        for key, position in self._by_node.get(row, []):
+            found.setdefault(key, []).extend(self._format(self.findings[key], position))
+        return found
+
+    def export(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """This function writes the findings of checks into named arrays without
+        python objects, nodes by uuid and path, eg: for np.savez().
+
+        Args:
+            keys (Sequence[str]): Result keys to write.
+
+        Returns:
+            Arrays restore() records the findings from.
+
+        """
+        if self._stale:
+            self._refresh_paths()
+        arrays = {"keys": np.array(keys, dtype=str)}
+        for number, key in enumerate(keys):
+            prefix = f"{number}."
+            findings = self.findings[key]
+            rows = findings.rows.tolist()
+            arrays[prefix + "uuids"] = np.array(
+                [self._uuids[row] for row in rows], dtype=str
+            )
+            arrays[prefix + "paths"] = np.array(
+                [self._paths[row] for row in rows], dtype=str
+            )
+            for field, value in zip(Findings._fields[1:], findings[1:]):
+                if value is not None:
+                    arrays[prefix + field] = (
+                        value if field in _ARRAY_FIELDS else np.array(value, dtype=str)
+                    )
+        return arrays
+
+    def nbytes(self, key: Optional[str] = None) -> int:
+        """This function returns the memory held by the findings.
+
+        Args:
+            key (str): Result key of one check, the whole store when None.
+
+        Returns:
+            Size in bytes of the arrays, lists and strings.
+
+        """
+        if key is None:
+            table = sum(
+                sys.getsizeof(text) for text in self._uuids + self._paths
+            ) + sys.getsizeof(self._rows)
+            return table + sum(self.nbytes(name) for name in self.findings)
+        findings = self.findings.get(key)
+        if findings is None:
+            return 0
+        size = 0
+        for field in findings:
+            if isinstance(field, np.ndarray):
+                size += field.nbytes
+            elif isinstance(field, list):
+                size += sys.getsizeof(field) + sum(
+                    sys.getsizeof(text) for text in set(field)
+                )
+        return size
@@ -0,0 +1,298 @@
+"""Modules to browse the check results in a lazily filled tree view."""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    from PySide2 import QtCore, QtGui, QtWidgets  # type: ignore
+except ModuleNotFoundError:
+    from PySide6 import QtCore, QtGui, QtWidgets  # type: ignore
+
+# pylint: disable=import-error
+import constants
+import mesh_engine
+import result_store
+import scene_backend
+
+
+def _empty_groups() -> result_store.ResultGroups:
+    """Helper function to return the groups of a check which found nothing."""
+    empty = np.empty(0, dtype=np.int64)
+    return result_store.ResultGroups([], [], np.zeros(1, dtype=np.int64), empty, empty)
+
+
+class _GroupRanges(NamedTuple):
+    """Component ranges listed under a group, formatted when they are painted.
+
+    Attributes:
+        components (List[str]): Component type of every finding eg: "f".
+        starts (np.ndarray): First range row of every finding, one more than
+            the findings.
+        firsts (np.ndarray): First index of every range.
+        lasts (np.ndarray): Last index of every range.
+    """
+
+    components: List[str]
+    starts: np.ndarray
+    firsts: np.ndarray
+    lasts: np.ndarray
+
+
+class ResultsModel(QtCore.QAbstractItemModel):  # type: ignore
+    """This class lists the findings of one check grouped by node, components
+    under their mesh as ranges. Rows are added in batches while the view scrolls
+    and names are only formatted for the painted rows.
+    """
+
+    HEADERS = ("Finding", "Detail")
+
+    def __init__(
+        self, store: result_store.ResultStore, parent: Optional[QtCore.QObject] = None
+    ) -> None:
+        """This function creates an empty model.
+
+        Args:
+            store (result_store.ResultStore): Findings of the checks.
+            parent (QtCore.QObject): Owner of the model.
+        """
+        super().__init__(parent)
+        self.store = store
+        self.result_key: Optional[str] = None
+        self.filter_text = ""
+        self._groups = _empty_groups()
+        self._node_findings = False
+        # groups passing the filter, the first _fetched are shown
+        self._visible = np.empty(0, dtype=np.int64)
+        self._fetched = 0
+        # component ranges of the expanded groups and how many are shown
+        self._ranges: Dict[int, _GroupRanges] = {}
+        self._fetched_ranges: Dict[int, int] = {}
+
+    def show_result(self, result_key: Optional[str]) -> None:
+        """This function lists the findings of a check.
+
+        Args:
+            result_key (str): Result key of the check, None to empty the view.
+        """
+        self.beginResetModel()
+        self.result_key = result_key
+        findings = self.store.findings.get(result_key) if result_key else None
+        self._groups = self.store.groups(result_key) if findings else _empty_groups()
+        self._node_findings = findings is not None and findings.names is None
+        self._ranges = {}
+        self._filter_groups()
+        self.endResetModel()
+
+    def set_filter(self, text: str) -> None:
+        """This function shows the groups whose name or detail contains the text,
+        case insensitive. Matching only walks the group names, nothing is formatted.
+
+        Args:
+            text (str): Searched text, empty to show every group.
+        """
+        self.beginResetModel()
+        self.filter_text = text.lower()
+        self._filter_groups()
+        self.endResetModel()
+
+    def _filter_groups(self) -> None:
+        """Helper function to list the groups passing the filter."""
+        names, details = self._groups.names, self._groups.details
+        if self.filter_text:
+            self._visible = np.array(
+                [
+                    idx
+                    for idx, (name, detail) in enumerate(zip(names, details))
+                    if self.filter_text in name.lower()
+                    or self.filter_text in detail.lower()
+                ],
+                dtype=np.int64,
+            )
+        else:
+            self._visible = np.arange(len(names), dtype=np.int64)
+        self._fetched = min(len(self._visible), constants.RESULTS_FETCH_BATCH)
+        self._fetched_ranges = {}
+
+    def _group(self, index: QtCore.QModelIndex) -> int:
+        """Helper function to return the group of a top level index."""
+        return int(self._visible[index.row()])
+
+    def _group_ranges(self, group: int) -> _GroupRanges:
+        """Helper function to read the component ranges of a group once."""
+        if group not in self._ranges:
+            start, end = self._groups.offsets[group], self._groups.offsets[group + 1]
+            ranges = self.store.component_ranges(
+                self.result_key, self._groups.positions[start:end]
+            )
+            starts = np.zeros(len(ranges) + 1, dtype=np.int64)
+            starts[1:] = np.cumsum([len(firsts) for _, firsts, _ in ranges])
+            self._ranges[group] = _GroupRanges(
+                [component for component, _, _ in ranges],
+                starts,
+                np.concatenate([firsts for _, firsts, _ in ranges] or [[]]),
+                np.concatenate([lasts for _, _, lasts in ranges] or [[]]),
+            )
+        return self._ranges[group]
+
+    def _range_name(self, index: QtCore.QModelIndex) -> str:
+        """Helper function to format the component range of a child index."""
+        ranges = self._group_ranges(int(self._visible[index.internalId() - 1]))
+        finding = int(np.searchsorted(ranges.starts, index.row(), side="right")) - 1
+        return mesh_engine.range_name(
+            ranges.components[finding],
+            int(ranges.firsts[index.row()]),
+            int(ranges.lasts[index.row()]),
+        )
+
+    def finding_name(self, index: QtCore.QModelIndex) -> Optional[str]:
+        """This function returns the scene name of a row, the node of a group or
+        the component range of a child. None for findings which are not nodes.
+
+        Args:
+            index (QtCore.QModelIndex): Row of the view.
+
+        Returns:
+            Name to select eg: "|grp|geo" or "|grp|geo.f[3:7]".
+
+        """
+        if not index.isValid() or not self._node_findings:
+            return None
+        if index.internalId() == 0:
+            return self._groups.names[self._group(index)]
+        parent = self.parent(index)
+        return f"{self._groups.names[self._group(parent)]}.{self._range_name(index)}"
+
+    # pylint: disable=invalid-name,unused-argument
+    def index(
+        self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()
+    ) -> QtCore.QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        # children keep the row of their group, shifted so 0 marks the groups
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not index.isValid() or index.internalId() == 0:
+            return QtCore.QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if not parent.isValid():
+            return self._fetched
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._fetched_ranges.get(self._group(parent), 0)
+        return 0
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if not parent.isValid():
+            return len(self._visible) > 0
+        if parent.internalId() == 0 and parent.column() == 0:
+            return bool(self._groups.component_counts[self._group(parent)])
+        return False
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if not parent.isValid():
+            return self._fetched < len(self._visible)
+        if parent.internalId() == 0 and self.hasChildren(parent):
+            group = self._group(parent)
+            total = len(self._group_ranges(group).firsts)
+            return self._fetched_ranges.get(group, 0) < total
+        return False
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        if not parent.isValid():
+            total, fetched = len(self._visible), self._fetched
+        else:
+            group = self._group(parent)
+            total = len(self._group_ranges(group).firsts)
+            fetched = self._fetched_ranges.get(group, 0)
+        count = min(total - fetched, constants.RESULTS_FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, fetched, fetched + count - 1)
+        if not parent.isValid():
+            self._fetched += count
+        else:
+            self._fetched_ranges[group] = fetched + count
+        self.endInsertRows()
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        if index.internalId() != 0:
+            return self._range_name(index) if index.column() == 0 else ""
+        group = self._group(index)
+        if index.column() == 0:
+            return self._groups.names[group]
+        components = int(self._groups.component_counts[group])
+        return self._groups.details[group] or (
+            f"{components} components" if components else ""
+        )
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.DisplayRole,
+    ) -> Any:
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class ResultsBrowser(QtWidgets.QWidget):  # type: ignore
+    """This class shows the findings of a check in a tree view with a filter, the
+    view and its signals are created once with the UI."""
+
+    def __init__(self, store: result_store.ResultStore, font: QtGui.QFont) -> None:
+        """This function creates the filter line and the tree view.
+
+        Args:
+            store (result_store.ResultStore): Findings of the checks.
+            font (QtGui.QFont): Font of the filter and the view.
+        """
+        super().__init__()
+        self.filter_lineedit = QtWidgets.QLineEdit()
+        self.filter_lineedit.setPlaceholderText("Filter results")
+        self.filter_lineedit.setClearButtonEnabled(True)
+        self.filter_lineedit.setFont(font)
+        self.model = ResultsModel(store, self)
+        self.tree_view = QtWidgets.QTreeView()
+        self.tree_view.setFont(font)
+        self.tree_view.setModel(self.model)
+        # every row has the same height, the view does not measure each of them
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        self.vlayout = QtWidgets.QVBoxLayout()
+        self.vlayout.addWidget(self.filter_lineedit)
+        self.vlayout.addWidget(self.tree_view)
+        self.vlayout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.vlayout)
+
+        self.filter_lineedit.textChanged.connect(self.model.set_filter)
+        self.tree_view.doubleClicked.connect(self.select_findings)
+
+    def show_result(self, result_key: Optional[str]) -> None:
+        """This function lists the findings of a check.
+
+        Args:
+            result_key (str): Result key of the check, None to empty the view.
+        """
+        self.model.show_result(result_key)
+
+    def select_findings(self) -> None:
+        """This function selects the nodes and components of the selected rows in
+        the scene."""
+        names = [
+            self.model.finding_name(index)
+            for index in self.tree_view.selectionModel().selectedRows()
+        ]
+        names = [name for name in names if name]
+        if names:
+            scene_backend.get_backend().select(names)
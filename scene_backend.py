@@ -0,0 +1,728 @@
+"""Modules to read and edit the checked scene through a pluggable backend.
+
+The checks never call Maya directly, they call the active backend. MayaBackend
+talks to the running Maya session, memory_backend.MemoryBackend holds a scene
+in python so the checks also run on machines without Maya.
+"""
+import abc
+import contextlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+try:
+    import maya.api.OpenMaya as om  # type: ignore
+    from maya import cmds, mel  # type: ignore
+except ModuleNotFoundError:
+    om = cmds = mel = None
+
+# pylint: disable=import-error,wrong-import-position
+import visibility_engine
+
+# u, v and uv shell id arrays of every uv set of a mesh, by uv set name
+MeshUvs = Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+# scene edits reported by watch_changes()
+NODE_ADDED = "node_added"
+NODE_REMOVED = "node_removed"
+NODE_RENAMED = "node_renamed"
+DAG_CHANGED = "dag_changed"
+ATTRIBUTE_CHANGED = "attribute_changed"
+CONNECTION_CHANGED = "connection_changed"
+TOPOLOGY_CHANGED = "topology_changed"
+# called with the event, the node uuid and a detail of the event
+ChangeCallback = Callable[[str, str, str], None]
+
+# backend the checks read and edit, MayaBackend unless another one is set
+_active_backend: Optional["SceneBackend"] = None
+
+
+class DagNodeInfo(NamedTuple):
+    """Description of a dag node read while walking a hierarchy.
+
+    Attributes:
+        path (str): Full dag path of the node.
+        node_type (str): Node type name.
+        uuid (str): Node uuid, stays the same when the node is renamed or moved.
+        is_transform (bool): The node is a transform.
+        is_shape (bool): The node is a shape.
+        is_mesh (bool): The node is a mesh shape.
+        is_intermediate (bool): The shape is an intermediate(orig) object.
+    """
+
+    path: str
+    node_type: str
+    uuid: str
+    is_transform: bool
+    is_shape: bool
+    is_mesh: bool
+    is_intermediate: bool
+
+
+# pylint: disable=too-many-public-methods
+class SceneBackend(abc.ABC):
+    """Scene queries and edits the checks and fixes are built on.
+
+    Handles returned by selected_hierarchy() are backend specific (MDagPath for
+    Maya) and are only passed back to the same backend.
+    """
+
+    # Reads
+    @abc.abstractmethod
+    def selected_hierarchy(
+        self, roots: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Any], List[DagNodeInfo]]:
+        """This function walks every selected group depth first, roots included.
+
+        Args:
+            roots (Sequence[str]): Groups to walk instead of the selection.
+
+        Returns:
+            Handles and DagNodeInfo of the walked nodes, a parent always comes
+            before its children.
+
+        """
+
+    @abc.abstractmethod
+    def read_transforms(self, handles: Sequence[Any]) -> np.ndarray:
+        """This function reads the local transform values of transforms.
+
+        Args:
+            handles (Sequence[Any]): Transforms to read.
+
+        Returns:
+            (N, 9) array of translate, rotate(degrees) and scale.
+
+        """
+
+    @abc.abstractmethod
+    def read_pivots(
+        self, handles: Sequence[Any]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """This function reads pivots and bounding box centers in object space.
+
+        Args:
+            handles (Sequence[Any]): Transforms to read.
+
+        Returns:
+            (N, 3) arrays of rotate pivots, scale pivots and bounding box centers.
+
+        """
+
+    @abc.abstractmethod
+    def list_nodes_with_types(self) -> List[str]:
+        """This function lists every node of the scene with its type.
+
+        Returns:
+            Flat list of long names and types like cmds.ls(long=True, showType=True).
+
+        """
+
+    @abc.abstractmethod
+    def inherited_types(self, type_name: str) -> List[str]:
+        """This function lists a node type and all the types it derives from."""
+
+    @abc.abstractmethod
+    def read_history(self, handles: Sequence[Any]) -> List[List[Tuple[str, str]]]:
+        """This function lists the upstream history of shapes in one pass.
+
+        Args:
+            handles (Sequence[Any]): Shapes to read.
+
+        Returns:
+            Name and node type of every history node, for every shape.
+
+        """
+
+    @abc.abstractmethod
+    def read_visibility(self, handles: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """This function reads the visibility plugs of dag nodes in one pass.
+
+        Args:
+            handles (Sequence[Any]): Dag nodes to read.
+
+        Returns:
+            (N, 4) booleans of visibility_engine.VISIBILITY_PLUGS, and whether the
+            drawing override of every node is driven by a display layer.
+
+        """
+
+    @abc.abstractmethod
+    def get_attr(self, node_attr: str) -> Any:
+        """This function returns the value of an attribute eg: "|grp|geo.visibility"."""
+
+    @abc.abstractmethod
+    def read_mesh_topology(
+        self, handles: Sequence[Any]
+    ) -> List[Tuple[np.ndarray, np.ndarray, int]]:
+        """This function reads the polygon connectivity of mesh shapes.
+
+        Args:
+            handles (Sequence[Any]): Mesh shapes to read.
+
+        Returns:
+            Face vertex counts, face vertex indices and vertex count of every mesh.
+
+        """
+
+    @abc.abstractmethod
+    def read_mesh_points(self, handles: Sequence[Any]) -> List[np.ndarray]:
+        """This function reads the object space vertex positions of mesh shapes.
+
+        Args:
+            handles (Sequence[Any]): Mesh shapes to read.
+
+        Returns:
+            (N, 3) array of every mesh.
+
+        """
+
+    @abc.abstractmethod
+    def read_mesh_uvs(self, handles: Sequence[Any]) -> List[MeshUvs]:
+        """This function reads every uv set of mesh shapes.
+
+        Args:
+            handles (Sequence[Any]): Mesh shapes to read.
+
+        Returns:
+            MeshUvs of every mesh.
+
+        """
+
+    @abc.abstractmethod
+    def namespaces(self) -> List[str]:
+        """This function lists the namespaces of the scene, default ones included."""
+
+    @abc.abstractmethod
+    def wireframe_on_shaded(self) -> bool:
+        """This function returns whether the viewport shows wireframe on shaded."""
+
+    @abc.abstractmethod
+    def top_groups(self) -> List[str]:
+        """This function lists the world level dag nodes of the scene, the
+        startup cameras excluded, eg: the groups of an asset file."""
+
+    @abc.abstractmethod
+    def node_paths(self, uuids: Sequence[str]) -> List[str]:
+        """This function returns the current names of nodes from their uuids.
+
+        Args:
+            uuids (Sequence[str]): Uuids of the nodes.
+
+        Returns:
+            Full path of dag nodes, name of the other nodes, empty for deleted
+            nodes.
+
+        """
+
+    # Watching
+    @abc.abstractmethod
+    def watch_changes(self, handles: Sequence[Any], on_change: ChangeCallback) -> Any:
+        """This function reports the edits of the scene until unwatch_changes().
+        Attribute, name, connection and topology changes are reported for the
+        given nodes, added, removed and reparented nodes for the whole scene.
+
+        Args:
+            handles (Sequence[Any]): Nodes to watch eg: SceneSnapshot.handles.
+            on_change (ChangeCallback): Called with the event eg: NODE_ADDED,
+                the uuid of the node and the attribute name for
+                ATTRIBUTE_CHANGED, the compound attribute for its children eg:
+                "pnts" for "pntx", the uuid of the new parent for DAG_CHANGED,
+                empty otherwise.
+
+        Returns:
+            Watch to pass to unwatch_changes().
+
+        """
+
+    @abc.abstractmethod
+    def unwatch_changes(self, watch: Any) -> None:
+        """This function stops reporting the edits of a watch_changes() call."""
+
+    # Edits
+    @abc.abstractmethod
+    def open_file(self, path: str) -> None:
+        """This function opens a scene file, unsaved changes are discarded.
+
+        Args:
+            path (str): Scene file eg: "asset.ma".
+
+        Raises:
+            RuntimeError: The file could not be opened.
+        """
+
+    @abc.abstractmethod
+    def new_scene(self) -> None:
+        """This function replaces the scene with an empty one, unsaved changes
+        are discarded."""
+
+    @abc.abstractmethod
+    def undo_chunk(self, name: str) -> contextlib.AbstractContextManager:
+        """This function returns a context in which all the edits make a single
+        undo step.
+
+        Args:
+            name (str): Name of the undo step eg: "Fix All Issues".
+        """
+
+    @abc.abstractmethod
+    def select(self, nodes: Sequence[str]) -> None:
+        """This function replaces the selection."""
+
+    @abc.abstractmethod
+    def parents(self, nodes: Sequence[str]) -> List[str]:
+        """This function returns the full paths of the parents of dag nodes."""
+
+    @abc.abstractmethod
+    def delete(self, nodes: Sequence[str]) -> None:
+        """This function deletes nodes."""
+
+    @abc.abstractmethod
+    def zero_pivots(self, nodes: Sequence[str]) -> None:
+        """This function moves the pivots to the origin, keeping the geometry."""
+
+    @abc.abstractmethod
+    def center_pivots(self, nodes: Sequence[str]) -> None:
+        """This function moves the pivots to the bounding box centers."""
+
+    @abc.abstractmethod
+    def delete_history(
+        self, nodes: Sequence[str], keep_deformers: bool = False
+    ) -> None:
+        """This function deletes the construction history of nodes.
+
+        Args:
+            nodes (Sequence[str]): Shapes or transforms.
+            keep_deformers (bool): Only delete the history before and after the
+                deformers, the deformers keep working.
+        """
+
+    @abc.abstractmethod
+    def freeze_transforms(self, nodes: Sequence[str]) -> None:
+        """This function bakes the transforms into the geometry below them."""
+
+    @abc.abstractmethod
+    def set_attr(self, node_attr: str, value: Any) -> None:
+        """This function sets the value of an attribute."""
+
+    @abc.abstractmethod
+    def clear_render_setup(self) -> None:
+        """This function deletes all the render setup layers."""
+
+    @abc.abstractmethod
+    def set_wireframe_on_shaded(self, state: bool) -> None:
+        """This function toggles wireframe on shaded in the viewport."""
+
+    @abc.abstractmethod
+    def reset_display_smoothness(self) -> None:
+        """This function sets the smooth preview of all geometry off."""
+
+    @abc.abstractmethod
+    def remove_namespace(self, namespace: str) -> None:
+        """This function removes a namespace, its nodes are moved to the root."""
+
+    @abc.abstractmethod
+    def assign_shading_group(self, nodes: Sequence[str], shading_group: str) -> None:
+        """This function assigns a shading group to shapes."""
+
+    @abc.abstractmethod
+    def delete_unused_shading_nodes(self) -> None:
+        """This function deletes the shading nodes which are not assigned."""
+
+
+# pylint: disable=too-many-public-methods
+class MayaBackend(SceneBackend):
+    """Backend of the running Maya session, reads go through OpenMaya where a
+    batch read is possible and edits through maya.cmds."""
+
+    # viewport whose shading is checked
+    MODEL_PANEL = "modelPanel4"
+
+    def __init__(self) -> None:
+        if cmds is None:
+            raise RuntimeError(
+                "Maya is not available, set another backend with set_backend()"
+            )
+        # inherited node types, the type tree only grows when plugins load
+        self._inherited_types: Dict[str, List[str]] = {}
+
+    def selected_hierarchy(
+        self, roots: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Any], List[DagNodeInfo]]:
+        dag_paths = []
+        infos = []
+        if roots is None:
+            selection = om.MGlobal.getActiveSelectionList()
+        else:
+            selection = om.MSelectionList()
+            for root in roots:
+                selection.add(root)
+        dag_iterator = om.MItDag()
+        for idx in range(selection.length()):
+            try:
+                root = selection.getDagPath(idx)
+            except TypeError:
+                # dependency nodes in the selection have no hierarchy
+                continue
+            dag_iterator.reset(root, om.MItDag.kDepthFirst)
+            while not dag_iterator.isDone():
+                dag_path = dag_iterator.getPath()
+                fn_dag = om.MFnDagNode(dag_path)
+                dag_paths.append(dag_path)
+                infos.append(
+                    DagNodeInfo(
+                        dag_path.fullPathName(),
+                        fn_dag.typeName,
+                        fn_dag.uuid().asString(),
+                        dag_path.hasFn(om.MFn.kTransform),
+                        dag_path.hasFn(om.MFn.kShape),
+                        dag_path.hasFn(om.MFn.kMesh),
+                        fn_dag.isIntermediateObject,
+                    )
+                )
+                dag_iterator.next()
+        return dag_paths, infos
+
+    def read_transforms(self, handles: Sequence[Any]) -> np.ndarray:
+        values = np.empty((len(handles), 9), dtype=np.float64)
+        for row, dag_path in enumerate(handles):
+            fn_transform = om.MFnTransform(dag_path)
+            values[row, 0:3] = fn_transform.translation(om.MSpace.kTransform)
+            rotation = fn_transform.rotation()
+            values[row, 3:6] = (rotation.x, rotation.y, rotation.z)
+            values[row, 6:9] = fn_transform.scale()
+        values[:, 3:6] = np.degrees(values[:, 3:6])
+        return values
+
+    def read_pivots(
+        self, handles: Sequence[Any]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rotate_pivots = np.empty((len(handles), 3), dtype=np.float64)
+        scale_pivots = np.empty((len(handles), 3), dtype=np.float64)
+        centers = np.empty((len(handles), 3), dtype=np.float64)
+        for row, dag_path in enumerate(handles):
+            fn_transform = om.MFnTransform(dag_path)
+            rotate_pivot = fn_transform.rotatePivot(om.MSpace.kObject)
+            scale_pivot = fn_transform.scalePivot(om.MSpace.kObject)
+            center = fn_transform.boundingBox.center
+            rotate_pivots[row] = (rotate_pivot.x, rotate_pivot.y, rotate_pivot.z)
+            scale_pivots[row] = (scale_pivot.x, scale_pivot.y, scale_pivot.z)
+            centers[row] = (center.x, center.y, center.z)
+        return rotate_pivots, scale_pivots, centers
+
+    def list_nodes_with_types(self) -> List[str]:
+        return cmds.ls(long=True, showType=True) or []
+
+    def inherited_types(self, type_name: str) -> List[str]:
+        if type_name not in self._inherited_types:
+            self._inherited_types[type_name] = cmds.nodeType(
+                type_name, isTypeName=True, inherited=True
+            ) or [type_name]
+        return self._inherited_types[type_name]
+
+    def read_history(self, handles: Sequence[Any]) -> List[List[Tuple[str, str]]]:
+        histories = []
+        for dag_path in handles:
+            shape = dag_path.node()
+            dg_iterator = om.MItDependencyGraph(
+                shape,
+                om.MFn.kInvalid,
+                om.MItDependencyGraph.kUpstream,
+                om.MItDependencyGraph.kDepthFirst,
+                om.MItDependencyGraph.kNodeLevel,
+            )
+            history = []
+            while not dg_iterator.isDone():
+                node = dg_iterator.currentNode()
+                if node != shape:
+                    fn_node = om.MFnDependencyNode(node)
+                    history.append((fn_node.name(), fn_node.typeName))
+                dg_iterator.next()
+            histories.append(history)
+        return histories
+
+    def read_visibility(self, handles: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        plug_names = visibility_engine.VISIBILITY_PLUGS
+        plugs = np.ones((len(handles), len(plug_names)), dtype=bool)
+        layer_driven = np.zeros(len(handles), dtype=bool)
+        for row, dag_path in enumerate(handles):
+            fn_dag = om.MFnDagNode(dag_path)
+            for column, plug_name in enumerate(plug_names):
+                plugs[row, column] = fn_dag.findPlug(plug_name, False).asBool()
+            # display layers drive the drawing override through a connection
+            layer_driven[row] = fn_dag.findPlug("drawOverride", False).isDestination
+        return plugs, layer_driven
+
+    def get_attr(self, node_attr: str) -> Any:
+        return cmds.getAttr(node_attr)
+
+    def read_mesh_topology(
+        self, handles: Sequence[Any]
+    ) -> List[Tuple[np.ndarray, np.ndarray, int]]:
+        topologies = []
+        for dag_path in handles:
+            fn_mesh = om.MFnMesh(dag_path)
+            face_counts, face_indices = fn_mesh.getVertices()
+            topologies.append(
+                (
+                    np.array(face_counts, dtype=np.int32),
+                    np.array(face_indices, dtype=np.int32),
+                    fn_mesh.numVertices,
+                )
+            )
+        return topologies
+
+    def read_mesh_points(self, handles: Sequence[Any]) -> List[np.ndarray]:
+        points = []
+        for dag_path in handles:
+            mesh_points = om.MFnMesh(dag_path).getPoints(om.MSpace.kObject)
+            # MPoint rows are x, y, z, w
+            points.append(np.array(mesh_points, dtype=np.float64).reshape(-1, 4)[:, :3])
+        return points
+
+    def read_mesh_uvs(self, handles: Sequence[Any]) -> List[MeshUvs]:
+        meshes_uvs = []
+        for dag_path in handles:
+            fn_mesh = om.MFnMesh(dag_path)
+            uv_sets = {}
+            for uv_set in fn_mesh.getUVSetNames():
+                u_values, v_values = fn_mesh.getUVs(uv_set)
+                shell_ids = fn_mesh.getUvShellsIds(uv_set)[1]
+                uv_sets[uv_set] = (
+                    np.array(u_values, dtype=np.float64),
+                    np.array(v_values, dtype=np.float64),
+                    np.array(shell_ids, dtype=np.int32),
+                )
+            meshes_uvs.append(uv_sets)
+        return meshes_uvs
+
+    def namespaces(self) -> List[str]:
+        return cmds.namespaceInfo(listOnlyNamespaces=True) or []
+
+    def wireframe_on_shaded(self) -> bool:
+        return cmds.modelEditor(self.MODEL_PANEL, query=True, wireframeOnShaded=True)
+
+    def top_groups(self) -> List[str]:
+        startup_cameras = set()
+        for camera in cmds.ls(type="camera", long=True):
+            if cmds.camera(camera, query=True, startupCamera=True):
+                startup_cameras.update(
+                    cmds.listRelatives(camera, parent=True, fullPath=True) or []
+                )
+        return [
+            node
+            for node in cmds.ls(assemblies=True, long=True)
+            if node not in startup_cameras
+        ]
+
+    def node_paths(self, uuids: Sequence[str]) -> List[str]:
+        paths = []
+        for node_uuid in uuids:
+            selection = om.MSelectionList()
+            try:
+                selection.add(om.MUuid(node_uuid))
+            except RuntimeError:
+                paths.append("")
+                continue
+            node = selection.getDependNode(0)
+            if node.hasFn(om.MFn.kDagNode):
+                paths.append(om.MDagPath.getAPathTo(node).fullPathName())
+            else:
+                paths.append(om.MFnDependencyNode(node).name())
+        return paths
+
+    def watch_changes(self, handles: Sequence[Any], on_change: ChangeCallback) -> Any:
+        def uuid_of(node: Any) -> str:
+            # the world has no uuid
+            try:
+                return om.MFnDependencyNode(node).uuid().asString()
+            except RuntimeError:
+                return ""
+
+        def attribute_changed(
+            message: int, plug: Any, _other_plug: Any, _client_data: Any
+        ) -> None:
+            if message & (
+                om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken
+            ):
+                on_change(CONNECTION_CHANGED, uuid_of(plug.node()), "")
+            elif message & om.MNodeMessage.kAttributeSet:
+                # children of compounds are reported as their parent, eg: the
+                # pntx of a vertex tweak as pnts
+                while plug.isChild:
+                    plug = plug.parent()
+                attribute = om.MFnAttribute(plug.attribute()).name
+                on_change(ATTRIBUTE_CHANGED, uuid_of(plug.node()), attribute)
+
+        callback_ids = [
+            om.MDGMessage.addNodeAddedCallback(
+                lambda node, _: on_change(NODE_ADDED, uuid_of(node), ""), "dependNode"
+            ),
+            om.MDGMessage.addNodeRemovedCallback(
+                lambda node, _: on_change(NODE_REMOVED, uuid_of(node), ""),
+                "dependNode",
+            ),
+            om.MDagMessage.addAllDagChangesCallback(
+                lambda _message, child, parent, _: on_change(
+                    DAG_CHANGED, uuid_of(child.node()), uuid_of(parent.node())
+                )
+            ),
+        ]
+        for dag_path in handles:
+            node = dag_path.node()
+            callback_ids.append(
+                om.MNodeMessage.addAttributeChangedCallback(node, attribute_changed)
+            )
+            callback_ids.append(
+                om.MNodeMessage.addNameChangedCallback(
+                    node,
+                    lambda node, _name, _: on_change(NODE_RENAMED, uuid_of(node), ""),
+                )
+            )
+            if dag_path.hasFn(om.MFn.kMesh):
+                callback_ids.append(
+                    om.MPolyMessage.addPolyTopologyChangedCallback(
+                        node,
+                        lambda node, _: on_change(TOPOLOGY_CHANGED, uuid_of(node), ""),
+                    )
+                )
+        return callback_ids
+
+    def unwatch_changes(self, watch: Any) -> None:
+        om.MMessage.removeCallbacks(watch)
+
+    def open_file(self, path: str) -> None:
+        cmds.file(path, open=True, force=True, prompt=False)
+
+    def new_scene(self) -> None:
+        cmds.file(new=True, force=True)
+
+    @contextlib.contextmanager
+    def undo_chunk(self, name: str) -> Iterator[None]:
+        cmds.undoInfo(openChunk=True, chunkName=name)
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def select(self, nodes: Sequence[str]) -> None:
+        cmds.select(nodes)
+
+    def parents(self, nodes: Sequence[str]) -> List[str]:
+        return cmds.listRelatives(nodes, fullPath=True, parent=True) or []
+
+    # the edits take all the nodes in one command, commands given no node would
+    # edit the selection instead so empty lists are skipped
+    def delete(self, nodes: Sequence[str]) -> None:
+        if nodes:
+            cmds.delete(nodes)
+
+    def zero_pivots(self, nodes: Sequence[str]) -> None:
+        if nodes:
+            cmds.xform(nodes, zeroTransformPivots=True, preserve=True)
+
+    def center_pivots(self, nodes: Sequence[str]) -> None:
+        if nodes:
+            cmds.xform(nodes, centerPivots=True, preserve=True)
+
+    def delete_history(
+        self, nodes: Sequence[str], keep_deformers: bool = False
+    ) -> None:
+        if not nodes:
+            return
+        if keep_deformers:
+            cmds.bakePartialHistory(nodes, prePostDeformers=True)
+        else:
+            cmds.delete(nodes, constructionHistory=True)
+
+    def freeze_transforms(self, nodes: Sequence[str]) -> None:
+        if nodes:
+            cmds.makeIdentity(nodes, apply=True)
+
+    def set_attr(self, node_attr: str, value: Any) -> None:
+        cmds.setAttr(node_attr, value)
+
+    def clear_render_setup(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        import maya.app.renderSetup.model.renderSetup  # type: ignore
+
+        maya.app.renderSetup.model.renderSetup.instance().clearAll()
+
+    def set_wireframe_on_shaded(self, state: bool) -> None:
+        cmds.modelEditor(self.MODEL_PANEL, edit=True, wireframeOnShaded=state)
+
+    def reset_display_smoothness(self) -> None:
+        cmds.displaySmoothness(
+            divisionsU=0, divisionsV=0, pointsWire=4, pointsShaded=1, polygonObject=1
+        )
+
+    def remove_namespace(self, namespace: str) -> None:
+        try:
+            cmds.namespace(removeNamespace=namespace, mergeNamespaceWithRoot=True)
+        except RuntimeError:
+            cmds.namespace(removeNamespace=namespace)
+
+    def assign_shading_group(self, nodes: Sequence[str], shading_group: str) -> None:
+        if nodes:
+            cmds.sets(nodes, forceElement=shading_group, edit=True)
+
+    def delete_unused_shading_nodes(self) -> None:
+        mel.eval('hyperShadePanelMenuCommand("hyperShadePanel1", "deleteUnusedNodes")')
+
+
+def get_backend() -> SceneBackend:
+    """This function returns the backend the checks read and edit, the Maya
+    session unless set_backend() was called.
+
+    Returns:
+        The active SceneBackend.
+
+    """
+    # pylint: disable=global-statement
+    global _active_backend
+    if _active_backend is None:
+        _active_backend = MayaBackend()
+    return _active_backend
+
+
+def set_backend(backend: Optional[SceneBackend]) -> None:
+    """This function sets the backend the checks read and edit.
+
+    Args:
+        backend (SceneBackend): Backend to use, None goes back to the Maya session.
+    """
+    # pylint: disable=global-statement
+    global _active_backend
+    _active_backend = backend
+
+
+@contextlib.contextmanager
+def use_backend(backend: SceneBackend) -> Iterator[SceneBackend]:
+    """This function sets the backend the checks read inside the with block,
+    the previous backend is set back after.
+
+    Args:
+        backend (SceneBackend): Backend to use.
+
+    Yields:
+        The backend.
+
+    """
+    # pylint: disable=global-statement
+    global _active_backend
+    previous = _active_backend
+    _active_backend = backend
+    try:
+        yield backend
+    finally:
+        _active_backend = previous
@@ -0,0 +1,372 @@
+"""Modules to read the selected hierarchy once per check run."""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# pylint: disable=import-error
+import check_profiler
+import history_engine
+import mesh_engine
+import node_type_index
+import scene_backend
+import transform_engine
+import utilities
+import visibility_engine
+
+
+def _csr(
+    owners: np.ndarray, members: np.ndarray, size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Helper function to group member indices by owner index in compressed rows.
+
+    Args:
+        owners (np.ndarray): Owner index of every member.
+        members (np.ndarray): Member indices.
+        size (int): Number of owners.
+
+    Returns:
+        offsets and indices arrays, members of owner i are
+        indices[offsets[i]:offsets[i + 1]].
+
+    """
+    order = np.argsort(owners, kind="stable")
+    offsets = np.zeros(size + 1, dtype=np.int32)
+    np.cumsum(np.bincount(owners, minlength=size), out=offsets[1:])
+    return offsets, members[order].astype(np.int32)
+
+
+# pylint: disable=too-many-instance-attributes
+class SceneSnapshot:
+    """This class holds the dag nodes under the selected groups in array form.
+
+    Nodes are stored depth first, roots included, so a parent always comes
+    before its children. Data read later by the checks (transform values,
+    pivots ...) is cached on the snapshot so every check of a run shares it.
+    """
+
+    def __init__(
+        self,
+        handles: List[Any],
+        infos: List[scene_backend.DagNodeInfo],
+        backend: Optional[scene_backend.SceneBackend] = None,
+    ) -> None:
+        """This function builds the arrays from the walked nodes.
+
+        Args:
+            handles (List[Any]): Backend handles of the nodes, depth first, roots
+                included.
+            infos (List[scene_backend.DagNodeInfo]): Description of every node.
+            backend (scene_backend.SceneBackend): Backend the nodes were read
+                from, the active backend when None.
+        """
+        check_profiler.count_nodes(len(handles))
+        self.backend = backend or scene_backend.get_backend()
+        self.handles = handles
+        self.paths: List[str] = []
+        self.uuids: List[str] = []
+        self.type_names: List[str] = []
+        count = len(handles)
+        self.parents = np.full(count, -1, dtype=np.int32)
+        self.type_ids = np.empty(count, dtype=np.int16)
+        self.is_transform = np.zeros(count, dtype=bool)
+        self.is_shape = np.zeros(count, dtype=bool)
+        self.is_mesh = np.zeros(count, dtype=bool)
+        self.is_intermediate = np.zeros(count, dtype=bool)
+        self._cache: Dict[str, Any] = {}
+        # node index of every full path
+        self.path_indices: Dict[str, int] = {}
+
+        type_indices: Dict[str, int] = {}
+        for idx, info in enumerate(infos):
+            path = info.path
+            if info.node_type not in type_indices:
+                type_indices[info.node_type] = len(self.type_names)
+                self.type_names.append(info.node_type)
+            self.type_ids[idx] = type_indices[info.node_type]
+            self.parents[idx] = self.path_indices.get(path.rsplit("|", 1)[0], -1)
+            self.is_transform[idx] = info.is_transform
+            self.is_shape[idx] = info.is_shape
+            self.is_mesh[idx] = info.is_mesh
+            self.is_intermediate[idx] = info.is_intermediate
+            self.uuids.append(info.uuid)
+            self.paths.append(path)
+            self.path_indices[path] = idx
+
+        has_parent = np.flatnonzero(self.parents >= 0)
+        self.child_offsets, self.child_indices = _csr(
+            self.parents[has_parent], has_parent, count
+        )
+        has_shape_parent = has_parent[self.is_shape[has_parent]]
+        self.shape_offsets, self.shape_indices = _csr(
+            self.parents[has_shape_parent], has_shape_parent, count
+        )
+
+    @classmethod
+    def from_selection(
+        cls,
+        backend: Optional[scene_backend.SceneBackend] = None,
+        root_uuids: Optional[List[str]] = None,
+    ) -> "SceneSnapshot":
+        """This function walks the hierarchy of every selected group once.
+
+        Args:
+            backend (scene_backend.SceneBackend): Scene to read, the active
+                backend when None.
+            root_uuids (List[str]): Uuids of the groups to walk instead of the
+                selection, eg: the roots of an earlier snapshot. Deleted groups
+                are skipped.
+
+        Returns:
+            SceneSnapshot of the selected groups and all their descendents.
+
+        """
+        backend = backend or scene_backend.get_backend()
+        roots = None
+        if root_uuids is not None:
+            roots = [path for path in backend.node_paths(root_uuids) if path]
+        handles, infos = backend.selected_hierarchy(roots)
+        return cls(handles, infos, backend)
+
+    def root_uuids(self) -> List[str]:
+        """This function returns the uuids of the selected groups."""
+        return [self.uuids[idx] for idx in self.root_indices()]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def node_type(self, idx: int) -> str:
+        """This function returns the node type name of a node."""
+        return self.type_names[self.type_ids[idx]]
+
+    def root_indices(self) -> np.ndarray:
+        """This function returns the indices of the selected groups."""
+        return np.flatnonzero(self.parents < 0)
+
+    def hierarchy_transforms(self) -> np.ndarray:
+        """This function returns the indices of all descendent transforms of the
+        selected groups, like hierarchy_selection()."""
+        return np.flatnonzero(self.is_transform & (self.parents >= 0))
+
+    def children(self, idx: int) -> np.ndarray:
+        """This function returns the indices of the children of a node."""
+        start, end = self.child_offsets[idx], self.child_offsets[idx + 1]
+        return self.child_indices[start:end]
+
+    def shapes(self, idx: int, no_intermediate: bool = False) -> np.ndarray:
+        """This function returns the indices of the shapes of a transform.
+
+        Args:
+            idx (int): Index of the transform.
+            no_intermediate (bool): Skip intermediate(orig) shapes.
+
+        Returns:
+            Indices of the shape nodes.
+
+        """
+        start, end = self.shape_offsets[idx], self.shape_offsets[idx + 1]
+        shapes = self.shape_indices[start:end]
+        if no_intermediate:
+            shapes = shapes[~self.is_intermediate[shapes]]
+        return shapes
+
+    def shape_counts(self, no_intermediate: bool = False) -> np.ndarray:
+        """This function returns the number of shapes under every node."""
+        shapes = self.shape_indices
+        if no_intermediate:
+            shapes = shapes[~self.is_intermediate[shapes]]
+        return np.bincount(self.parents[shapes], minlength=len(self))
+
+    def mesh_transforms(self) -> np.ndarray:
+        """This function returns the descendent transforms with a mesh shape."""
+        meshes = self.shape_indices[self.is_mesh[self.shape_indices]]
+        return np.intersect1d(self.parents[meshes], self.hierarchy_transforms())
+
+    def hierarchy_shapes(self) -> np.ndarray:
+        """This function returns the shapes of the descendent transforms,
+        intermediate(orig) shapes excluded."""
+        shapes = self.shape_indices[~self.is_intermediate[self.shape_indices]]
+        return shapes[np.isin(self.parents[shapes], self.hierarchy_transforms())]
+
+    def mesh_shapes(self) -> np.ndarray:
+        """This function returns the mesh shapes of the descendent transforms,
+        intermediate(orig) shapes excluded."""
+        shapes = self.hierarchy_shapes()
+        return shapes[self.is_mesh[shapes]]
+
+    def select_paths(self, indices: np.ndarray) -> List[str]:
+        """This function returns the full paths of the given node indices."""
+        return [self.paths[idx] for idx in indices]
+
+    def uuids_of(self, paths: List[str]) -> List[str]:
+        """This function returns the uuids of nodes of the snapshot from their paths."""
+        return [self.uuids[self.path_indices[path]] for path in paths]
+
+    def cached(self, key: str, factory: Callable[[], Any]) -> Any:
+        """This function returns data shared by the checks of a run.
+
+        Args:
+            key (str): Name of the data, eg: "hierarchy_transform_values".
+            factory (Callable): Reads the data when it is not cached yet.
+
+        Returns:
+            The cached data.
+
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def transform_values(self) -> transform_engine.TransformBatch:
+        """This function returns the transform values of the descendent transforms."""
+        return self.cached("hierarchy_transform_values", self._read_transforms)
+
+    def _read_transforms(self) -> transform_engine.TransformBatch:
+        """Helper function to read the descendent transforms from the backend."""
+        indices = self.hierarchy_transforms()
+        check_profiler.count_nodes(len(indices))
+        values = self.backend.read_transforms([self.handles[idx] for idx in indices])
+        return transform_engine.TransformBatch(self.select_paths(indices), values)
+
+    def pivots(self, roots: bool = False) -> transform_engine.PivotBatch:
+        """This function returns the pivots of the descendent transforms.
+
+        Args:
+            roots (bool): Read the selected groups instead of their descendents.
+
+        Returns:
+            PivotBatch of the requested transforms.
+
+        """
+        indices = self.root_indices() if roots else self.hierarchy_transforms()
+        return self.cached(
+            "root_pivots" if roots else "hierarchy_pivots",
+            lambda: self._read_pivots(indices),
+        )
+
+    def _read_pivots(self, indices: np.ndarray) -> transform_engine.PivotBatch:
+        """Helper function to read pivots and bounding box centers from the backend."""
+        check_profiler.count_nodes(len(indices))
+        rotate_pivots, scale_pivots, centers = self.backend.read_pivots(
+            [self.handles[idx] for idx in indices]
+        )
+        return transform_engine.PivotBatch(
+            self.select_paths(indices), rotate_pivots, scale_pivots, centers
+        )
+
+    def mesh_topology(self) -> mesh_engine.MeshBatch:
+        """This function returns the topology of the descendent meshes."""
+        return self.cached("mesh_topology", self._read_mesh_topology)
+
+    def _read_mesh_topology(self) -> mesh_engine.MeshBatch:
+        """Helper function to read the mesh topologies from the backend."""
+        shapes = self.mesh_shapes()
+        check_profiler.count_nodes(len(shapes))
+        topologies = self.backend.read_mesh_topology(
+            [self.handles[idx] for idx in shapes]
+        )
+        return mesh_engine.MeshBatch(
+            self.mesh_paths(),
+            [mesh_engine.MeshTopology(*topology) for topology in topologies],
+        )
+
+    def mesh_paths(self) -> List[str]:
+        """This function returns the names the components of the descendent meshes
+        are addressed with, the transform or the shape when the transform has
+        several meshes."""
+        shapes = self.mesh_shapes()
+        transforms = self.parents[shapes]
+        meshes = np.bincount(transforms, minlength=len(self))
+        return self.select_paths(np.where(meshes[transforms] > 1, shapes, transforms))
+
+    def mesh_fingerprints(self) -> List[str]:
+        """This function returns a fingerprint of the topology of every descendent
+        mesh, in mesh_topology() order. Duplicated and instanced meshes share it."""
+        return self.cached(
+            "mesh_fingerprints",
+            lambda: [
+                utilities.digest(topology)
+                for topology in self.mesh_topology().topologies
+            ],
+        )
+
+    def mesh_point_fingerprints(self) -> List[str]:
+        """This function returns a fingerprint of the vertex positions of every
+        descendent mesh, in mesh_topology() order."""
+        return self.cached(
+            "mesh_point_fingerprints",
+            lambda: [utilities.digest([points]) for points in self.mesh_points()],
+        )
+
+    def mesh_uv_fingerprints(self) -> List[str]:
+        """This function returns a fingerprint of the uv sets of every descendent
+        mesh, in mesh_paths() order."""
+
+        def hash_uvs() -> List[str]:
+            fingerprints = []
+            for uv_sets in self.mesh_uvs():
+                parts: List[Any] = []
+                for uv_set in sorted(uv_sets):
+                    parts.append(uv_set)
+                    parts.extend(uv_sets[uv_set])
+                fingerprints.append(utilities.digest(parts))
+            return fingerprints
+
+        return self.cached("mesh_uv_fingerprints", hash_uvs)
+
+    def mesh_uvs(self) -> List[scene_backend.MeshUvs]:
+        """This function returns the uv sets of the descendent meshes, in
+        mesh_paths() order."""
+        return self.cached("mesh_uvs", self._read_mesh_uvs)
+
+    def _read_mesh_uvs(self) -> List[scene_backend.MeshUvs]:
+        """Helper function to read the uvs of the meshes from the backend."""
+        shapes = self.mesh_shapes()
+        check_profiler.count_nodes(len(shapes))
+        return self.backend.read_mesh_uvs([self.handles[idx] for idx in shapes])
+
+    def mesh_points(self) -> List[np.ndarray]:
+        """This function returns the vertex positions of the descendent meshes, in
+        mesh_topology() order."""
+        return self.cached("mesh_points", self._read_mesh_points)
+
+    def _read_mesh_points(self) -> List[np.ndarray]:
+        """Helper function to read the mesh vertex positions from the backend."""
+        shapes = self.mesh_shapes()
+        check_profiler.count_nodes(len(shapes))
+        return self.backend.read_mesh_points([self.handles[idx] for idx in shapes])
+
+    def history(self) -> history_engine.HistoryBatch:
+        """This function returns the upstream history of the descendent shapes."""
+        return self.cached("history", self._read_history)
+
+    def _read_history(self) -> history_engine.HistoryBatch:
+        """Helper function to read the history of the shapes from the backend."""
+        shapes = self.hierarchy_shapes()
+        check_profiler.count_nodes(len(shapes))
+        histories = self.backend.read_history([self.handles[idx] for idx in shapes])
+        return history_engine.HistoryBatch(
+            self.select_paths(shapes),
+            np.array([len(history) for history in histories], dtype=np.int32),
+            [name for history in histories for name, _ in history],
+            [type_name for history in histories for _, type_name in history],
+        )
+
+    def visibility(self) -> visibility_engine.VisibilityState:
+        """This function returns why every node is hidden, by itself or by one of
+        its ancestors, roots included."""
+        return self.cached("visibility", self._read_visibility)
+
+    def _read_visibility(self) -> visibility_engine.VisibilityState:
+        """Helper function to read the visibility plugs of all the nodes from the
+        backend and propagate them down the hierarchy."""
+        check_profiler.count_nodes(len(self))
+        plugs, layer_driven = self.backend.read_visibility(self.handles)
+        causes = visibility_engine.own_causes(plugs, layer_driven, self.is_intermediate)
+        sources = visibility_engine.hiding_sources(self.parents, causes)
+        return visibility_engine.VisibilityState(causes, sources)
+
+    def type_index(self) -> node_type_index.NodeTypeIndex:
+        """This function returns the type index of the whole scene, read in one pass."""
+        return self.cached(
+            "type_index", lambda: node_type_index.NodeTypeIndex.from_scene(self.backend)
+        )
@@ -0,0 +1,75 @@
+"""Modules to analyse transforms read in batches by the scene backend."""
+from typing import List, NamedTuple
+
+import numpy as np
+
+# translate, rotate and scale of a frozen transform
+IDENTITY_TRS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+
+
+class TransformBatch(NamedTuple):
+    """Transform values of many nodes read in one pass.
+
+    Attributes:
+        paths (List[str]): Full dag paths of the transforms.
+        values (np.ndarray): (N, 9) array of translate, rotate(degrees) and scale.
+    """
+
+    paths: List[str]
+    values: np.ndarray
+
+
+class PivotBatch(NamedTuple):
+    """Object space pivots and bounding box centers of many transforms.
+
+    Attributes:
+        paths (List[str]): Full dag paths of the transforms.
+        rotate_pivots (np.ndarray): (N, 3) array of rotate pivots.
+        scale_pivots (np.ndarray): (N, 3) array of scale pivots.
+        centers (np.ndarray): (N, 3) array of bounding box centers, which is
+            where xform(centerPivots=True) would put the pivots.
+    """
+
+    paths: List[str]
+    rotate_pivots: np.ndarray
+    scale_pivots: np.ndarray
+    centers: np.ndarray
+
+
+def unfrozen_transforms(batch: TransformBatch, tolerance: float) -> List[str]:
+    """This function flags every transform which differs from identity in one comparison.
+
+    Args:
+        batch (TransformBatch): Values read by SceneSnapshot.transform_values().
+        tolerance (float): Largest absolute difference still treated as frozen.
+
+    Returns:
+        Full paths of the transforms which are not frozen.
+
+    """
+    if not batch.paths:
+        return []
+    mask = np.any(np.abs(batch.values - IDENTITY_TRS) > tolerance, axis=1)
+    return [batch.paths[idx] for idx in np.flatnonzero(mask)]
+
+
+def offset_pivots(
+    batch: PivotBatch, targets: np.ndarray, tolerance: float
+) -> List[str]:
+    """This function flags every transform whose pivots are away from the targets.
+
+    Args:
+        batch (PivotBatch): Values read by SceneSnapshot.pivots().
+        targets (np.ndarray): (N, 3) or (3,) array of expected pivot positions.
+        tolerance (float): Largest absolute difference still treated as placed.
+
+    Returns:
+        Full paths of the transforms with offset rotate or scale pivots.
+
+    """
+    if not batch.paths:
+        return []
+    mask = np.any(np.abs(batch.rotate_pivots - targets) > tolerance, axis=1) | np.any(
+        np.abs(batch.scale_pivots - targets) > tolerance, axis=1
+    )
+    return [batch.paths[idx] for idx in np.flatnonzero(mask)]
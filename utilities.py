@@ -1,5 +1,8 @@
 """Modules for utilities"""
-from typing import List
+import hashlib
+from typing import Any, Iterable, List
+
+import numpy as np
 
 
 def joinmylist(value: List[str]) -> str:
@@ -13,3 +16,27 @@ def joinmylist(value: List[str]) -> str:
 
     """
     return ", ".join(value) if value else ""
+
+
+def digest(parts: Iterable[Any]) -> str:
+    """This function hashes strings, string lists and numpy arrays into a short
+    fingerprint, equal parts give equal fingerprints.
+
+    Args:
+        parts (Iterable[Any]): Values to hash, other values are hashed as text.
+
+    Returns:
+        Hex digest eg: "3f0c...".
+
+    """
+    hashed = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            hashed.update(f"{part.dtype}{part.shape}".encode())
+            hashed.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, (list, tuple)):
+            hashed.update("\0".join(map(str, part)).encode())
+        else:
+            hashed.update(str(part).encode())
+        hashed.update(b"\1")
+    return hashed.hexdigest()
@@ -0,0 +1,135 @@
+"""Modules to evaluate the effective visibility of a hierarchy read in batches."""
+from typing import List, NamedTuple
+
+import numpy as np
+
+# visibility plugs read by the scene backend, in column order
+VISIBILITY_PLUGS = (
+    "visibility",
+    "lodVisibility",
+    "overrideEnabled",
+    "overrideVisibility",
+)
+
+# causes of a node being hidden, in priority order
+VISIBLE = 0
+VISIBILITY_OFF = 1
+LOD_VISIBILITY_OFF = 2
+INTERMEDIATE_OBJECT = 3
+DISPLAY_LAYER_HIDDEN = 4
+DRAWING_OVERRIDE_HIDDEN = 5
+CAUSE_NAMES = (
+    "visible",
+    "visibility off",
+    "lodVisibility off",
+    "intermediate object",
+    "display layer hidden",
+    "drawing override hidden",
+)
+# plug which shows the node again, None for causes a fix must not touch
+CAUSE_PLUGS = (None, "visibility", "lodVisibility", None, None, "overrideVisibility")
+
+
+class VisibilityState(NamedTuple):
+    """Effective visibility of the nodes of a snapshot.
+
+    Attributes:
+        causes (np.ndarray): Own cause of every node, VISIBLE when the node does
+            not hide itself.
+        sources (np.ndarray): Node hiding every node, itself or its closest
+            hidden ancestor, -1 for visible nodes.
+    """
+
+    causes: np.ndarray
+    sources: np.ndarray
+
+
+def own_causes(
+    plugs: np.ndarray, layer_driven: np.ndarray, is_intermediate: np.ndarray
+) -> np.ndarray:
+    """This function returns why every node hides itself, without its ancestors.
+
+    Args:
+        plugs (np.ndarray): (N, 4) booleans of the VISIBILITY_PLUGS.
+        layer_driven (np.ndarray): The drawing override comes from a display layer.
+        is_intermediate (np.ndarray): The node is an intermediate(orig) shape.
+
+    Returns:
+        Cause of every node, VISIBLE for nodes not hiding themselves.
+
+    """
+    overridden = plugs[:, 2] & ~plugs[:, 3]
+    conditions = [
+        ~plugs[:, 0],
+        ~plugs[:, 1],
+        is_intermediate,
+        overridden & layer_driven,
+        overridden & ~layer_driven,
+    ]
+    causes = np.zeros(len(plugs), dtype=np.int8)
+    # the first matching cause wins, so conditions are applied in reverse
+    for cause, condition in reversed(list(enumerate(conditions, start=1))):
+        causes[condition] = cause
+    return causes
+
+
+def node_depths(parents: np.ndarray) -> np.ndarray:
+    """This function returns the depth of every node, 0 for the roots.
+
+    Args:
+        parents (np.ndarray): Parent index of every node, -1 for the roots.
+
+    Returns:
+        Depth array.
+
+    """
+    depths = np.zeros(len(parents), dtype=np.int32)
+    ancestors = parents.copy()
+    while np.any(ancestors >= 0):
+        has_ancestor = ancestors >= 0
+        depths += has_ancestor
+        ancestors[has_ancestor] = parents[ancestors[has_ancestor]]
+    return depths
+
+
+def hiding_sources(parents: np.ndarray, causes: np.ndarray) -> np.ndarray:
+    """This function propagates the visibility down the hierarchy, one vectorized
+    step per depth level.
+
+    Args:
+        parents (np.ndarray): Parent index of every node, -1 for the roots.
+        causes (np.ndarray): Own cause of every node, as returned by own_causes().
+
+    Returns:
+        Index of the node hiding every node, itself or its closest hidden
+        ancestor, -1 for visible nodes.
+
+    """
+    sources = np.where(causes != VISIBLE, np.arange(len(causes)), -1)
+    depths = node_depths(parents)
+    order = np.argsort(depths, kind="stable")
+    level_ends = np.cumsum(np.bincount(depths))
+    for start, end in zip(level_ends[:-1], level_ends[1:]):
+        nodes = order[start:end]
+        inherited = sources[parents[nodes]]
+        sources[nodes] = np.where(sources[nodes] >= 0, sources[nodes], inherited)
+    return sources
+
+
+def describe(state: VisibilityState, paths: List[str], idx: int) -> str:
+    """This function explains why a node is hidden.
+
+    Args:
+        state (VisibilityState): Visibility of the nodes.
+        paths (List[str]): Full paths of the nodes.
+        idx (int): Index of the hidden node.
+
+    Returns:
+        Cause eg: "visibility off" or "hidden by |grp (display layer hidden)".
+
+    """
+    source = state.sources[idx]
+    cause = CAUSE_NAMES[state.causes[source]]
+    if source == idx:
+        return cause
+    return f"hidden by {paths[source]} ({cause})"